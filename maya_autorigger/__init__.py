@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Auto rigger for Maya.
+"""
+
+__version__ = '0.1.0'
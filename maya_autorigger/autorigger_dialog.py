@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module contains the auto rigger dialog. It imports Qt and the rigger, so it is
+    only imported when the dialog is opened, see autorigger_gui.
+
+    Builds never freeze Maya. The template is planned on a worker thread, then a timer
+    runs one build step per tick so progress is shown and the viewport redrawn between
+    components. A build is one undo chunk from its first step to its last, so a modal
+    progress dialog keeps the user out of the scene until it is done, nothing they do
+    lands in the build's chunk. Cancelling closes the steps, which undoes everything the
+    build did.
+"""
+
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import time
+import traceback
+
+# Third party
+from PySide2 import QtCore, QtWidgets
+from maya import OpenMayaUI as omui
+from shiboken2 import wrapInstance
+
+# Internal
+from maya_autorigger.biped import Biped
+from maya_autorigger.utils.backend import cmds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def get_maya_window():
+    """
+    This gets a reference to the Maya window.
+
+    :return: A reference to the Maya window.
+    :type: QtGui.QtDialog
+    """
+    maya_main_window_ptr = omui.MQtUtil.mainWindow()
+    return wrapInstance(int(maya_main_window_ptr), QtWidgets.QWidget)
+
+
+def format_eta(seconds):
+    """
+    Gets the time left as text
+
+    :param seconds: seconds left
+    :type: float
+
+    :return: the text, such as 1m 05s left
+    :type: str
+    """
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    if minutes:
+        return f'{minutes}m {seconds:02d}s left'
+    return f'{seconds}s left'
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class PlanWorker(QtCore.QThread):
+    """
+    Plans a biped's template off the main thread
+    """
+    planned = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, biped, parent=None):
+        """
+        :param biped: Biped whose template is planned
+        :type: biped.Biped
+        """
+        QtCore.QThread.__init__(self, parent)
+        self.biped = biped
+
+    def run(self):
+        try:
+            planned = self.biped.plan_template()
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+        else:
+            self.planned.emit(planned)
+
+
+class AutoRiggerGUI(QtWidgets.QDialog):
+    """
+    Displays the GUI to automate playblasting a turntable
+    """
+    def __init__(self):
+        QtWidgets.QDialog.__init__(self, parent=get_maya_window())
+
+        self.num_arm_jnts_box = None
+        self.biped = None
+        self.status_lbl = None
+        self.progress_dlg = None
+
+        # The build in progress, its steps run one per tick of the timer
+        self._worker = None
+        # Planning threads are kept until they finish, even cancelled ones, as a QThread
+        # destroyed while it runs takes Maya down with it
+        self._threads = []
+        self._steps = None
+        self._step_title = ''
+        self._start_time = 0.0
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_step)
+
+    def init_gui(self):
+        """
+        Creates and displays the GUI to the user
+        """
+        main_vb = QtWidgets.QVBoxLayout(self)
+        components_lay = QtWidgets.QFormLayout()
+
+        # Create the arm joint number row
+        arm_jnt_num_row = QtWidgets.QHBoxLayout()
+        # Arm joint num label
+        arm_jnt_num_lbl = QtWidgets.QLabel('Number of Arm Joints: ')
+        arm_jnt_num_row.addWidget(arm_jnt_num_lbl)
+        # Arm joint num spin box
+        self.num_arm_jnts_box = QtWidgets.QSpinBox()
+        self.num_arm_jnts_box.setFixedWidth(100)
+        self.num_arm_jnts_box.setValue(3)
+        self.num_arm_jnts_box.setSingleStep(2)
+        self.num_arm_jnts_box.setMinimum(3)
+        arm_jnt_num_row.addWidget(self.num_arm_jnts_box)
+        # Add to component layout
+        components_lay.addRow(arm_jnt_num_row)
+
+        # Add components to main layout
+        main_vb.addLayout(components_lay)
+
+        # Make create locators button
+        create_loc_btn = QtWidgets.QPushButton('Create Locators')
+        create_loc_btn.clicked.connect(self.create_locators)
+        create_loc_btn.setStyleSheet('background-color:violet')
+        main_vb.addWidget(create_loc_btn)
+        # Make generate joints button
+        gen_jnts_btn = QtWidgets.QPushButton('Generate Joints')
+        gen_jnts_btn.clicked.connect(self.generate_joints)
+        gen_jnts_btn.setStyleSheet('background-color:forestgreen')
+        main_vb.addWidget(gen_jnts_btn)
+
+        # How the last build ended
+        self.status_lbl = QtWidgets.QLabel('')
+        main_vb.addWidget(self.status_lbl)
+
+        # Add title to window
+        self.setWindowTitle('Arm Auto Rigger')
+        # Show the GUI to the user
+        self.setGeometry(350, 350, 200, 150)
+        self.show()
+
+    def create_locators(self):
+        """
+        Plans the template on a worker thread, then creates the locators
+
+        :return: whether the build started
+        :type: bool
+        """
+        if self.num_arm_jnts_box.value() < 3 or self.num_arm_jnts_box.value() % 2 == 0:
+            self.warn_user(title="Error",
+                           msg="Number of arm joints must be an even number and greater "
+                               "than or equal to 3.       ")
+            return None
+        template = os.path.join(os.path.dirname(os.path.realpath(__file__)), "templates",
+                                "arm.xml")
+        self.biped = Biped(arm_jnt_num=self.num_arm_jnts_box.value(),
+                           template_file=template)
+
+        self._show_progress('Planning template...')
+        worker = PlanWorker(self.biped, parent=self)
+        worker.planned.connect(self._planned)
+        worker.failed.connect(self._plan_failed)
+        worker.finished.connect(lambda: self._thread_finished(worker))
+        self._threads.append(worker)
+        self._worker = worker
+        worker.start()
+        return True
+
+
+    def generate_joints(self):
+        """
+        Generates the joints and controls from the locators
+
+        :return: whether the build started
+        :type: bool
+        """
+        if not self.biped or not self.biped.components:
+            self.warn_user(title="Error",
+                           msg="Locators must be created before generating "
+                               "joints.       ")
+            return None
+        self._show_progress('Generating joints...')
+        self._start_steps('Generating joints', self.biped.joint_steps(rollback=True))
+        return True
+
+
+    def cancel_build(self):
+        """
+        Stops the build in progress and undoes everything it did
+        """
+        if self._worker is not None:
+            # Planning makes nothing in the scene, its result is just dropped. The thread
+            # stays in _threads until it finishes
+            self._worker.planned.disconnect(self._planned)
+            self._worker.failed.disconnect(self._plan_failed)
+            self._worker = None
+        if self._steps is not None:
+            self._timer.stop()
+            self._steps.close()
+            self._steps = None
+        self._finish('Cancelled')
+
+
+    def _thread_finished(self, worker):
+        self._threads.remove(worker)
+        worker.deleteLater()
+
+
+    def _planned(self, planned):
+        self._worker = None
+        self._start_steps('Creating locators',
+                          self.biped.locator_steps(planned=planned, rollback=True))
+
+
+    def _plan_failed(self, error):
+        self._worker = None
+        self._finish('Failed')
+        # Planning runs off the main thread, so it raises and is warned about here
+        cmds.warning(error.strip().splitlines()[-1])
+        self.warn_user(title="Error", msg=error)
+
+
+    def _start_steps(self, title, steps):
+        """
+        Runs the steps of a build from the event loop
+
+        :param title: what the build does, shown with its progress
+        :type: str
+
+        :param steps: generator from Biped.locator_steps or Biped.joint_steps
+        :type: generator
+        """
+        self._steps = steps
+        self._step_title = title
+        self._start_time = time.perf_counter()
+        self.progress_dlg.setRange(0, 1)
+        self.progress_dlg.setValue(0)
+        self.progress_dlg.setLabelText(f'{title}...')
+        self._timer.start()
+
+
+    def _run_step(self):
+        """
+        Runs the next step of the build and shows its progress
+        """
+        # The build suspends refresh while it runs, the viewport is redrawn between steps
+        cmds.refresh(suspend=True)
+        try:
+            step = next(self._steps)
+        except StopIteration:
+            self._timer.stop()
+            self._steps = None
+            self._finish('Done')
+            return
+        except Exception:
+            # The steps rolled the build back before raising
+            self._timer.stop()
+            self._steps = None
+            self._finish('Failed')
+            self.warn_user(title="Error", msg=traceback.format_exc())
+            return
+        finally:
+            cmds.refresh(suspend=False)
+
+        elapsed = time.perf_counter() - self._start_time
+        left = elapsed / step.done * (step.total - step.done)
+        self.progress_dlg.setRange(0, step.total)
+        self.progress_dlg.setValue(step.done)
+        self.progress_dlg.setLabelText(f'{self._step_title} {step.label}, '
+                                       f'{format_eta(left)}')
+
+
+    def _show_progress(self, text):
+        """
+        Shows the progress of a build in a modal dialog, whose cancel button cancels it
+
+        :param text: what the build is doing
+        :type: str
+        """
+        self.status_lbl.setText('')
+        self.progress_dlg = QtWidgets.QProgressDialog(text, 'Cancel', 0, 0, self)
+        self.progress_dlg.setWindowTitle(self.windowTitle())
+        self.progress_dlg.setWindowModality(QtCore.Qt.ApplicationModal)
+        self.progress_dlg.setMinimumDuration(0)
+        self.progress_dlg.setAutoClose(False)
+        self.progress_dlg.setAutoReset(False)
+        self.progress_dlg.canceled.connect(self.cancel_build)
+        self.progress_dlg.show()
+
+
+    def _finish(self, status):
+        if self.progress_dlg is not None:
+            # Closing the dialog cancels, the build is already over
+            self.progress_dlg.canceled.disconnect(self.cancel_build)
+            self.progress_dlg.close()
+            self.progress_dlg.deleteLater()
+            self.progress_dlg = None
+        self.status_lbl.setText(status)
+
+
+    def closeEvent(self, event):
+        # A build left open would keep its undo chunk open
+        if self._steps is not None or self._worker is not None:
+            self.cancel_build()
+        # Planning cannot be stopped midway, a cancelled plan is waited for
+        for worker in self._threads:
+            worker.wait()
+        QtWidgets.QDialog.closeEvent(self, event)
+
+
+    @classmethod
+    def warn_user(cls, title=None, msg=None):
+        """
+        This function displays a message box that locks the screen until the user
+        acknowledges it.
+
+        :param title: The title of the message box window.
+        :type: str
+
+        :param msg: The text to show in the message box window.
+        :type: str
+        """
+        if msg and title:
+            # Create a QMessageBox
+            msg_box = QtWidgets.QMessageBox()
+            # Set the title and the message of the window
+            msg_box.setWindowTitle(title)
+            msg_box.setText(msg)
+            # Show the message
+            msg_box.exec_()
\ No newline at end of file
@@ -9,140 +9,47 @@
     Kellyn Mendez
 
 :synopsis:
-    This module contains utilities for working with guis in maya.
-"""
+    This module opens the auto rigger from a shelf. Importing it is cheap, Qt, Maya's UI
+    and the rigger are only imported when the dialog is opened.
 
+    from maya_autorigger import autorigger_gui
+    autorigger_gui.show()
+"""
 
 #----------------------------------------------------------------------------------------#
 #----------------------------------------------------------------------------- IMPORTS --#
 
 # Built-in
-import os
+import importlib
 
 # Third party
-from PySide2 import QtWidgets
-from maya import OpenMayaUI as omui
-from shiboken2 import wrapInstance
-
-from maya_autorigger.biped import Biped
-
 
 # Internal
 
 #----------------------------------------------------------------------------------------#
 #--------------------------------------------------------------------------- FUNCTIONS --#
 
-def get_maya_window():
+def show():
     """
-    This gets a reference to the Maya window.
+    Opens the auto rigger dialog
 
-    :return: A reference to the Maya window.
-    :type: QtGui.QtDialog
+    :return: the dialog
+    :type: autorigger_dialog.AutoRiggerGUI
     """
-    maya_main_window_ptr = omui.MQtUtil.mainWindow()
-    return wrapInstance(int(maya_main_window_ptr), QtWidgets.QWidget)
+    dialog = _dialog_module().AutoRiggerGUI()
+    dialog.init_gui()
+    return dialog
 
-#----------------------------------------------------------------------------------------#
-#----------------------------------------------------------------------------- CLASSES --#
 
-class AutoRiggerGUI(QtWidgets.QDialog):
-    """
-    Displays the GUI to automate playblasting a turntable
-    """
-    def __init__(self):
-        QtWidgets.QDialog.__init__(self, parent=get_maya_window())
-
-        self.num_arm_jnts_box = None
-        self.biped = None
-
-    def init_gui(self):
-        """
-        Creates and displays the GUI to the user
-        """
-        main_vb = QtWidgets.QVBoxLayout(self)
-        components_lay = QtWidgets.QFormLayout()
-
-        # Create the arm joint number row
-        arm_jnt_num_row = QtWidgets.QHBoxLayout()
-        # Arm joint num label
-        arm_jnt_num_lbl = QtWidgets.QLabel('Number of Arm Joints: ')
-        arm_jnt_num_row.addWidget(arm_jnt_num_lbl)
-        # Arm joint num spin box
-        self.num_arm_jnts_box = QtWidgets.QSpinBox()
-        self.num_arm_jnts_box.setFixedWidth(100)
-        self.num_arm_jnts_box.setValue(3)
-        self.num_arm_jnts_box.setSingleStep(2)
-        self.num_arm_jnts_box.setMinimum(3)
-        arm_jnt_num_row.addWidget(self.num_arm_jnts_box)
-        # Add to component layout
-        components_lay.addRow(arm_jnt_num_row)
-
-        # Add components to main layout
-        main_vb.addLayout(components_lay)
-
-        # Make create locators button
-        create_loc_btn = QtWidgets.QPushButton('Create Locators')
-        create_loc_btn.clicked.connect(self.create_locators)
-        create_loc_btn.setStyleSheet('background-color:violet')
-        main_vb.addWidget(create_loc_btn)
-        # Make generate joints button
-        gen_jnts_btn = QtWidgets.QPushButton('Generate Joints')
-        gen_jnts_btn.clicked.connect(self.generate_joints)
-        gen_jnts_btn.setStyleSheet('background-color:forestgreen')
-        main_vb.addWidget(gen_jnts_btn)
-
-        # Add title to window
-        self.setWindowTitle('Arm Auto Rigger')
-        # Show the GUI to the user
-        self.setGeometry(350, 350, 200, 150)
-        self.show()
-
-    def create_locators(self):
-        """
-
-        :return:
-        """
-        if self.num_arm_jnts_box.value() < 3 or self.num_arm_jnts_box.value() % 2 == 0:
-            self.warn_user(title="Error",
-                           msg="Number of arm joints must be an even number and greater "
-                               "than or equal to 3.       ")
-            return None
-        self.biped = Biped(arm_jnt_num=self.num_arm_jnts_box.value(), template_file=os.path.join(os.path.dirname(os.path.realpath(__file__)), "templates\\arm.xml"))
-        self.biped.create_locators()
-        return True
-
-
-    def generate_joints(self):
-        """
-
-        :return:
-        """
-        if not self.biped:
-            self.warn_user(title="Error",
-                           msg="Locators must be created before generating "
-                               "joints.       ")
-            return None
-        self.biped.create_joints()
-        return True
-
-
-    @classmethod
-    def warn_user(cls, title=None, msg=None):
-        """
-        This function displays a message box that locks the screen until the user
-        acknowledges it.
-
-        :param title: The title of the message box window.
-        :type: str
-
-        :param msg: The text to show in the message box window.
-        :type: str
-        """
-        if msg and title:
-            # Create a QMessageBox
-            msg_box = QtWidgets.QMessageBox()
-            # Set the title and the message of the window
-            msg_box.setWindowTitle(title)
-            msg_box.setText(msg)
-            # Show the message
-            msg_box.exec_()
\ No newline at end of file
+def _dialog_module():
+    return importlib.import_module('maya_autorigger.autorigger_dialog')
+
+
+def __getattr__(name):
+    # The dialog's names load it on first access
+    if name in _DIALOG_NAMES:
+        return getattr(_dialog_module(), name)
+    raise AttributeError(f'module {__name__} has no attribute {name}')
+
+
+_DIALOG_NAMES = ('AutoRiggerGUI', 'get_maya_window')
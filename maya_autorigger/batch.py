@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module builds rigs for a folder of templates without a gui, one Maya standalone
+    session per worker process.
+
+    mayapy -m maya_autorigger.batch templates_dir -o rigs_dir -w 8
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import argparse
+from contextlib import nullcontext
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+# Third party
+
+# Internal
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def init_worker(stub=False):
+    """
+    Starts the scene session of a worker process
+
+    :param stub: build in an in memory scene instead of Maya
+    :type: bool
+    """
+    if stub:
+        from maya_autorigger.utils.backend import set_backend
+        from maya_autorigger.utils.memory_scene import MemoryScene
+        set_backend(MemoryScene())
+    else:
+        import maya.standalone
+        maya.standalone.initialize(name='python')
+
+
+def build_template(template_path, output_dir, arm_jnt_num=3, profile=False, budget=None,
+                   symmetric=False, snapshot_dir=None):
+    """
+    Builds the rig of one template in a new scene and saves it
+
+    :param template_path: path to the template
+    :type: str
+
+    :param output_dir: folder to save the rig in
+    :type: str
+
+    :param arm_jnt_num: number of joints in the arm
+    :type: int
+
+    :param profile: write a profile of the build next to the rig
+    :type: bool
+
+    :param budget: fail the build when the rig is over these evaluation limits
+    :type: dict
+
+    :param symmetric: build the left side and mirror it to the right
+    :type: bool
+
+    :param snapshot_dir: folder of rig snapshots, a rig already in it is restored
+                         instead of built
+    :type: str
+
+    :return: the template, output file, seconds spent and error if the build failed
+    :type: dict
+    """
+    from maya_autorigger.biped import Biped
+    from maya_autorigger.utils.backend import cmds
+    from maya_autorigger.utils.profiler import BuildProfiler, profile_build
+    from maya_autorigger.utils.rig_cost import EvalBudget
+    from maya_autorigger.utils.rig_snapshot import SnapshotStore
+
+    name = os.path.splitext(os.path.basename(template_path))[0]
+    result = {'template': template_path, 'output': None, 'seconds': 0.0, 'error': None}
+    profiler = BuildProfiler() if profile else None
+    start = time.perf_counter()
+    try:
+        cmds.file(new=True, force=True)
+        with profile_build(profiler) if profile else nullcontext():
+            biped = Biped(arm_jnt_num=arm_jnt_num, template_file=template_path,
+                          budget=EvalBudget(**budget) if budget else None,
+                          symmetric=symmetric,
+                          snapshots=SnapshotStore(snapshot_dir) if snapshot_dir else None)
+            biped.create_locators()
+            if not biped.components:
+                raise ValueError(f'No components found in {template_path}')
+            biped.create_joints()
+        if profile:
+            result['scene_cache'] = biped.scene_cache.stats()
+
+        output = os.path.join(output_dir, f'{name}.ma')
+        cmds.file(rename=output)
+        cmds.file(save=True, type='mayaAscii', force=True)
+        result['output'] = output
+    except Exception:
+        result['error'] = traceback.format_exc()
+    result['seconds'] = time.perf_counter() - start
+
+    if profiler:
+        profiler.write_json(os.path.join(output_dir, f'{name}.profile.json'))
+        profiler.write_folded(os.path.join(output_dir, f'{name}.folded'))
+        result['commands'] = profiler.to_dict()['total_commands']
+
+    return result
+
+
+def _build_template_args(args):
+    return build_template(*args)
+
+
+def find_templates(template_dir):
+    """
+    Gets every template in a folder, xml or compiled. A compiled template is built in
+    place of the xml of the same name, which is only read when the compile is stale.
+
+    :param template_dir: the folder
+    :type: str
+
+    :return: sorted template paths
+    :type: list
+    """
+    from maya_autorigger.utils.compiled_template import COMPILED_EXT, SOURCE_EXT
+
+    templates = {}
+    for name in os.listdir(template_dir):
+        stem, ext = os.path.splitext(name)
+        ext = ext.lower()
+        if ext == COMPILED_EXT or (ext == SOURCE_EXT and stem not in templates):
+            templates[stem] = os.path.join(template_dir, name)
+
+    return sorted(templates.values())
+
+
+def run_batch(template_dir, output_dir, workers=None, arm_jnt_num=3, stub=False,
+              profile=False, budget=None, symmetric=False, snapshot_dir=None):
+    """
+    Builds every template in a folder over a pool of worker processes
+
+    :param template_dir: folder of templates
+    :type: str
+
+    :param output_dir: folder to save the rigs and report in
+    :type: str
+
+    :param workers: number of worker processes, one per cpu if not given
+    :type: int
+
+    :param arm_jnt_num: number of joints in the arm
+    :type: int
+
+    :param stub: build in an in memory scene instead of Maya
+    :type: bool
+
+    :param profile: write a profile of every build next to its rig
+    :type: bool
+
+    :param budget: evaluation limits, builds over them fail
+    :type: dict
+
+    :param symmetric: build the left side of every template and mirror it to the right
+    :type: bool
+
+    :param snapshot_dir: folder of rig snapshots shared by the workers
+    :type: str
+
+    :return: the report, also written to batch_report.json in the output folder
+    :type: dict
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    templates = find_templates(template_dir)
+    jobs = [(path, output_dir, arm_jnt_num, profile, budget, symmetric, snapshot_dir)
+            for path in templates]
+
+    start = time.perf_counter()
+    # Spawn so every worker starts its own clean session
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(processes=workers, initializer=init_worker,
+                      initargs=(stub,)) as pool:
+        results = pool.map(_build_template_args, jobs, chunksize=1)
+
+    report = {'template_dir': template_dir,
+              'output_dir': output_dir,
+              'seconds': time.perf_counter() - start,
+              'built': sum(1 for result in results if not result['error']),
+              'failed': sum(1 for result in results if result['error']),
+              'results': results}
+    with open(os.path.join(output_dir, 'batch_report.json'), 'w') as report_fh:
+        json.dump(report, report_fh, indent=2)
+
+    return report
+
+
+def main(argv=None):
+    """
+    Command line entry point
+
+    :return: exit code, non zero when a template failed
+    :type: int
+    """
+    parser = argparse.ArgumentParser(description='Builds rigs for a folder of templates.')
+    parser.add_argument('template_dir', help='folder of xml or compiled templates')
+    parser.add_argument('-o', '--output-dir', default='rigs',
+                        help='folder to save the rigs and batch_report.json in')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes, one per cpu by default')
+    parser.add_argument('--arm-joints', type=int, default=3,
+                        help='number of joints in the arm')
+    parser.add_argument('--stub', action='store_true',
+                        help='build in an in memory scene instead of Maya')
+    parser.add_argument('--profile', action='store_true',
+                        help='write <template>.profile.json and <template>.folded per '
+                             'build')
+    parser.add_argument('--budget',
+                        help='json file of evaluation limits, nodes, connections, depth, '
+                             'cost and component_cost, builds over them fail')
+    parser.add_argument('--symmetric', action='store_true',
+                        help='build the left side of every template and mirror it to the '
+                             'right')
+    parser.add_argument('--snapshots', metavar='DIR',
+                        help='folder of rig snapshots, rigs already in it are restored '
+                             'instead of built')
+    args = parser.parse_args(argv)
+
+    budget = None
+    if args.budget:
+        with open(args.budget) as budget_fh:
+            budget = json.load(budget_fh)
+
+    report = run_batch(args.template_dir, args.output_dir, workers=args.workers,
+                       arm_jnt_num=args.arm_joints, stub=args.stub, profile=args.profile,
+                       budget=budget, symmetric=args.symmetric,
+                       snapshot_dir=args.snapshots)
+    for result in report['results']:
+        status = 'FAILED' if result['error'] else 'ok'
+        print(f'{status:>6} {result["seconds"]:8.3f}s {result["template"]}')
+    print(f'{report["built"]} built, {report["failed"]} failed in '
+          f'{report["seconds"]:.3f}s')
+
+    return 1 if report['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
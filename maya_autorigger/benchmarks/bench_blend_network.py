@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark counting the utility nodes, connections and scene commands of an fk/ik
+    blend, comparing the previous per joint network against the shared network.
+
+    python -m maya_autorigger.benchmarks.bench_blend_network
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+from maya_autorigger.utils.enums import AXIS, SUFFIX
+from maya_autorigger.utils.maya_utils import (create_arm_blend_chain, create_joint_chain,
+                                              chain_positions)
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+CMDS = RecordingCmds(MemoryScene())
+
+
+def per_joint_blend(blend_jnts, fk_ik_attr):
+    """
+    The previous blend network, kept as the baseline for this benchmark
+    """
+    hand_con = fk_ik_attr.split('.', 1)[0]
+    for blend in blend_jnts[:-1]:
+        blend_colors = CMDS.createNode('blendColors', name=blend + '_BC')
+        fk = blend.replace('blend', 'fk')
+        ik = blend.replace('blend', 'ik')
+        CMDS.connectAttr((ik + '.rotate'), (blend_colors + '.color1'), force=True)
+        CMDS.connectAttr((fk + '.rotate'), (blend_colors + '.color2'), force=True)
+        CMDS.connectAttr((blend_colors + '.output'), (blend + '.rotate'), force=True)
+        CMDS.connectAttr(fk_ik_attr, (blend_colors + '.blender'), force=True)
+        reverse = CMDS.createNode('reverse', name=hand_con + '_REV')
+        CMDS.connectAttr(fk_ik_attr, (reverse + '.inputX'), force=True)
+        CMDS.connectAttr((reverse + '.outputX'), (fk + '.visibility'), force=True)
+        CMDS.connectAttr(fk_ik_attr, (ik + '.visibility'), force=True)
+
+
+def run(num_joints, shared):
+    """
+    Blends three new chains and measures the network
+
+    :param num_joints: number of joints in each chain
+    :type: int
+
+    :param shared: use the shared network
+    :type: bool
+
+    :return: utility nodes, connections and commands issued
+    :type: tuple
+    """
+    scene = MemoryScene()
+    CMDS.backend = scene
+    positions = chain_positions((0, 0, 0), AXIS.X, num_joints, 1.0)
+    chains = {}
+    for modifier in ('fk', 'ik', 'blend'):
+        names = [f'L_arm{num:02d}_{modifier}_{SUFFIX.JOINT}'
+                 for num in range(1, num_joints + 1)]
+        chains[modifier] = create_joint_chain(names, positions)
+    switch = CMDS.createNode('transform', name=f'L_hand_{SUFFIX.CONTROL}')
+    CMDS.addAttr(switch, longName='ikFkSwitch', attributeType='float')
+    fk_ik_attr = switch + '.ikFkSwitch'
+    connections_before = len(scene.connections)
+
+    CMDS.reset()
+    if shared:
+        create_arm_blend_chain(chains['blend'], chains['fk'], chains['ik'], fk_ik_attr)
+    else:
+        per_joint_blend(chains['blend'], fk_ik_attr)
+
+    utility_nodes = len(scene.ls(type='blendColors') + scene.ls(type='reverse'))
+    return utility_nodes, len(scene.connections) - connections_before, CMDS.count()
+
+
+def main():
+    """
+    Prints nodes, connections and commands of both networks
+    """
+    set_backend(CMDS)
+    print(f'{"joints":>8} {"network":>9} {"nodes":>7} {"conns":>7} {"commands":>9}')
+    for num_joints in (3, 5, 10, 25):
+        for label, shared in (('per-joint', False), ('shared', True)):
+            nodes, conns, commands = run(num_joints, shared)
+            print(f'{num_joints:>8} {label:>9} {nodes:>7} {conns:>7} {commands:>9}')
+
+
+if __name__ == '__main__':
+    main()
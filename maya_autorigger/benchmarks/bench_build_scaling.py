@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of how full builds scale, locators, joints and controls of synthetic
+    templates built in the in memory scene. Each sweep grows one size of the template,
+    fingers per level, joints per chain, nesting depth or number of arms, from a small
+    base template and records the best time, the scene commands and the peak memory of
+    every build.
+
+    Results are written as json with -o. Given a baseline written by an earlier run,
+    sweeps are compared point by point and the run exits non zero when a build issues
+    more commands or is slower or larger than the tolerance allows. Commands are exact,
+    times and memory are compared with the tolerance as they vary between runs and
+    machines. The baseline is read before the results are written, so both can be the
+    same file.
+
+    python -m maya_autorigger.benchmarks.bench_build_scaling -o scaling.json
+    python -m maya_autorigger.benchmarks.bench_build_scaling --baseline scaling.json
+    python -m maya_autorigger.benchmarks.bench_build_scaling --baseline scaling.json \
+        -o scaling.json
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import argparse
+import json
+import math
+import platform
+import sys
+import timeit
+import tracemalloc
+
+# Third party
+
+# Internal
+from maya_autorigger import __version__
+from maya_autorigger.benchmarks.synthetic import SyntheticBuilds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+BASE_TEMPLATE = {'num_comps': 4, 'num_joints': 3, 'depth': 1, 'num_roots': 1}
+SWEEPS = {'comps': ('num_comps', (1, 4, 16, 64, 256)),
+          'joints': ('num_joints', (3, 6, 12, 24, 48)),
+          'depth': ('depth', (1, 2, 4, 8, 16)),
+          'arms': ('num_roots', (1, 4, 16, 64))}
+
+
+def measure(builds, template, repeat=5):
+    """
+    Builds a template and measures the build
+
+    :param builds: builds to build the template with
+    :type: benchmarks.synthetic.SyntheticBuilds
+
+    :param template: path to the template
+    :type: str
+
+    :param repeat: number of timed builds, the best is kept
+    :type: int
+
+    :return: components, scene nodes, commands per command, best seconds and peak bytes
+    :type: dict
+    """
+    # Plans are cached after the first build, as they are between real builds
+    biped = builds.build(template)
+    point = {'components': len(biped.components),
+             'nodes': len(builds.scene.nodes),
+             'commands': builds.cmds.count(),
+             'command_counts': dict(sorted(builds.cmds.counts().items()))}
+    del biped
+
+    point['seconds'] = min(timeit.repeat(lambda: builds.build(template), number=1,
+                                         repeat=repeat))
+
+    # Traced apart from the timed builds as tracing slows them down
+    tracemalloc.start()
+    builds.build(template)
+    point['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return point
+
+
+def growth(points, key):
+    """
+    Gets how a measure grows with the number of scene nodes over a sweep, the exponent
+    of a power law through its first and last points, 1 being linear
+
+    :param points: the points of the sweep
+    :type: list
+
+    :param key: the measure
+    :type: str
+
+    :return: the exponent, None when the sweep does not grow the scene
+    :type: float
+    """
+    first, last = points[0], points[-1]
+    if last['nodes'] <= first['nodes'] or not first[key] or not last[key]:
+        return None
+    return math.log(last[key] / first[key]) / math.log(last['nodes'] / first['nodes'])
+
+
+def run_sweeps(names, repeat=5):
+    """
+    Runs sweeps
+
+    :param names: names of the sweeps to run, see SWEEPS
+    :type: list
+
+    :param repeat: number of timed builds per point, the best is kept
+    :type: int
+
+    :return: the results, sweep name to its template key, points and growth
+    :type: dict
+    """
+    results = {}
+    print(f'{"sweep":<8} {"size":>5} {"comps":>6} {"nodes":>7} {"ms":>9} {"us/node":>8} '
+          f'{"cmds":>7} {"peak MB":>8}')
+    for name in names:
+        key, sizes = SWEEPS[name]
+        points = []
+        for size in sizes:
+            options = dict(BASE_TEMPLATE, **{key: size})
+            with SyntheticBuilds() as builds:
+                template = builds.write_template(f'{name}{size}.xml', **options)
+                point = dict(template=options, size=size,
+                             **measure(builds, template, repeat))
+            points.append(point)
+            print(f'{name:<8} {size:>5} {point["components"]:>6} {point["nodes"]:>7} '
+                  f'{point["seconds"] * 1e3:>9.2f} '
+                  f'{point["seconds"] * 1e6 / point["nodes"]:>8.2f} '
+                  f'{point["commands"]:>7} {point["peak_bytes"] / 1e6:>8.2f}')
+        results[name] = {'key': key,
+                         'points': points,
+                         'growth': {measure_key: growth(points, measure_key)
+                                    for measure_key in ('seconds', 'commands',
+                                                        'peak_bytes')}}
+        print(f'{name:<8} growth with nodes, '
+              + ', '.join(f'{measure_key} {value:.2f}'
+                          for measure_key, value in results[name]['growth'].items()
+                          if value is not None))
+
+    return results
+
+
+def compare(results, baseline, tolerance=0.5):
+    """
+    Compares results to a baseline point by point
+
+    :param results: the sweeps of this run
+    :type: dict
+
+    :param baseline: the sweeps of an earlier run
+    :type: dict
+
+    :param tolerance: fraction time and peak memory may grow by
+    :type: float
+
+    :return: a description of every regression
+    :type: list
+    """
+    regressions = []
+    for name, sweep in results.items():
+        if name not in baseline:
+            continue
+        baseline_points = {point['size']: point for point in baseline[name]['points']}
+        for point in sweep['points']:
+            before = baseline_points.get(point['size'])
+            if before is None:
+                continue
+            label = f'{name} {sweep["key"]}={point["size"]}'
+            if point['commands'] > before['commands']:
+                regressions.append(f'{label} commands {before["commands"]} -> '
+                                   f'{point["commands"]}')
+            for measure_key in ('seconds', 'peak_bytes'):
+                if point[measure_key] > before[measure_key] * (1 + tolerance):
+                    regressions.append(f'{label} {measure_key} {before[measure_key]:.6g} '
+                                       f'-> {point[measure_key]:.6g}')
+
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command line entry point
+
+    :return: exit code, non zero when a build regressed from the baseline
+    :type: int
+    """
+    parser = argparse.ArgumentParser(description='Measures how full builds scale.')
+    parser.add_argument('-o', '--output',
+                        help='json file to write the results to, not written if not '
+                             'given')
+    parser.add_argument('--sweeps', nargs='+', choices=sorted(SWEEPS),
+                        default=list(SWEEPS), help='sweeps to run, all by default')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='timed builds per point, the best is kept')
+    parser.add_argument('--baseline',
+                        help='json file of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='fraction time and peak memory may grow by over the '
+                             'baseline')
+    args = parser.parse_args(argv)
+
+    # Read first, the results may be written over the baseline
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_fh:
+            baseline = json.load(baseline_fh)
+
+    results = run_sweeps(args.sweeps, args.repeat)
+    if args.output:
+        report = {'version': __version__,
+                  'python': platform.python_version(),
+                  'platform': platform.platform(),
+                  'repeat': args.repeat,
+                  'base_template': BASE_TEMPLATE,
+                  'sweeps': results}
+        with open(args.output, 'w') as report_fh:
+            json.dump(report, report_fh, indent=2)
+        print(f'Results written to {args.output}')
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline['sweeps'], args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSED {regression}')
+    print(f'{len(regressions)} regressions against {args.baseline}')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of loading compiled templates against parsing their xml, after checking
+    that every compiled template round trips, its dictionary matching read_xml and its
+    blocks and plan matching iter_template. Exits non zero when a round trip fails.
+
+    python -m maya_autorigger.benchmarks.bench_compiled_template
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import sys
+import tempfile
+import timeit
+
+# Third party
+
+# Internal
+from maya_autorigger.benchmarks.synthetic import write_template
+from maya_autorigger.utils.build_plan import compile_blocks
+from maya_autorigger.utils.compiled_template import (CompiledTemplate,
+                                                     compile_template_file)
+from maya_autorigger.utils.gen_utils import iter_template, read_xml
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
+
+
+def round_trips(xml_path, directory):
+    """
+    Compiles a template and checks the compiled template reads back the same
+
+    :param xml_path: path to the xml template
+    :type: str
+
+    :param directory: folder to write the compiled template to
+    :type: str
+
+    :return: the compiled template's path and the checks that failed
+    :type: tuple
+    """
+    compiled_path = compile_template_file(
+        xml_path, os.path.join(directory, os.path.basename(xml_path) + '.artc'))
+    failed = []
+    with CompiledTemplate(compiled_path) as compiled:
+        blocks = list(compiled)
+        if compiled.to_dict() != read_xml(xml_path):
+            failed.append('read_xml')
+        if blocks != list(iter_template(xml_path)):
+            failed.append('iter_template')
+    if compile_blocks(blocks) != compile_blocks(iter_template(xml_path)):
+        failed.append('plan')
+
+    return compiled_path, failed
+
+
+def best_time(func, number=5):
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def open_compiled(path):
+    with CompiledTemplate(path) as compiled:
+        return len(compiled)
+
+
+def read_compiled(path):
+    with CompiledTemplate(path) as compiled:
+        return list(compiled)
+
+
+def plan_compiled(path):
+    with CompiledTemplate(path) as compiled:
+        return compile_blocks(compiled)
+
+
+def check_templates(directory):
+    """
+    Prints round trip results and load times, see main
+
+    :param directory: folder to write the synthetic and compiled templates to
+    :type: str
+
+    :return: exit code, non zero when a round trip failed
+    :type: int
+    """
+    templates = [os.path.join(TEMPLATE_DIR, name)
+                 for name in sorted(os.listdir(TEMPLATE_DIR)) if name.endswith('.xml')]
+    for num_roots in (10, 1000, 5000):
+        path = os.path.join(directory, f'synthetic{num_roots}.xml')
+        write_template(path, num_comps=1, depth=1, num_roots=num_roots)
+        templates.append(path)
+
+    exit_code = 0
+    print(f'{"template":<20} {"blocks":>7} {"open us":>9} {"read ms":>9} {"xml ms":>9} '
+          f'{"plan ms":>9} {"xml plan ms":>12}  round trip')
+    for xml_path in templates:
+        compiled_path, failed = round_trips(xml_path, directory)
+        exit_code = exit_code or int(bool(failed))
+        num_blocks = open_compiled(compiled_path)
+        open_time = best_time(lambda: open_compiled(compiled_path))
+        read_time = best_time(lambda: read_compiled(compiled_path))
+        xml_time = best_time(lambda: list(iter_template(xml_path)))
+        plan_time = best_time(lambda: plan_compiled(compiled_path))
+        xml_plan_time = best_time(lambda: compile_blocks(iter_template(xml_path)))
+        status = 'failed ' + ', '.join(failed) if failed else 'ok'
+        print(f'{os.path.basename(xml_path):<20} {num_blocks:>7} {open_time * 1e6:>9.1f} '
+              f'{read_time * 1e3:>9.2f} {xml_time * 1e3:>9.2f} {plan_time * 1e3:>9.2f} '
+              f'{xml_plan_time * 1e3:>12.2f}  {status}')
+
+    return exit_code
+
+
+def main():
+    """
+    Prints round trip results and load times for the shipped and synthetic templates
+
+    :return: exit code, non zero when a round trip failed
+    :type: int
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return check_templates(tmp_dir)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of the memory held by built components, slotted components with node
+    handles against the previous dictionary and list based components.
+
+    python -m maya_autorigger.benchmarks.bench_component_memory
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import gc
+import tracemalloc
+
+# Third party
+
+# Internal
+from maya_autorigger.modules.arm import Arm
+from maya_autorigger.modules.finger import Finger
+from maya_autorigger.utils.enums import AXIS, SIDE
+from maya_autorigger.utils.node_table import NodeTable
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def fill(comp, num_joints, arm):
+    """
+    Gives a component the node names a build would
+    """
+    prefix = f'{comp.side}_{comp.name}'
+    comp.locators = [f'{prefix}{num:02d}_LOC' for num in range(1, num_joints + 1)]
+    if arm:
+        comp.fk_jnts = [f'{prefix}{num:02d}_fk_JNT' for num in range(1, num_joints + 1)]
+        comp.ik_jnts = [f'{prefix}{num:02d}_ik_JNT' for num in range(1, num_joints + 1)]
+        comp.blend_jnts = [f'{prefix}{num:02d}_blend_JNT' for num in range(1, num_joints + 1)]
+        comp.joints = comp.blend_jnts
+    else:
+        comp.joints = [f'{prefix}{num:02d}_JNT' for num in range(1, num_joints + 1)]
+    comp.build_nodes = [comp.joints[0]]
+
+
+def make_components(num_comps, num_joints, legacy):
+    """
+    Makes one arm for every five fingers
+    """
+    node_table = NodeTable()
+    comps = []
+    for num in range(num_comps):
+        arm = num % 6 == 0
+        args = dict(name=f'comp{num:05d}_', side=SIDE.L, start_pos=(0, 0, 0),
+                    num_joints=num_joints, length=1.0, axis=AXIS.X)
+        if legacy:
+            comp = (LegacyArm if arm else LegacyComponent)(**args)
+        else:
+            comp = (Arm if arm else Finger)(node_table=node_table, **args)
+        fill(comp, num_joints, arm)
+        comps.append(comp)
+    return comps, node_table
+
+
+def measure(num_comps, num_joints, legacy):
+    """
+    Gets the bytes held by the components and their names
+    """
+    gc.collect()
+    tracemalloc.start()
+    comps = make_components(num_comps, num_joints, legacy)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del comps
+    return current
+
+
+def main(num_comps=30000, num_joints=3):
+    """
+    Prints the memory held by both kinds of component
+
+    :param num_comps: number of components
+    :type: int
+
+    :param num_joints: number of joints per component
+    :type: int
+    """
+    legacy = measure(num_comps, num_joints, legacy=True)
+    compact = measure(num_comps, num_joints, legacy=False)
+    print(f'{num_comps} components of {num_joints} joints')
+    print(f'dict and lists: {legacy / 1e6:.2f} MB ({legacy / num_comps:.0f} B each)')
+    print(f'slots and handles: {compact / 1e6:.2f} MB ({compact / num_comps:.0f} B each)')
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class LegacyComponent:
+    """
+    The previous component layout, kept as the baseline for this benchmark
+    """
+    def __init__(self, name, side, start_pos, num_joints, length, axis):
+        self.name = name
+        self.side = side
+        self.start_pos = start_pos
+        self.num_joints = num_joints
+        self.length = length
+        self.parent = None
+        self.locators = []
+        self.joints = []
+        self.controls = []
+        self.build_nodes = []
+        self.dir_vector = axis
+
+
+class LegacyArm(LegacyComponent):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.blend_jnts = None
+        self.fk_jnts = None
+        self.ik_jnts = None
+
+
+if __name__ == '__main__':
+    main()
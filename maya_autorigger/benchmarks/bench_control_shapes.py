@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of controls created per second and commands per control, comparing the
+    previous build and clean up of every curve against the shape library's single
+    curve command.
+
+    python -m maya_autorigger.benchmarks.bench_control_shapes
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import time
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+from maya_autorigger.utils.control_shapes import create_control
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+CMDS = RecordingCmds(MemoryScene())
+
+
+def legacy_cube_con(name):
+    """
+    The previous cube control builder, kept as the baseline for this benchmark
+    """
+    box_con = CMDS.curve(degree=1, point=[(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1),
+                                          (0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0),
+                                          (1, 1, 0), (1, 1, 1), (1, 0, 1), (1, 1, 1),
+                                          (0, 1, 1), (0, 0, 1), (0, 1, 1), (0, 1, 0)])
+    CMDS.CenterPivot()
+    CMDS.xform(box_con, translation=(-.5, -.5, -.5))
+    CMDS.select(box_con)
+    CMDS.FreezeTransformations()
+    CMDS.rename(name)
+    CMDS.delete(constructionHistory=1)
+    CMDS.select(clear=True)
+
+    return box_con
+
+
+def run(mode, num_controls):
+    """
+    Creates cube controls in a fresh scene and records the commands they issue
+
+    :param mode: legacy or library
+    :type: str
+
+    :param num_controls: number of controls to create
+    :type: int
+
+    :return: commands per control and controls per second
+    :type: tuple
+    """
+    CMDS.backend = MemoryScene()
+    CMDS.reset()
+    start = time.perf_counter()
+    if mode == 'legacy':
+        for num in range(num_controls):
+            legacy_cube_con(f'ctrl{num}_CON')
+    else:
+        for num in range(num_controls):
+            create_control(f'ctrl{num}_CON', shape='cube')
+    elapsed = time.perf_counter() - start
+
+    return CMDS.count() / num_controls, num_controls / elapsed
+
+
+def main():
+    """
+    Prints a table of commands per control and controls per second for every mode
+    """
+    set_backend(CMDS)
+    print(f'{"controls":>9} {"mode":>8} {"cmds/ctrl":>10} {"ctrls/s":>10}')
+    for num_controls in (10, 100, 1000):
+        for mode in ('legacy', 'library'):
+            per_control, rate = run(mode, num_controls)
+            print(f'{num_controls:>9} {mode:>8} {per_control:>10.2f} {rate:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark counting the scene commands issued to give a chain of joints constrained
+    controls, comparing a control built joint by joint against the bulk generator, and
+    printing the commands every component of a template build issues.
+
+    python -m maya_autorigger.benchmarks.bench_controls
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+
+# Third party
+
+# Internal
+from maya_autorigger.biped import Biped
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.profiler import profile_build
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+from maya_autorigger.utils.enums import AXIS, SUFFIX
+from maya_autorigger.utils.maya_utils import (create_controls, create_joint_chain,
+                                              chain_positions)
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+CMDS = RecordingCmds(MemoryScene())
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates', 'arm.xml')
+
+
+def per_joint_controls(joints):
+    """
+    Builds the controls one joint at a time, kept as the baseline for this benchmark
+    """
+    controls = []
+    for jnt in joints:
+        position = CMDS.xform(jnt, query=True, worldSpace=True, translation=True)
+        rotation = CMDS.xform(jnt, query=True, worldSpace=True, rotation=True)
+        control = CMDS.circle(normal=(1, 0, 0), radius=0.5,
+                              name=jnt.replace(SUFFIX.JOINT, SUFFIX.CONTROL))[0]
+        CMDS.delete(control, constructionHistory=True)
+        group = CMDS.group(control, name=control.replace(SUFFIX.CONTROL, SUFFIX.GROUP))
+        CMDS.xform(group, worldSpace=True, translation=position, rotation=rotation)
+        if controls:
+            CMDS.parent(group, controls[-1])
+        CMDS.parentConstraint(control, jnt)
+        CMDS.select(clear=True)
+        controls.append(control)
+
+    return controls
+
+
+def count_chain(num_joints, bulk):
+    """
+    Counts the commands to give a new chain of joints its controls
+
+    :param num_joints: number of joints in the chain
+    :type: int
+
+    :param bulk: use the bulk generator
+    :type: bool
+
+    :return: number of commands issued
+    :type: int
+    """
+    CMDS.backend = MemoryScene()
+    names = [f'L_chain{num:02d}_{SUFFIX.JOINT}' for num in range(1, num_joints + 1)]
+    joints = create_joint_chain(names, chain_positions((0, 0, 0), AXIS.X, num_joints, 1.0))
+    CMDS.reset()
+    if bulk:
+        create_controls(joints, shapes='circle', scale=0.5)
+    else:
+        per_joint_controls(joints)
+
+    return CMDS.count()
+
+
+def component_commands(template=TEMPLATE):
+    """
+    Builds a template and gets the commands every component issued for its joints and
+    controls
+
+    :param template: template to build
+    :type: str
+
+    :return: component stage to number of commands
+    :type: dict
+    """
+    set_backend(MemoryScene())
+    biped = Biped(3, template, transaction=False)
+    with profile_build() as profiler:
+        biped.create_locators()
+        biped.create_joints()
+    set_backend(CMDS)
+
+    return {path.split(';', 1)[1]: totals['commands']
+            for path, totals in profiler.stage_totals().items()
+            if path.startswith('joints;') and path.count(';') == 1}
+
+
+def main():
+    """
+    Prints commands per chain for both control builders and commands per component
+    """
+    set_backend(CMDS)
+    print(f'{"joints":>8} {"per-joint":>10} {"bulk":>10}')
+    for num_joints in (3, 5, 10, 25):
+        per_joint = count_chain(num_joints, bulk=False)
+        bulk = count_chain(num_joints, bulk=True)
+        print(f'{num_joints:>8} {per_joint:>10} {bulk:>10}')
+
+    print()
+    print(f'{"component":>12} {"commands":>10}')
+    for component, num_commands in component_commands().items():
+        print(f'{component:>12} {num_commands:>10}')
+
+
+if __name__ == '__main__':
+    main()
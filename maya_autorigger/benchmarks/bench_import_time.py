@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of the time to import the rigger's entry points, each in a fresh
+    interpreter with maya.cmds stubbed, and of the modules every import pulls in. Exits
+    non zero when the shelf entry point loads Qt, the rigger or a component, so it can
+    run in CI without Maya.
+
+    python -m maya_autorigger.benchmarks.bench_import_time
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import json
+import subprocess
+import sys
+
+# Third party
+
+# Internal
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+# Runs in the fresh interpreter, prints the seconds taken and the rigger modules loaded
+_PROBE = '''
+import json, sys, time
+from maya_autorigger.utils.recording_cmds import install
+install()
+before = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in set(sys.modules) - before
+                if name.startswith(('maya_autorigger', 'PySide2', 'shiboken2')))
+print(json.dumps({{'seconds': elapsed, 'loaded': loaded}}))
+'''
+
+# Statement timed and modules it must not load
+TARGETS = [('import maya_autorigger.autorigger_gui',
+            ('PySide2', 'shiboken2', 'maya_autorigger.biped', 'maya_autorigger.modules.arm',
+             'maya_autorigger.modules.finger')),
+           ('import maya_autorigger.biped',
+            ('PySide2', 'maya_autorigger.modules.arm', 'maya_autorigger.modules.finger')),
+           ('import maya_autorigger.biped\n'
+            'maya_autorigger.biped.get_component_class("Arm")',
+            ('PySide2', 'maya_autorigger.modules.finger'))]
+
+
+def probe(statement, repeat=5):
+    """
+    Times a statement in fresh interpreters
+
+    :param statement: python to time
+    :type: str
+
+    :param repeat: number of interpreters to run it in
+    :type: int
+
+    :return: best seconds and the rigger modules it loaded
+    :type: tuple
+    """
+    best = None
+    loaded = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(statement=statement)],
+                                check=True, capture_output=True, text=True).stdout
+        result = json.loads(output)
+        if best is None or result['seconds'] < best:
+            best = result['seconds']
+        loaded = result['loaded']
+
+    return best, loaded
+
+
+def main():
+    """
+    Prints the import time and module count of every entry point
+
+    :return: exit code, non zero when an import loads something it must not
+    :type: int
+    """
+    failed = False
+    print(f'{"ms":>8} {"modules":>8}  statement')
+    for statement, forbidden in TARGETS:
+        seconds, loaded = probe(statement)
+        print(f'{seconds * 1000:>8.2f} {len(loaded):>8}  {statement.splitlines()[-1]}')
+        for name in forbidden:
+            if name in loaded:
+                print(f'{"":>18}loaded {name}')
+                failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark counting the scene commands issued to build joints from a locator chain,
+    comparing direct placement against the previous parent/zero/unparent approach.
+
+    python -m maya_autorigger.benchmarks.bench_joint_chain
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+from maya_autorigger.utils.enums import AXIS, SIDE, SUFFIX
+from maya_autorigger.utils.maya_utils import (create_locator_chain,
+                                              create_joints_from_locators,
+                                              query_world_positions)
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+CMDS = RecordingCmds(MemoryScene())
+
+
+def per_joint_create_joints(locators, name_modifier=None):
+    """
+    The previous joint builder, kept as the baseline for this benchmark
+    """
+    joints = []
+    CMDS.select(clear=True)
+    for i, loc in enumerate(locators):
+        jnt_name = loc.replace(SUFFIX.LOCATOR, SUFFIX.JOINT)
+        if name_modifier:
+            split_name = jnt_name.split('_')
+            start = '_'.join(split_name[:-1])
+            jnt_name = f'{start}_{name_modifier}_{split_name[-1]}'
+        jnt = CMDS.joint(name=jnt_name)
+        if CMDS.listRelatives(jnt, parent=True):
+            CMDS.parent(jnt, world=True)
+        CMDS.parent(jnt, loc)
+        CMDS.xform(jnt, translation=(0, 0, 0))
+        CMDS.joint(name=jnt, edit=True, orientation=[0, 0, 0])
+        CMDS.parent(jnt, world=True)
+        joints.append(jnt)
+        if i > 0:
+            CMDS.parent(joints[i], joints[i - 1])
+
+    return joints
+
+
+def count_arm_build(locators, direct):
+    """
+    Counts the commands to build the fk, ik and blend chains of an arm
+
+    :param locators: locator chain of the arm
+    :type: list
+
+    :param direct: use direct placement with one shared position query
+    :type: bool
+
+    :return: number of commands issued
+    :type: int
+    """
+    CMDS.reset()
+    if direct:
+        positions = query_world_positions(locators)
+        for modifier in ('fk', 'ik', 'blend'):
+            create_joints_from_locators(locators, name_modifier=modifier, positions=positions)
+    else:
+        for modifier in ('fk', 'ik', 'blend'):
+            per_joint_create_joints(locators, name_modifier=modifier)
+
+    return CMDS.count()
+
+
+def main():
+    """
+    Prints a table of commands per arm for both joint builders
+    """
+    set_backend(CMDS)
+    print(f'{"joints":>8} {"per-joint":>10} {"direct":>10}')
+    for num_joints in (3, 5, 10, 25):
+        locators = create_locator_chain(name=f'arm{num_joints}', side=SIDE.L,
+                                        num_joints=num_joints, length=1.0,
+                                        dir_vector=AXIS.X)
+        per_joint = count_arm_build(locators, direct=False)
+        direct = count_arm_build(locators, direct=True)
+        print(f'{num_joints:>8} {per_joint:>10} {direct:>10}')
+
+
+if __name__ == '__main__':
+    main()
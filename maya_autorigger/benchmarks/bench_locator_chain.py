@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark counting the scene commands create_locator_chain issues per chain, run
+    against the recording stand-in over an in memory scene.
+
+    python -m maya_autorigger.benchmarks.bench_locator_chain
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import time
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+from maya_autorigger.utils.enums import AXIS, SIDE
+from maya_autorigger.utils.maya_utils import create_locator_chain
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+CMDS = RecordingCmds(MemoryScene())
+
+
+def run(num_joints, batched, num_chains=1):
+    """
+    Builds chains and records the commands they issue
+
+    :param num_joints: number of joints in each chain
+    :type: int
+
+    :param batched: whether to use the batched construction mode
+    :type: bool
+
+    :param num_chains: number of chains to build
+    :type: int
+
+    :return: commands per chain and seconds spent building all chains
+    :type: tuple
+    """
+    CMDS.reset()
+    start = time.perf_counter()
+    for chain_num in range(num_chains):
+        create_locator_chain(name=f'chain{chain_num}', side=SIDE.L, num_joints=num_joints,
+                             length=1.0, dir_vector=AXIS.X, batched=batched)
+    elapsed = time.perf_counter() - start
+
+    return CMDS.count() / num_chains, elapsed
+
+
+def main():
+    """
+    Prints a table of commands per chain for both construction modes
+    """
+    set_backend(CMDS)
+    print(f'{"joints":>8} {"per-node":>10} {"batched":>10}')
+    for num_joints in (3, 5, 10, 25, 50):
+        per_node, _ = run(num_joints, batched=False)
+        batched, _ = run(num_joints, batched=True)
+        print(f'{num_joints:>8} {per_node:>10.0f} {batched:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of name lookups per second, comparing the previous replace and split
+    string surgery against the name registry's indexed partner lookups.
+
+    python -m maya_autorigger.benchmarks.bench_naming
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import timeit
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.enums import CHAIN, SIDE, SUFFIX
+from maya_autorigger.utils.naming import NameRegistry
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def surgery_names(locators):
+    """
+    The previous string surgery, kept as the baseline for this benchmark
+    """
+    names = []
+    for loc in locators:
+        jnt_name = loc.replace(SUFFIX.LOCATOR, SUFFIX.JOINT)
+        split_name = jnt_name.split('_')
+        start = '_'.join(split_name[:-1])
+        blend = f'{start}_{CHAIN.BLEND}_{split_name[-1]}'
+        names.append((blend.replace(CHAIN.BLEND, CHAIN.FK),
+                      blend.replace(SUFFIX.JOINT, SUFFIX.CONTROL)))
+    return names
+
+
+def registry_names(registry, locators):
+    """
+    The same names through the registry
+    """
+    names = []
+    for loc in locators:
+        blend = registry.partner(loc, chain=CHAIN.BLEND, suffix=SUFFIX.JOINT)
+        names.append((registry.partner(blend, chain=CHAIN.FK),
+                      registry.partner(blend, suffix=SUFFIX.CONTROL)))
+    return names
+
+
+def main():
+    """
+    Prints lookups per second for both approaches
+    """
+    print(f'{"locators":>9} {"surgery/s":>12} {"registry/s":>12}')
+    for num_locators in (10, 100, 1000):
+        registry = NameRegistry()
+        locators = [registry.name(SIDE.L, f'finger{num // 3:02d}_', index=num % 3 + 1,
+                                  suffix=SUFFIX.LOCATOR) for num in range(num_locators)]
+        registry_names(registry, locators)
+        number = max(1, 20000 // num_locators)
+        surgery = timeit.timeit(lambda: surgery_names(locators), number=number)
+        indexed = timeit.timeit(lambda: registry_names(registry, locators), number=number)
+        lookups = num_locators * number
+        print(f'{num_locators:>9} {lookups / surgery:>12.0f} {lookups / indexed:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Micro benchmark of spreading the components of a block, one component at a time
+    with multipy_tup and add_tup against utils.placement, checking both give bit
+    identical positions. Blocks from utils.placement.NUMPY_MIN_COMPS components up are
+    placed with NumPy when it is installed.
+
+    python -m maya_autorigger.benchmarks.bench_placement
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import struct
+import timeit
+
+# Third party
+
+# Internal
+from maya_autorigger.utils import placement
+from maya_autorigger.utils.enums import AXIS
+from maya_autorigger.utils.maya_utils import add_tup, multipy_tup
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def per_component_positions(start_pos, spread_axis, num_comps):
+    """
+    Spread the way templates used to be planned, kept as the baseline
+    """
+    positions = []
+    for i in range(1, num_comps + 1):
+        if i == 1:
+            position = start_pos
+        else:
+            direction = (-1) ** i
+            step = ((i - 2) // 2 + 1) * 2
+            position = add_tup(start_pos, multipy_tup(spread_axis, direction * step))
+        positions.append(tuple(position))
+    return positions
+
+
+def _bits(positions):
+    return [struct.pack('3d', *pos) for pos in positions]
+
+
+def best_time(func, number=5):
+    return min(timeit.repeat(func, number=1, repeat=number))
+
+
+def main():
+    """
+    Prints the time to spread blocks of growing size both ways
+    """
+    engine = 'numpy' if placement.get_numpy() is not None else 'python fallback'
+    print(f'blocks from {placement.NUMPY_MIN_COMPS} components placed with {engine}')
+    print(f'{"comps":>7} {"per comp ms":>12} {"block ms":>9}  bit identical')
+    start_pos = (4.0, 0.0, 1.5)
+    for num_comps in (5, 100, 10000, 100000):
+        expected = per_component_positions(start_pos, AXIS.Z, num_comps)
+        result = placement.block_positions(start_pos, AXIS.Z, num_comps)
+        per_comp = best_time(lambda: per_component_positions(start_pos, AXIS.Z,
+                                                             num_comps))
+        block = best_time(lambda: placement.block_positions(start_pos, AXIS.Z,
+                                                            num_comps))
+        print(f'{num_comps:>7} {per_comp * 1e3:>12.3f} {block * 1e3:>9.3f}  '
+              f'{_bits(expected) == _bits(result)}')
+
+
+if __name__ == '__main__':
+    main()
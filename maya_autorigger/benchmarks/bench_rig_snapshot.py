@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of restoring rigs from the snapshot store against building them, with the
+    cost of saving the snapshot after the first build. The in memory scene exports and
+    imports json, so times only show the commands saved, not Maya's file io.
+    Exits non zero when a restored rig differs from the built one.
+
+    python -m maya_autorigger.benchmarks.bench_rig_snapshot
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import sys
+import timeit
+
+# Third party
+
+# Internal
+from maya_autorigger.benchmarks.synthetic import SyntheticBuilds
+from maya_autorigger.utils.rig_snapshot import SnapshotStore
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def rig_state(biped, scene):
+    """
+    Gets what a rig is made of, independent of the order its nodes were made in
+
+    :return: nodes by name, connections and the nodes of every component
+    :type: tuple
+    """
+    nodes = {name: (node.type, node.shape, node.parent.name if node.parent else None,
+                    [child.name for child in node.children], node.attrs)
+             for name, node in scene.nodes.items()}
+    node_lists = [comp.node_lists() for comp in biped.components]
+    return nodes, dict(scene.connections), node_lists
+
+
+def measure(builds, func, number=5):
+    """
+    Times a build and counts its commands
+
+    :return: best seconds and number of commands
+    :type: tuple
+    """
+    func()
+    num_commands = builds.cmds.count()
+    seconds = min(timeit.repeat(func, number=1, repeat=number))
+
+    return seconds, num_commands
+
+
+def main():
+    """
+    Prints build, save and restore times and commands for growing rigs
+
+    :return: exit code, non zero when a restored rig differs from the built one
+    :type: int
+    """
+    exit_code = 0
+    print(f'{"arms":>6} {"nodes":>7} {"build ms":>9} {"save ms":>9} {"restore ms":>11} '
+          f'{"build cmds":>11} {"save cmds":>10} {"restore cmds":>13}')
+    for num_roots in (1, 4, 16):
+        with SyntheticBuilds() as builds:
+            template = builds.write_template('biped.xml', num_comps=5, depth=1,
+                                             num_roots=num_roots)
+            store = SnapshotStore(builds.path('snapshots'))
+
+            def build(snapshots=None):
+                return builds.build(template, snapshots=snapshots)
+
+            built = rig_state(build(), builds.scene)
+            build(store)
+            if rig_state(build(store), builds.scene) != built:
+                print(f'{"":>6} restored rig of {num_roots} arms differs from the built '
+                      f'rig')
+                exit_code = 1
+
+            build_time, build_cmds = measure(builds, build)
+
+            def save():
+                store.clear()
+                build(store)
+            save_time, save_cmds = measure(builds, save)
+
+            restore_time, restore_cmds = measure(builds, lambda: build(store))
+        print(f'{num_roots:>6} {len(built[0]):>7} {build_time * 1e3:>9.2f} '
+              f'{save_time * 1e3:>9.2f} {restore_time * 1e3:>11.2f} {build_cmds:>11} '
+              f'{save_cmds:>10} {restore_cmds:>13}')
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of building joints with transform queries answered by the scene cache
+    against sending every query to the scene, counting the xform commands of the first
+    build and of a rebuild after moving one locator. Exits non zero when the cached
+    build makes a different scene.
+
+    python -m maya_autorigger.benchmarks.bench_scene_cache
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import json
+import sys
+import time
+
+# Third party
+
+# Internal
+from maya_autorigger.benchmarks.synthetic import SyntheticBuilds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def build(builds, template, cache_queries):
+    """
+    Builds a template, then moves a locator of the last component and rebuilds
+
+    :param builds: builds to build the template with
+    :type: benchmarks.synthetic.SyntheticBuilds
+
+    :param template: path to the template
+    :type: str
+
+    :param cache_queries: answer queries from the scene cache
+    :type: bool
+
+    :return: xform commands and seconds of both builds, the scene and cache stats
+    :type: tuple
+    """
+    biped = builds.new_biped(template, cache_queries=cache_queries)
+
+    results = []
+    for build_num in range(2):
+        if build_num:
+            builds.scene.xform(biped.components[-1].locators[-1], worldSpace=True,
+                               translation=(0.0, 5.0, 0.0))
+        builds.cmds.reset()
+        start = time.perf_counter()
+        biped.create_joints()
+        results.append((builds.cmds.count('xform'), time.perf_counter() - start))
+
+    stats = biped.scene_cache.stats() if cache_queries else {}
+    return results, json.dumps(builds.scene.to_dict(), sort_keys=True), stats
+
+
+def main():
+    """
+    Prints xform commands and best first build times with and without the cache
+
+    :return: exit code, non zero when the cache changes the rig
+    :type: int
+    """
+    exit_code = 0
+    print(f'{"arms":>6} {"xform":>7} {"cached":>7} {"rebuild":>8} {"cached":>7} '
+          f'{"ms":>8} {"cached ms":>10} {"hit rate":>9}')
+    for num_roots in (1, 4, 16):
+        with SyntheticBuilds() as builds:
+            template = builds.write_template('synthetic.xml', num_comps=5, depth=1,
+                                             num_roots=num_roots)
+            build(builds, template, True)
+
+            plain, plain_scene, _ = build(builds, template, False)
+            cached, cached_scene, stats = build(builds, template, True)
+            plain_time = min(build(builds, template, False)[0][0][1] for _ in range(5))
+            cached_time = min(build(builds, template, True)[0][0][1] for _ in range(5))
+        if plain_scene != cached_scene:
+            print(f'{"":>6} cached build of {num_roots} arms made a different scene')
+            exit_code = 1
+
+        hits = sum(kind['hits'] for kind in stats.values())
+        queries = hits + sum(kind['misses'] for kind in stats.values())
+        print(f'{num_roots:>6} {plain[0][0]:>7} {cached[0][0]:>7} {plain[1][0]:>8} '
+              f'{cached[1][0]:>7} {plain_time * 1e3:>8.2f} {cached_time * 1e3:>10.2f} '
+              f'{hits / queries:>9.0%}')
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
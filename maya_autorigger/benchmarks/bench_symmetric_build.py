@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark of building symmetric bipeds by mirroring the left side against building
+    a template that describes both sides, with the left side alone for reference. The
+    mirrored side makes no locators, placement queries or joint commands, its controls
+    and blend networks are still made node by node so it costs more than half.
+    Exits non zero when the mirrored rig does not have the nodes of the two sided one.
+
+    python -m maya_autorigger.benchmarks.bench_symmetric_build
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import sys
+import timeit
+
+# Third party
+
+# Internal
+from maya_autorigger.benchmarks.synthetic import SyntheticBuilds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def measure(builds, template, symmetric, number=5):
+    """
+    Times a build and counts its commands
+
+    :return: best seconds and number of commands
+    :type: tuple
+    """
+    # Plans are cached after the first build, as they are between real builds
+    builds.build(template, symmetric=symmetric)
+    num_commands = builds.cmds.count()
+    seconds = min(timeit.repeat(lambda: builds.build(template, symmetric=symmetric),
+                                number=1, repeat=number))
+
+    return seconds, num_commands
+
+
+def rig_nodes(scene):
+    # Locators are only made for the side that is built
+    return {name for name, node in scene.nodes.items() if node.shape != 'locator'}
+
+
+def main():
+    """
+    Prints build times and commands for one sided, two sided and mirrored builds
+
+    :return: exit code, non zero when a mirrored rig is missing nodes
+    :type: int
+    """
+    exit_code = 0
+    print(f'{"arms":>6} {"comps":>6} {"left ms":>9} {"both ms":>9} {"mirror ms":>10} '
+          f'{"mirror/both":>12} {"left cmds":>10} {"both cmds":>10} {"mirror cmds":>12}')
+    for num_roots in (1, 4, 16):
+        with SyntheticBuilds() as builds:
+            left = builds.write_template('left.xml', num_comps=5, depth=1,
+                                         num_roots=num_roots)
+            both = builds.write_template('both.xml', num_comps=5, depth=1,
+                                         num_roots=num_roots, both_sides=True)
+
+            num_comps = len(builds.build(both).components)
+            both_nodes = rig_nodes(builds.scene)
+            builds.build(left, symmetric=True)
+            if rig_nodes(builds.scene) != both_nodes:
+                print(f'{"":>6} mirrored rig of {num_roots} arms differs from the two '
+                      f'sided rig')
+                exit_code = 1
+
+            left_time, left_cmds = measure(builds, left, False)
+            both_time, both_cmds = measure(builds, both, False)
+            mirror_time, mirror_cmds = measure(builds, left, True)
+        print(f'{num_roots:>6} {num_comps:>6} {left_time * 1e3:>9.2f} '
+              f'{both_time * 1e3:>9.2f} {mirror_time * 1e3:>10.2f} '
+              f'{mirror_time / both_time:>12.2f} {left_cmds:>10} {both_cmds:>10} '
+              f'{mirror_cmds:>12}')
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark comparing time and peak memory of the streaming template reader against
+    read_xml on a synthetic template.
+
+    python -m maya_autorigger.benchmarks.bench_template_reader
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import time
+import tracemalloc
+
+# Third party
+
+# Internal
+from maya_autorigger.benchmarks.synthetic import write_template
+from maya_autorigger.utils.build_plan import compile_blocks, compile_template
+from maya_autorigger.utils.gen_utils import iter_template, read_xml
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def measure(func, *args):
+    """
+    Runs a function once and measures it
+
+    :return: result, seconds and peak bytes allocated
+    :type: tuple
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def count_blocks(template_path):
+    return sum(1 for _ in iter_template(template_path))
+
+
+def count_dict_blocks(template_path):
+    return len(read_xml(template_path))
+
+
+def main(num_comps=10000):
+    """
+    Prints time and peak memory of both readers, reading alone and compiling a plan
+
+    :param num_comps: number of components in the template
+    :type: int
+    """
+    rows = (('read_xml', count_dict_blocks),
+            ('iter_template', count_blocks),
+            ('read_xml + compile', lambda path: compile_template(read_xml(path))),
+            ('iter_template + compile', lambda path: compile_blocks(iter_template(path))))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template_path = os.path.join(tmp_dir, 'synthetic.xml')
+        # One single component block per root gives one block per component
+        write_template(template_path, num_comps=1, depth=1, num_roots=num_comps // 2)
+        print(f'{num_comps} components, {os.path.getsize(template_path) / 1e6:.1f} MB')
+
+        print(f'{"":<24} {"seconds":>8} {"peak MB":>8}')
+        for label, func in rows:
+            _, elapsed, peak = measure(func, template_path)
+            print(f'{label:<24} {elapsed:>8.3f} {peak / 1e6:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
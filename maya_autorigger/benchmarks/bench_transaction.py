@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Benchmark timing a large biped build with and without build transactions.
+
+    The viewport and undo costs the transaction removes only exist in an interactive
+    Maya session, so run it from the script editor for meaningful numbers:
+
+    from maya_autorigger.benchmarks import bench_transaction
+    bench_transaction.main()
+
+    Outside of Maya it runs against the in memory scene, which only shows the overhead
+    of the transaction itself.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import time
+
+# Third party
+
+# Internal
+from maya_autorigger.benchmarks.synthetic import write_template
+from maya_autorigger.biped import Biped
+from maya_autorigger.utils.backend import cmds, get_backend, set_backend
+from maya_autorigger.utils.build_plan import PlanCache
+from maya_autorigger.utils.memory_scene import MemoryScene
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def time_build(template_path, transaction, plan_cache):
+    """
+    Builds the locators and joints of a template in a new scene
+
+    :param template_path: the template
+    :type: str
+
+    :param transaction: whether to use build transactions
+    :type: bool
+
+    :param plan_cache: cache holding the compiled template
+    :type: utils.build_plan.PlanCache
+
+    :return: seconds spent building
+    :type: float
+    """
+    cmds.file(new=True, force=True)
+    if isinstance(get_backend(), MemoryScene):
+        # The in memory undo copies the whole scene, which Maya does not do
+        cmds.undoInfo(state=False)
+    start = time.perf_counter()
+    biped = Biped(arm_jnt_num=3, template_file=template_path, plan_cache=plan_cache,
+                  transaction=transaction)
+    biped.create_locators()
+    biped.create_joints()
+    return time.perf_counter() - start
+
+
+def main(num_comps=200, repeats=3):
+    """
+    Prints the best build time with and without transactions
+
+    :param num_comps: number of fingers in the template
+    :type: int
+
+    :param repeats: number of builds to take the best time of
+    :type: int
+    """
+    try:
+        get_backend()
+    except ImportError:
+        set_backend(MemoryScene())
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        template_path = os.path.join(tmp_dir, 'large.xml')
+        total = write_template(template_path, num_comps=num_comps)
+        plan_cache = PlanCache(os.path.join(tmp_dir, 'plans'))
+        for transaction in (False, True):
+            results[transaction] = min(time_build(template_path, transaction, plan_cache)
+                                       for _ in range(repeats))
+    print(f'{total} components')
+    print(f'without transaction: {results[False]:.3f}s')
+    print(f'with transaction:    {results[True]:.3f}s')
+    print(f'speedup:             {results[False] / results[True]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
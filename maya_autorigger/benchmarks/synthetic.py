@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module writes synthetic templates in the templates/arm.xml schema for
+    benchmarks and builds them in the in memory scene.
+
+    with SyntheticBuilds() as builds:
+        template = builds.write_template('arms.xml', num_roots=4)
+        biped = builds.build(template)
+        print(builds.cmds.count(), len(builds.scene.nodes))
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import xml.etree.ElementTree as ElementTree
+
+# Third party
+
+# Internal
+from maya_autorigger.biped import Biped
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.build_plan import PlanCache
+from maya_autorigger.utils.enums import SIDE, TEMPLATE_KEY
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def _add_info(parent, module, num_comps, num_joints, side):
+    info = ElementTree.SubElement(parent, TEMPLATE_KEY.INFO)
+    for key, value in ((TEMPLATE_KEY.MODULE, module),
+                       (TEMPLATE_KEY.NUM_COMPS, num_comps),
+                       (TEMPLATE_KEY.NUM_JOINTS, num_joints),
+                       (TEMPLATE_KEY.SIDE, side),
+                       (TEMPLATE_KEY.AXIS, 'X')):
+        ElementTree.SubElement(info, key, value=str(value))
+
+
+def build_template(num_comps=5, num_joints=3, depth=1, num_roots=1, side=SIDE.L,
+                   both_sides=False):
+    """
+    Builds a template of arms, each holding depth nested levels of fingers
+
+    :param num_comps: number of fingers at each level
+    :type: int
+
+    :param num_joints: number of joints in every chain
+    :type: int
+
+    :param depth: number of nested finger levels under each arm
+    :type: int
+
+    :param num_roots: number of arms
+    :type: int
+
+    :param side: side of every component
+    :type: utils.enums.SIDE
+
+    :param both_sides: add every arm on the left and on the right, ignoring side
+    :type: bool
+
+    :return: the root of the template
+    :type: xml.etree.ElementTree.Element
+    """
+    sides = (SIDE.L, SIDE.R) if both_sides else (side,)
+    root = ElementTree.Element('root')
+    for side in sides:
+        for root_num in range(num_roots):
+            arm_name = f'arm{root_num:03d}'
+            if both_sides:
+                arm_name = f'{side}_{arm_name}'
+            level = ElementTree.SubElement(root, arm_name)
+            _add_info(level, 'Arm', 1, max(num_joints, 3), side)
+            for level_num in range(depth):
+                children = ElementTree.SubElement(level, TEMPLATE_KEY.CHILDREN)
+                level = ElementTree.SubElement(children, f'fingers{level_num:03d}')
+                _add_info(level, 'Finger', num_comps, num_joints, side)
+
+    return root
+
+
+def write_template(path, **kwargs):
+    """
+    Writes a synthetic template, see build_template for the arguments
+
+    :param path: file to write
+    :type: str
+
+    :return: number of components in the template
+    :type: int
+    """
+    root = build_template(**kwargs)
+    ElementTree.ElementTree(root).write(path, encoding='utf-8', xml_declaration=True)
+
+    num_roots = kwargs.get('num_roots', 1) * (2 if kwargs.get('both_sides') else 1)
+    return num_roots * (1 + kwargs.get('num_comps', 5) * kwargs.get('depth', 1))
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class SyntheticBuilds:
+    """
+    Builds templates for benchmarks, each in a new in memory scene whose commands are
+    recorded. Plans, templates and anything else put in path are kept in a temporary
+    folder that is removed on exit.
+    """
+    def __init__(self, arm_jnt_num=3):
+        """
+        :param arm_jnt_num: Number of joints in the arms
+        :type: int
+        """
+        self.arm_jnt_num = arm_jnt_num
+        self.cmds = RecordingCmds(MemoryScene())
+        self._directory = None
+        self._previous_backend = None
+        self.plan_cache = None
+
+    def __enter__(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.plan_cache = PlanCache(self.path('plans'))
+        self._previous_backend = set_backend(self.cmds)
+        return self
+
+    def __exit__(self, *exc_info):
+        set_backend(self._previous_backend)
+        self._directory.cleanup()
+
+    @property
+    def scene(self):
+        """
+        The scene of the last build
+        """
+        return self.cmds.backend
+
+    def path(self, name):
+        """
+        Gets a path in the temporary folder
+
+        :param name: name of the file or folder
+        :type: str
+
+        :return: the path
+        :type: str
+        """
+        return os.path.join(self._directory.name, name)
+
+    def write_template(self, name, **kwargs):
+        """
+        Writes a synthetic template to the temporary folder, see build_template for the
+        arguments
+
+        :param name: file name of the template
+        :type: str
+
+        :return: the template's path
+        :type: str
+        """
+        template = self.path(name)
+        write_template(template, **kwargs)
+        return template
+
+    def new_biped(self, template, **kwargs):
+        """
+        Creates the locators of a template in a new scene, other arguments are given to
+        the Biped
+
+        :param template: path to the template
+        :type: str
+
+        :return: the biped
+        :type: biped.Biped
+        """
+        self.cmds.backend = MemoryScene()
+        self.cmds.reset()
+        biped = Biped(self.arm_jnt_num, template, plan_cache=self.plan_cache,
+                      transaction=False, **kwargs)
+        biped.create_locators()
+        return biped
+
+    def build(self, template, **kwargs):
+        """
+        Builds a template in a new scene, other arguments are given to the Biped
+
+        :param template: path to the template
+        :type: str
+
+        :return: the biped
+        :type: biped.Biped
+        """
+        biped = self.new_biped(template, **kwargs)
+        biped.create_joints()
+        return biped
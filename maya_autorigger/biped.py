@@ -17,145 +17,471 @@
 #----------------------------------------------------------------------------- IMPORTS --#
 
 # Built-in
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
+import hashlib
 
 # Third party
 
 # Internal
-from maya_autorigger.modules.finger import Finger
-from maya_autorigger.modules.arm import Arm
-from maya_autorigger.utils.enums import AXIS, SIDE, TEMPLATE_KEY, DEFAULT_LENGTH
-from maya_autorigger.utils.gen_utils import read_xml
-from maya_autorigger.utils.maya_utils import multipy_tup, add_tup
+from maya_autorigger import __version__
+from maya_autorigger.modules.registry import get_component_class
+from maya_autorigger.utils.build_plan import load_plan, mirror_plan
+from maya_autorigger.utils.maya_utils import (build_transaction, mirror_joint_chains,
+                                              query_world_positions)
+from maya_autorigger.utils.naming import NAMES
+from maya_autorigger.utils.node_table import NodeTable
+from maya_autorigger.utils.profiler import stage
+from maya_autorigger.utils.rig_cost import enforce_budget, rig_report
+from maya_autorigger.utils.scene_cache import SceneCache, use_scene_cache
 
 
 #----------------------------------------------------------------------------------------#
 #--------------------------------------------------------------------------- FUNCTIONS --#
 
-def build_component(attributes, distance):
+def create_component(record, node_table=None):
     """
+    Creates the component described by a build plan record
 
-    :return:
+    :param record: the component's record
+    :type: utils.build_plan.ComponentPlan
+
+    :param node_table: table holding the names of the component's nodes
+    :type: utils.node_table.NodeTable
+
+    :return: the component
+    :type: modules.base_comp.Component
+    """
+    cls = get_component_class(record.module)
+    return cls(name=record.name,
+               side=record.side,
+               start_pos=record.start_pos,
+               num_joints=record.num_joints,
+               length=record.length,
+               axis=record.axis,
+               node_table=node_table)
+
+
+def run_steps(steps):
     """
-     # Get variables for making component
-    module = attributes[TEMPLATE_KEY.MODULE]
-    num_comps = int(attributes[TEMPLATE_KEY.NUM_COMPS])
-    side = attributes[TEMPLATE_KEY.SIDE]
-    num_joints = int(attributes[TEMPLATE_KEY.NUM_JOINTS])
-    axis = getattr(AXIS, attributes[TEMPLATE_KEY.AXIS])
-
-    # Set the start position based on previous lengths
-    start_pos = (0, 0, 0)
-    if distance != 0:
-        if side == SIDE.R:
-            add = multipy_tup(axis, distance * -1)
-        else:
-            add = multipy_tup(axis, distance)
-        start_pos = add_tup(start_pos, add_tup(add, multipy_tup(axis, DEFAULT_LENGTH.Spacer)))
-
-    # Determine spread axis
-    if axis == AXIS.X:
-        spread_axis = AXIS.Z
-    else:
-        spread_axis = AXIS.X
-
-    comps = []
-     # Create given number of components
-    for i in range(1, num_comps + 1):
-        if num_comps == 1:  # Only one component made
-            name = f'{module.lower()}'
-            position = start_pos
-        elif i == 1:        # First component should have original start position
-            name = f'{module.lower()}{i:02d}_'
-            position = start_pos
-        else:               # Alternate either side after first component
-            name = f'{module.lower()}{i:02d}_'
-            direction = (-1) ** i               # +1, -1, +1, -1...
-            step = ((i - 2) // 2 + 1) * 2       # 2, 2, 4, 4, 6, 6, ...
-            offset = multipy_tup(spread_axis, direction * step)
-            position = add_tup(start_pos, offset)
-
-        print(position)
-        comps.append(globals()[module](name=name,
-                                       side=side,
-                                       start_pos=position,
-                                       num_joints=num_joints,
-                                       length=getattr(DEFAULT_LENGTH, module),
-                                       axis=axis))
-
-    # Actually create locators
-    for comp in comps:
-        comp.create_locators()
-
-    return comps
+    Runs a build generator to the end
+
+    :param steps: generator from Biped.locator_steps or Biped.joint_steps
+    :type: generator
+
+    :return: what the generator returns
+    """
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
 
 
 #----------------------------------------------------------------------------------------#
 #----------------------------------------------------------------------------- CLASSES --#
 
+class BuildStep(namedtuple('BuildStep', ['done', 'total', 'label'])):
+    """
+    Progress of a build after one of its steps, label names what the step built
+    """
+    __slots__ = ()
+
+
 class Biped:
     """
     Builds the rig using the modules
     """
-    def __init__(self, arm_jnt_num, template_file):
+    def __init__(self, arm_jnt_num, template_file, plan_cache=None, transaction=True,
+                 plan_workers=None, budget=None, symmetric=False, cache_queries=True,
+                 snapshots=None):
         """
         :param arm_jnt_num: Number of joints in the arm
         :type: int
+
+        :param template_file: Path to the xml or compiled template
+        :type: str
+
+        :param plan_cache: Cache for compiled templates, the default cache if not given
+        :type: utils.build_plan.PlanCache
+
+        :param transaction: Run each build step as one undo chunk with refresh suspended
+        :type: bool
+
+        :param plan_workers: Number of threads to plan uncached templates with
+        :type: int
+
+        :param budget: Evaluation budget create_joints fails the build over
+        :type: utils.rig_cost.EvalBudget
+
+        :param symmetric: Build the left side of the template and mirror it to the right
+        :type: bool
+
+        :param cache_queries: Answer transform queries from what the build already knows
+        :type: bool
+
+        :param snapshots: Store of finished rigs, a rig already in it is restored instead
+                          of built
+        :type: utils.rig_snapshot.SnapshotStore
         """
         self.template = template_file
         self.arm_jnt_num = arm_jnt_num
+        self.plan_cache = plan_cache
+        self.transaction = transaction
+        self.plan_workers = plan_workers
+        self.budget = budget
+        self.symmetric = symmetric
+        self.snapshots = snapshots
+        self.plan = ()
+        # Index of the component every mirrored component was mirrored from
+        self.mirror_sources = {}
         self.components = []
+        # Names of every node the components make
+        self.node_table = NodeTable()
+        # Fingerprint of every component when its joints were last built
+        self.fingerprints = {}
+        # Hierarchy and transforms of the nodes made by the joint build in progress
+        self.scene_cache = SceneCache() if cache_queries else None
+
+
+    def _transaction(self, name, rollback=False):
+        """
+        Gets the context a build step runs in
+        """
+        if self.transaction:
+            return build_transaction(name, rollback=rollback)
+        return nullcontext()
+
+
+    @contextmanager
+    def _restore_on_failure(self, rollback):
+        """
+        Puts the biped back the way it was when a build fails or is cancelled, if the
+        build is rolled back
+        """
+        state = (self.plan, self.mirror_sources, list(self.components),
+                 dict(self.fingerprints), self.node_table.snapshot())
+        try:
+            yield
+        except BaseException:
+            if self.scene_cache is not None:
+                self.scene_cache.invalidate()
+            if rollback:
+                (self.plan, self.mirror_sources, self.components, self.fingerprints,
+                 table_state) = state
+                self.node_table.restore(table_state)
+            raise
+
+
+    def plan_template(self):
+        """
+        Parses and plans the template, issuing no scene commands so it can run off the
+        main thread. A missing or empty template raises ValueError instead of warning.
+
+        :return: the plan and the index every mirrored record was mirrored from
+        :type: tuple
+        """
+        plan = load_plan(self.template, cache=self.plan_cache, workers=self.plan_workers)
+        if self.symmetric:
+            return mirror_plan(plan)
+        return plan, {}
 
 
     def create_locators(self):
         """
         Builds the locators module by module
         """
-        # This builds just the arm for now
-        template_dict = read_xml(self.template)
+        run_steps(self.locator_steps())
 
-        #
-        self.components = []
-        for key in template_dict.keys():
-            self.components.extend(self._create_locator_helper(template_dict[key]))
 
-        parent = None
-        for comp in self.components:
-            if not parent:
-                parent = comp
-                continue
-            comp.set_parent(parent, loc_flag=True)
+    def locator_steps(self, planned=None, rollback=False):
+        """
+        Builds the locators one component per step, see create_locators
+
+        :param planned: the result of plan_template, planned here if not given
+        :type: tuple
+
+        :param rollback: undo everything and restore the biped when a step fails or
+                         the steps are closed before the last one
+        :type: bool
+
+        :return: a generator yielding a BuildStep after every component
+        :type: generator
+        """
+        if planned is None:
+            with stage('parse'):
+                planned = self.plan_template()
+
+        with self._restore_on_failure(rollback), stage('locators'):
+            with self._transaction('createLocators', rollback=rollback):
+                self.plan, self.mirror_sources = planned
+                self.components = []
+                self.fingerprints = {}
+                # The components made before are replaced along with their rows and the
+                # names made for them
+                self.node_table.clear()
+                NAMES.clear()
+                for index, record in enumerate(self.plan):
+                    comp = create_component(record, self.node_table)
+                    # Mirrored components follow the locators of the side they mirror
+                    if index not in self.mirror_sources:
+                        comp.create_locators()
+                        # Parents come before their children so their locators exist
+                        if record.parent is not None:
+                            comp.set_parent(self.components[record.parent], loc_flag=True)
+                    self.components.append(comp)
+                    yield BuildStep(index + 1, len(self.plan), comp.label)
+
+
+    def component_fingerprints(self):
+        """
+        Gets a fingerprint of every component from its template record and the world
+        positions of its locators, all locators are read with one query
+
+        :return: one fingerprint per component
+        :type: list
+        """
+        locators = [loc for comp in self.components for loc in comp.locators]
+        positions = query_world_positions(locators) if locators else []
+
+        fingerprints = []
+        start = 0
+        for comp, record in zip(self.components, self.plan):
+            end = start + len(comp.locators)
+            data = repr((tuple(record), positions[start:end])).encode('utf-8')
+            fingerprints.append(hashlib.sha1(data).hexdigest())
+            start = end
 
+        return fingerprints
 
-    def _create_locator_helper(self, curr_level, distance=0):
+
+    def dirty_components(self, fingerprints):
         """
+        Gets the components that must be rebuilt, those whose fingerprint changed,
+        everything parented under them and the mirrors of all of those
+
+        :param fingerprints: the current fingerprint of every component
+        :type: list
+
+        :return: sorted indices of the components
+        :type: list
+        """
+        dirty = set()
+        # Parents always come before their children in the plan
+        for index, record in enumerate(self.plan):
+            # Mirrors come after the components they mirror
+            if (self.fingerprints.get(index) != fingerprints[index]
+                    or record.parent in dirty
+                    or self.mirror_sources.get(index) in dirty):
+                dirty.add(index)
+
+        return sorted(dirty)
+
+
+    def create_joints(self, incremental=True):
+        """
+        Builds the joints and controls of every component from its locators. After the
+        first build only the components whose template or locators changed are rebuilt,
+        along with the components parented under them. Mirrored components are copied
+        from the joints of the side they mirror in one pass before any control is made.
+        A rig found in the snapshot store is imported instead of built, and built rigs
+        are added to it.
+
+        :param incremental: only rebuild what changed, otherwise rebuild everything
+        :type: bool
+
+        :return: indices of the components that were built
+        :type: list
+        """
+        return run_steps(self.joint_steps(incremental=incremental))
+
+
+    def joint_steps(self, incremental=True, rollback=False):
+        """
+        Builds the joints and controls one step at a time, see create_joints. Building
+        the joints of a component, the mirror pass and making the controls of a
+        component are each a step, restoring a snapshot is a single step.
+
+        :param incremental: only rebuild what changed, otherwise rebuild everything
+        :type: bool
+
+        :param rollback: undo everything and restore the biped when a step fails or
+                         the steps are closed before the last one
+        :type: bool
 
-        :param curr_level:
-        :return:
+        :return: a generator yielding a BuildStep after every step and returning the
+                 indices of the components that were built
+        :type: generator
         """
-        components = []
+        if self.scene_cache is not None:
+            # Locators may have been moved since the last build
+            self.scene_cache.invalidate()
+
+        cache_context = use_scene_cache(self.scene_cache)
+        with self._restore_on_failure(rollback), stage('joints'), cache_context:
+            fingerprints = self.component_fingerprints()
+            if incremental:
+                dirty = self.dirty_components(fingerprints)
+            else:
+                dirty = list(range(len(self.components)))
+            # Nothing changed, the locators were the only thing read
+            if not dirty:
+                return dirty
+
+            with self._transaction('createJoints', rollback=rollback):
+                key = None
+                snapshot = None
+                if self.snapshots is not None:
+                    key = self.snapshot_key(fingerprints)
+                    snapshot = self.snapshots.get(key)
+                if snapshot is not None:
+                    # The snapshot holds the whole rig so every build is replaced
+                    dirty = list(range(len(self.components)))
+
+                # Children first so nothing is deleted twice
+                for index in reversed(dirty):
+                    self.components[index].delete_build()
+
+                restored = False
+                if snapshot is not None:
+                    with stage('snapshot'):
+                        restored = self.restore_snapshot(key, snapshot)
+                if restored:
+                    yield BuildStep(1, 1, 'snapshot')
+                else:
+                    yield from self._build_steps(dirty)
+
+                # Checked before the build is recorded, a rig over budget fails and is
+                # rolled back like any other failed build
+                if self.budget is not None:
+                    with stage('budget'):
+                        enforce_budget(self.cost_report(), self.budget)
+
+                # A rig built around clashing nodes is not stored over its snapshot
+                if snapshot is None and key is not None:
+                    with stage('snapshot'):
+                        self.save_snapshot(key)
+                self.fingerprints = dict(enumerate(fingerprints))
+
+        return dirty
+
+
+    def _build_steps(self, dirty):
+        """
+        Builds the joints and controls of components, yielding a BuildStep after each
+        step
+        """
+        mirrored = [index for index in dirty if index in self.mirror_sources]
+        built = [index for index in dirty if index not in self.mirror_sources]
+        total = len(built) + len(dirty) + (1 if mirrored else 0)
+        done = 0
+        for index in built:
+            comp = self.components[index]
+            # Each component is its own stage so profiles count commands per component
+            with stage(comp.label):
+                comp.build()
+            done += 1
+            yield BuildStep(done, total, comp.label)
+
+        # Chains are mirrored before parenting or controls put anything under them
+        if mirrored:
+            with stage('mirror'):
+                self.mirror_components(mirrored)
+            done += 1
+            yield BuildStep(done, total, 'mirror')
+
+        for index in dirty:
+            comp = self.components[index]
+            with stage(comp.label):
+                parent = self.plan[index].parent
+                if parent is not None:
+                    comp.set_parent(self.components[parent], loc_flag=False)
+                comp.create_ctrls()
+            done += 1
+            yield BuildStep(done, total, comp.label)
+
+
+    def snapshot_key(self, fingerprints):
+        """
+        Gets the key of the rig built from the template and locators, builds of the same
+        template with the locators in the same places have the same key
 
-        for key, value in curr_level.items():
-            if key == TEMPLATE_KEY.INFO:
-                components.extend(build_component(value, distance))
-                continue
-            elif key == TEMPLATE_KEY.CHILDREN:
-                for child in value.keys():
-                    distance = getattr(DEFAULT_LENGTH,
-                                       curr_level[TEMPLATE_KEY.INFO][TEMPLATE_KEY.MODULE])
-                    components.extend(self._create_locator_helper(value[child], distance=distance))
+        :param fingerprints: the current fingerprint of every component
+        :type: list
 
-        return components
+        :return: the key
+        :type: str
+        """
+        data = repr((__version__, self.arm_jnt_num, self.symmetric, fingerprints))
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
 
 
-    def create_joints(self):
+    def save_snapshot(self, key):
         """
+        Stores the built rig in the snapshot store
 
-        :return:
+        :param key: key of the rig
+        :type: str
         """
-        parent = None
+        nodes = [node for comp in self.components for node in comp.build_nodes]
+        node_lists = []
         for comp in self.components:
-            comp.build()
-            if not parent:
-                parent = comp
-                continue
-            comp.set_parent(parent, loc_flag=False)
\ No newline at end of file
+            comp_lists = comp.node_lists()
+            # Locators are not part of the build
+            comp_lists.pop('locators', None)
+            node_lists.append(comp_lists)
+        self.snapshots.put(key, nodes, node_lists)
+
+
+    def restore_snapshot(self, key, node_lists):
+        """
+        Imports a stored rig in place of building it, every component's builds must
+        already be deleted. Nothing is imported when the rig's nodes would clash with
+        nodes already in the scene.
+
+        :param key: key of the rig
+        :type: str
+
+        :param node_lists: the nodes of every component, as stored with the rig
+        :type: list
+
+        :return: whether the rig was restored
+        :type: bool
+        """
+        if not self.snapshots.restore(key, node_lists):
+            return False
+        for comp, comp_lists, record in zip(self.components, node_lists, self.plan):
+            comp.set_node_lists(comp_lists)
+            if record.parent is not None:
+                comp.parent = self.components[record.parent]
+        if self.scene_cache is not None:
+            # Nothing the snapshot made went through the cache
+            self.scene_cache.invalidate()
+        return True
+
+
+    def mirror_components(self, indices):
+        """
+        Builds mirrored components by mirroring the joints of the components they were
+        mirrored from, one command per chain and no placement queries
+
+        :param indices: indices of the mirrored components
+        :type: list
+        """
+        for index in indices:
+            comp = self.components[index]
+            source = self.components[self.mirror_sources[index]]
+            mirrored = mirror_joint_chains(source.chain_roots(), f'{source.side}_',
+                                           f'{comp.side}_')
+            comp.mirror_build(source, mirrored)
+
+
+    def cost_report(self):
+        """
+        Gets the evaluation cost report of the built rig
+
+        :return: node counts by type, connections, DAG depth and cost per component
+                 and for the whole rig
+        :type: dict
+        """
+        return rig_report(self)
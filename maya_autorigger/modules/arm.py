@@ -18,13 +18,19 @@
 # Built-in
 
 # Third party
-import maya.cmds as cmds
 
 # Internal
+from maya_autorigger.utils.backend import cmds
 from maya_autorigger.modules.base_comp import Component
+from maya_autorigger.utils.enums import CHAIN, DEFAULT_LENGTH, JNT_NAME, SUFFIX
+from maya_autorigger.utils.naming import NAMES
+from maya_autorigger.utils.node_table import NodeList
+from maya_autorigger.utils.scene_cache import active_cache
 from maya_autorigger.utils.maya_utils import (create_locator_chain,
                                               create_joints_from_locators,
-                                              create_arm_blend_chain)
+                                              create_arm_blend_chain,
+                                              create_controls,
+                                              query_world_positions)
 
 #----------------------------------------------------------------------------------------#
 #--------------------------------------------------------------------------- FUNCTIONS --#
@@ -36,7 +42,16 @@ class Arm(Component):
     """
     Base class for a rig component
     """
-    def __init__(self, name, side, start_pos, num_joints, length, axis):
+    __slots__ = ()
+
+    default_length = DEFAULT_LENGTH.Arm
+
+    blend_jnts = NodeList('blend_jnts')
+    fk_jnts = NodeList('fk_jnts')
+    ik_jnts = NodeList('ik_jnts')
+    joint_chains = ('blend_jnts', 'ik_jnts', 'fk_jnts')
+
+    def __init__(self, name, side, start_pos, num_joints, length, axis, node_table=None):
         """
         :param name: Name of this component
         :type: str
@@ -55,11 +70,15 @@ class Arm(Component):
 
         :param axis: Axis to build chain along
         :type: utils.enums.AXIS
+
+        :param node_table: Table holding the names of the component's nodes
+        :type: utils.node_table.NodeTable
         """
-        super().__init__(name, side, start_pos, num_joints, length, axis)
-        self.blend_jnts = None
-        self.fk_jnts = None
-        self.ik_jnts = None
+        super().__init__(name, side, start_pos, num_joints, length, axis,
+                         node_table=node_table)
+        self.blend_jnts = []
+        self.fk_jnts = []
+        self.ik_jnts = []
 
     def create_locators(self):
         """
@@ -77,16 +96,79 @@ class Arm(Component):
         """
         Builds the joints from the locators
         """
-        # Create all joints
-        self.fk_jnts = create_joints_from_locators(self.locators, name_modifier='fk')
-        self.ik_jnts = create_joints_from_locators(self.locators, name_modifier='ik')
-        self.blend_jnts = create_joints_from_locators(self.locators, name_modifier='blend')
+        # Create all joints from a single query of the locators
+        positions = query_world_positions(self.locators)
+        self.fk_jnts = create_joints_from_locators(self.locators, name_modifier=CHAIN.FK,
+                                                   positions=positions)
+        self.ik_jnts = create_joints_from_locators(self.locators, name_modifier=CHAIN.IK,
+                                                   positions=positions)
+        self.blend_jnts = create_joints_from_locators(self.locators,
+                                                      name_modifier=CHAIN.BLEND,
+                                                      positions=positions)
         self.joints = self.blend_jnts
+        self.group_chains()
 
-        create_arm_blend_chain(self.blend_jnts, self.fk_jnts, self.ik_jnts)
+    def mirror_build(self, source, mirrored):
+        """
+        Takes over the chains mirrored from the arm on the other side and groups them
 
+        :param source: the arm that was mirrored
+        :type: Arm
+
+        :param mirrored: the joints of every mirrored chain, see Component.mirror_build
+        :type: list
+        """
+        super().mirror_build(source, mirrored)
+        self.joints = self.blend_jnts
+        self.group_chains()
+
+    def group_chains(self):
+        """
+        Groups the roots of the three chains under the arm group, at the world
+        """
+        arm_grp_name = NAMES.name(self.side, JNT_NAME.ARM, suffix=SUFFIX.GROUP)
+        roots = self.chain_roots()
+        arm_grp = cmds.group(roots, name=arm_grp_name, world=True)
+        cmds.select(clear=True)
+        self.build_nodes = [arm_grp]
+
+        cache = active_cache()
+        if cache is not None:
+            cache.add(arm_grp, position=(0.0, 0.0, 0.0), rotation=(0.0, 0.0, 0.0))
+            cache.set_parent([root for root in roots if root in cache], arm_grp)
 
     def create_ctrls(self):
         """
-        Creates the curve controls for the ar,
-        """
\ No newline at end of file
+        Creates the fk, ik and hand controls of the arm and blends the chains with the
+        switch on the hand control
+        """
+        # Fk controls drive every fk joint but the end
+        fk_cons, fk_grps = create_controls(self.fk_jnts[:-1], shapes='circle', scale=1.5)
+
+        # Ik control carries the handle at the end of the ik chain
+        ik_handle = cmds.ikHandle(solver='ikRPsolver', startJoint=self.ik_jnts[0],
+                                  endEffector=self.ik_jnts[-1])[0]
+        ik_con_name = NAMES.partner(self.ik_jnts[0], suffix=SUFFIX.CONTROL)
+        ik_cons, ik_grps = create_controls(self.ik_jnts[-1:], shapes='diamond',
+                                           constraint=None, names=[ik_con_name])
+        cmds.parent(ik_handle, ik_cons[0])
+
+        # Hand control follows the blend chain and carries the switch
+        blend_end = self.blend_jnts[-1]
+        hand_con_name = NAMES.name(self.side, JNT_NAME.HAND, suffix=SUFFIX.CONTROL)
+        hand_cons, _ = create_controls([blend_end], shapes='cube', constraint=None,
+                                       parent=blend_end, names=[hand_con_name])
+        hand_con = hand_cons[0]
+        cmds.addAttr(hand_con, longName='ikFkSwitch', attributeType='float',
+                     minValue=0, maxValue=1)
+        fk_ik_attr = hand_con + '.ikFkSwitch'
+        cmds.setAttr(fk_ik_attr, edit=True, keyable=True)
+
+        # Each set of controls is shown with its chain
+        blend_nodes = create_arm_blend_chain(self.blend_jnts, self.fk_jnts, self.ik_jnts,
+                                             fk_ik_attr,
+                                             fk_roots=self.fk_jnts[:1] + fk_grps,
+                                             ik_roots=self.ik_jnts[:1] + ik_grps)
+
+        self.controls = fk_cons + ik_cons + [hand_con]
+        self.build_nodes = self.build_nodes + fk_grps + ik_grps + blend_nodes
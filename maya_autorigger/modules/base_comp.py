@@ -20,11 +20,14 @@
 from abc import abstractmethod
 
 # Third party
-import maya.cmds as cmds
 
 # Internal
-from maya_autorigger.utils.enums import SIDE
-from maya_autorigger.utils.maya_utils import multipy_tup
+from maya_autorigger.utils.backend import cmds
+from maya_autorigger.utils.enums import TEMPLATE_KEY
+from maya_autorigger.utils.node_table import NodeList, NodeTable
+from maya_autorigger.utils.placement import direction_vector
+from maya_autorigger.utils.profiler import profiled
+from maya_autorigger.utils.scene_cache import active_cache
 
 
 #----------------------------------------------------------------------------------------#
@@ -35,9 +38,26 @@ from maya_autorigger.utils.maya_utils import multipy_tup
 
 class Component:
     """
-    Base class for a rig component
+    Base class for a rig component. Nodes are kept in a row of a NodeTable, the
+    locators, joints, controls and build_nodes attributes read and write names.
     """
-    def __init__(self, name, side, start_pos, num_joints, length, axis):
+    __slots__ = ('name', 'side', 'start_pos', 'num_joints', 'length', 'parent',
+                 'dir_vector', 'node_table', '_row')
+
+    # Read by the component registry when planning templates
+    default_length = 1.0
+    required_keys = (TEMPLATE_KEY.NUM_COMPS, TEMPLATE_KEY.SIDE, TEMPLATE_KEY.NUM_JOINTS,
+                     TEMPLATE_KEY.AXIS)
+
+    locators = NodeList('locators')
+    joints = NodeList('joints')
+    controls = NodeList('controls')
+    # Top level nodes made by build, deleting them removes the build
+    build_nodes = NodeList('build_nodes')
+    # Node lists holding the joint chains build makes
+    joint_chains = ('joints',)
+
+    def __init__(self, name, side, start_pos, num_joints, length, axis, node_table=None):
         """
         :param name: Name of this component
         :type: str
@@ -56,8 +76,15 @@ class Component:
 
         :param axis: Axis to build chain along
         :type: utils.enums.AXIS
+
+        :param node_table: Table holding the names of the component's nodes, usually the
+                           table of the build the component belongs to, the component
+                           gets a table of its own if not given
+        :type: utils.node_table.NodeTable
         """
         # Class vars
+        self.node_table = node_table if node_table is not None else NodeTable()
+        self._row = self.node_table.new_row()
         self.name = name
         self.side = side
         self.start_pos = start_pos
@@ -70,11 +97,17 @@ class Component:
         self.locators = []
         self.joints = []
         self.controls = []
+        self.build_nodes = []
 
         # Determine directional vector
-        self.dir_vector = axis
-        if self.side == SIDE.R:
-            self.dir_vector = multipy_tup(axis, -1)
+        self.dir_vector = direction_vector(axis, side)
+
+    @property
+    def label(self):
+        """
+        Name of the component with its side, unique within a rig
+        """
+        return f'{self.side}_{self.name}'.rstrip('_')
 
     @abstractmethod
     def create_locators(self):
@@ -90,6 +123,34 @@ class Component:
         """
         raise NotImplementedError("Subclass must implement build method.")
 
+    def mirror_build(self, source, mirrored):
+        """
+        Takes over the joints mirrored from the component on the other side in place of
+        building them
+
+        :param source: the component that was mirrored
+        :type: Component
+
+        :param mirrored: the joints of every mirrored chain in hierarchical order, in
+                         the order of joint_chains, see
+                         utils.maya_utils.mirror_joint_chains
+        :type: list
+        """
+        # The chains are mirrored before anything is put under them, so the copies of
+        # a chain are its joints
+        for chain, joints in zip(self.joint_chains, mirrored):
+            setattr(self, chain, list(joints[:len(getattr(source, chain))]))
+        self.build_nodes = self.chain_roots()
+
+    def chain_roots(self):
+        """
+        Gets the root of every joint chain build made
+
+        :return: the roots
+        :type: list
+        """
+        return [getattr(self, chain)[0] for chain in self.joint_chains]
+
     @abstractmethod
     def create_ctrls(self):
         """
@@ -102,22 +163,61 @@ class Component:
         Get root of chain
         """
         if loc_flag:
-            return self.locators[0]
+            return self.node_table.get_node(self._row, 'locators', 0)
         else:
-            return self.joints[0]
+            return self.node_table.get_node(self._row, 'joints', 0)
 
     def get_end(self, loc_flag):
         """
         Get root of chain
         """
         if loc_flag:
-            return self.locators[-1]
+            return self.node_table.get_node(self._row, 'locators', -1)
         else:
-            return self.joints[-1]
+            return self.node_table.get_node(self._row, 'joints', -1)
+
+    def node_lists(self):
+        """
+        Gets every list of nodes the component keeps
+
+        :return: attribute name, such as joints, to node names
+        :type: dict
+        """
+        return self.node_table.get_row(self._row)
+
+    def set_node_lists(self, node_lists):
+        """
+        Sets lists of nodes the component keeps, as given by node_lists
+
+        :param node_lists: attribute name to node names
+        :type: dict
+        """
+        for column, nodes in node_lists.items():
+            self.node_table.set_nodes(self._row, column, nodes)
+
+    def delete_build(self):
+        """
+        Deletes everything build made so the component can be built again
+        """
+        existing = [node for node in self.build_nodes if cmds.objExists(node)]
+        if existing:
+            cmds.delete(existing)
+            cache = active_cache()
+            if cache is not None:
+                cache.remove(existing)
+        self.build_nodes = []
+        self.joints = []
+        self.controls = []
 
+    @profiled()
     def set_parent(self, parent, loc_flag):
         """
         Sets the parent of the joint
         """
         self.parent = parent
-        cmds.parent(self.get_root(loc_flag=loc_flag), parent.get_end(loc_flag=loc_flag))
\ No newline at end of file
+        root = self.get_root(loc_flag=loc_flag)
+        end = parent.get_end(loc_flag=loc_flag)
+        cmds.parent(root, end)
+        cache = active_cache()
+        if cache is not None and root in cache:
+            cache.set_parent([root], end)
\ No newline at end of file
@@ -18,12 +18,13 @@
 # Built-in
 
 # Third party
-import maya.cmds as cmds
 
 # Internal
 from maya_autorigger.modules.base_comp import Component
+from maya_autorigger.utils.enums import DEFAULT_LENGTH
 from maya_autorigger.utils.maya_utils import (create_locator_chain,
-                                              create_joints_from_locators)
+                                              create_joints_from_locators,
+                                              create_controls)
 
 
 #----------------------------------------------------------------------------------------#
@@ -36,7 +37,11 @@ class Finger(Component):
     """
     Base class for a rig component
     """
-    def __init__(self, name, side, start_pos, num_joints, length, axis):
+    __slots__ = ()
+
+    default_length = DEFAULT_LENGTH.Finger
+
+    def __init__(self, name, side, start_pos, num_joints, length, axis, node_table=None):
         """
         :param name: Name of this component
         :type: str
@@ -55,8 +60,12 @@ class Finger(Component):
 
         :param axis: Axis to build chain along
         :type: utils.enums.AXIS
+
+        :param node_table: Table holding the names of the component's nodes
+        :type: utils.node_table.NodeTable
         """
-        super().__init__(name, side, start_pos, num_joints, length, axis)
+        super().__init__(name, side, start_pos, num_joints, length, axis,
+                         node_table=node_table)
 
     def create_locators(self):
         """
@@ -75,9 +84,20 @@ class Finger(Component):
         Builds the joints from the locators
         """
         self.joints = create_joints_from_locators(self.locators)
+        self.build_nodes = [self.joints[0]]
 
-    def create_ctrls(self):
-        """
-        Creates the curve controls for the finger
+    def create_ctrls(self, shapes='circle', scale=0.5):
         """
+        Creates the curve controls for the finger, one per joint but the tip
 
+        :param shapes: shape of every control, or one shape for all of them
+        :type: str or list
+
+        :param scale: uniform scale of the shapes
+        :type: float
+        """
+        # The controls follow whatever the finger is parented to
+        parent = self.parent.get_end(loc_flag=False) if self.parent else None
+        self.controls, groups = create_controls(self.joints[:-1], shapes=shapes,
+                                                scale=scale, parent=parent)
+        self.build_nodes = self.build_nodes + groups
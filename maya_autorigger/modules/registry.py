@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module maps the module names templates use to the component classes that build
+    them. Classes are registered as import paths and only imported the first time a
+    template asks for them, so importing the rigger does not import every component.
+
+    Other packages add components without touching the rigger by declaring entry points
+    in the maya_autorigger.components group, named after the template module:
+
+    [project.entry-points."maya_autorigger.components"]
+    Spine = "studio_rig.spine:Spine"
+
+    The default length and required template keys of every class are cached the first
+    time they are asked for, or can be given when registering so planning never has to
+    import the class.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from collections import namedtuple
+import importlib
+
+# Third party
+
+# Internal
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def register_component(module, target, default_length=None, required_keys=None):
+    """
+    Registers the class building a template module
+
+    :param module: module name used in templates
+    :type: str
+
+    :param target: the class, or its import path as package.module:Class
+    :type: type or str
+
+    :param default_length: length of the component's chain, read from the class when
+                           first needed if not given
+    :type: float
+
+    :param required_keys: info keys a template must give, read from the class when
+                          first needed if not given
+    :type: tuple
+    """
+    if isinstance(target, str):
+        path = target
+        _CLASSES.pop(module, None)
+    else:
+        path = f'{target.__module__}:{target.__qualname__}'
+        _CLASSES[module] = target
+    required_keys = tuple(required_keys) if required_keys is not None else None
+    _INFOS[module] = ComponentInfo(module, path, default_length, required_keys)
+
+
+def load_entry_points():
+    """
+    Registers the components other packages declare as entry points, once. Components
+    registered in code are kept over entry points of the same name.
+    """
+    global _ENTRY_POINTS_LOADED
+    if _ENTRY_POINTS_LOADED:
+        return
+    _ENTRY_POINTS_LOADED = True
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return
+
+    found = entry_points()
+    if hasattr(found, 'select'):
+        found = found.select(group=ENTRY_POINT_GROUP)
+    else:
+        found = found.get(ENTRY_POINT_GROUP, [])
+    for entry_point in found:
+        if entry_point.name not in _INFOS:
+            register_component(entry_point.name, entry_point.value)
+
+
+def component_info(module):
+    """
+    Gets the registration of a template module with its metadata filled in
+
+    :param module: module name used in templates
+    :type: str
+
+    :return: the registration
+    :type: ComponentInfo
+    """
+    info = _INFOS.get(module)
+    if info is None:
+        load_entry_points()
+        info = _INFOS.get(module)
+        if info is None:
+            raise ValueError(f'No component is registered for module {module}')
+    if info.default_length is None or info.required_keys is None:
+        cls = get_component_class(module)
+        info = info._replace(
+            default_length=(info.default_length if info.default_length is not None
+                            else cls.default_length),
+            required_keys=(info.required_keys if info.required_keys is not None
+                           else tuple(cls.required_keys)))
+        _INFOS[module] = info
+
+    return info
+
+
+def get_component_class(module):
+    """
+    Gets the class building a template module, importing it on first use
+
+    :param module: module name used in templates
+    :type: str
+
+    :return: the class
+    :type: type
+    """
+    cls = _CLASSES.get(module)
+    if cls is None:
+        info = _INFOS.get(module)
+        if info is None:
+            load_entry_points()
+            info = _INFOS.get(module)
+            if info is None:
+                raise ValueError(f'No component is registered for module {module}')
+        module_path, class_name = info.path.split(':')
+        cls = getattr(importlib.import_module(module_path), class_name)
+        _CLASSES[module] = cls
+
+    return cls
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class ComponentInfo(namedtuple('ComponentInfo', ['module', 'path', 'default_length',
+                                                 'required_keys'])):
+    """
+    Registration of a component class, path is package.module:Class
+    """
+    __slots__ = ()
+
+
+ENTRY_POINT_GROUP = 'maya_autorigger.components'
+
+# Module name to registration and to the class once imported
+_INFOS = {}
+_CLASSES = {}
+_ENTRY_POINTS_LOADED = False
+
+register_component('Arm', 'maya_autorigger.modules.arm:Arm')
+register_component('Finger', 'maya_autorigger.modules.finger:Finger')
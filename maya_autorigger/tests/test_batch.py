@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of finding the templates of a batch.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.batch import find_templates
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class FindTemplatesTest(unittest.TestCase):
+    """
+    A folder of xml and compiled templates
+    """
+    def test_compiled_templates_replace_xml(self):
+        with tempfile.TemporaryDirectory() as template_dir:
+            for name in ('arm.xml', 'arm.artc', 'leg.xml', 'spine.artc', 'notes.txt'):
+                open(os.path.join(template_dir, name), 'w').close()
+            self.assertEqual(find_templates(template_dir),
+                             [os.path.join(template_dir, name)
+                              for name in ('arm.artc', 'leg.xml', 'spine.artc')])
+
+
+if __name__ == '__main__':
+    unittest.main()
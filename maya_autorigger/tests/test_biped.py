@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of incremental builds, fingerprints and dirty components, budgets and
+    snapshots, built from the shipped template in the in memory scene.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.biped import Biped, run_steps
+from maya_autorigger.utils.backend import cmds, set_backend
+from maya_autorigger.utils.build_plan import PlanCache
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+from maya_autorigger.utils.rig_cost import EvalBudget
+from maya_autorigger.utils.rig_snapshot import SnapshotStore
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates',
+                        'arm.xml')
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class IncrementalBuildTest(unittest.TestCase):
+    """
+    Builds the arm template, an arm with five fingers parented to its end, then moves
+    locators and builds again
+    """
+    symmetric = False
+
+    def setUp(self):
+        self.cmds = RecordingCmds(MemoryScene())
+        self.previous_backend = set_backend(self.cmds)
+        self.plan_dir = tempfile.TemporaryDirectory()
+        self.biped = Biped(3, TEMPLATE, plan_cache=PlanCache(self.plan_dir.name),
+                           symmetric=self.symmetric)
+        self.biped.create_locators()
+        self.biped.create_joints()
+        self.cmds.reset()
+
+    def tearDown(self):
+        set_backend(self.previous_backend)
+        self.plan_dir.cleanup()
+
+    def move(self, locator):
+        cmds.xform(locator, relative=True, translation=(0.0, 1.0, 0.0))
+        self.cmds.reset()
+
+    def test_unchanged_rebuild(self):
+        self.assertEqual(self.biped.create_joints(), [])
+        # Reading the locators is the only command
+        self.assertEqual(dict(self.cmds.counts()), {'xform': 1})
+
+    def test_moved_parent_dirties_children(self):
+        self.move('L_arm01_LOC')
+        self.assertEqual(self.biped.create_joints(), list(range(len(self.biped.plan))))
+
+    def test_moved_child_dirties_itself(self):
+        self.move('L_finger02_01_LOC')
+        self.assertEqual(self.biped.create_joints(), [2])
+
+    def test_incremental_matches_full_build(self):
+        self.move('L_finger02_01_LOC')
+        self.biped.create_joints()
+        incremental = self.cmds.backend.to_dict()
+        self.biped.create_joints(incremental=False)
+        self.assertEqual(
+            {node['name']: node for node in incremental['nodes']},
+            {node['name']: node for node in self.cmds.backend.to_dict()['nodes']})
+
+    def test_cancelled_build_restores_fingerprints(self):
+        self.move('L_finger02_01_LOC')
+        fingerprints = dict(self.biped.fingerprints)
+        scene = self.cmds.backend.to_dict()
+
+        steps = self.biped.joint_steps(rollback=True)
+        next(steps)
+        steps.close()
+        self.assertEqual(self.biped.fingerprints, fingerprints)
+        self.assertEqual(self.cmds.backend.to_dict(), scene)
+
+        # The moved finger is still rebuilt by the next build
+        self.assertEqual(self.biped.create_joints(), [2])
+
+
+class BudgetTest(unittest.TestCase):
+    """
+    Builds the arm template over a budget of ten nodes
+    """
+    def setUp(self):
+        self.cmds = RecordingCmds(MemoryScene())
+        self.previous_backend = set_backend(self.cmds)
+        self.plan_dir = tempfile.TemporaryDirectory()
+        self.biped = Biped(3, TEMPLATE, plan_cache=PlanCache(self.plan_dir.name),
+                           budget=EvalBudget(nodes=10))
+        self.biped.create_locators()
+
+    def tearDown(self):
+        set_backend(self.previous_backend)
+        self.plan_dir.cleanup()
+
+    def test_rolled_back(self):
+        scene = self.cmds.backend.to_dict()
+        with self.assertRaises(ValueError):
+            run_steps(self.biped.joint_steps(rollback=True))
+        self.assertEqual(self.cmds.backend.to_dict(), scene)
+        self.assertEqual(self.biped.fingerprints, {})
+
+    def test_not_recorded(self):
+        with self.assertRaises(ValueError):
+            self.biped.create_joints()
+        # The rig is left to look at but is built again next time
+        self.biped.budget = None
+        self.assertEqual(self.biped.create_joints(), list(range(len(self.biped.plan))))
+
+
+class SnapshotTest(unittest.TestCase):
+    """
+    Builds the arm template in a new scene after it was stored as a snapshot
+    """
+    def setUp(self):
+        self.cmds = RecordingCmds(MemoryScene())
+        self.previous_backend = set_backend(self.cmds)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = SnapshotStore(self.temp_dir.name, file_type='mayaAscii')
+        self.plan_cache = PlanCache(self.temp_dir.name)
+        self.build()
+        self.built = self.scene()
+        self.cmds.backend = MemoryScene()
+
+    def tearDown(self):
+        set_backend(self.previous_backend)
+        self.temp_dir.cleanup()
+
+    def build(self, before_joints=None):
+        biped = Biped(3, TEMPLATE, plan_cache=self.plan_cache, snapshots=self.store)
+        biped.create_locators()
+        if before_joints:
+            before_joints()
+        self.cmds.reset()
+        biped.create_joints()
+
+    def scene(self):
+        scene = self.cmds.backend.to_dict()
+        return {node['name']: node for node in scene['nodes']}, scene['connections']
+
+    def test_restored(self):
+        self.build()
+        self.assertEqual(self.cmds.counts()['file'], 1)
+        self.assertEqual(self.scene(), self.built)
+
+    def test_clash_builds(self):
+        # A node of the user's with the name of the arm's group
+        self.build(lambda: cmds.group(empty=True, name='L_arm_GRP'))
+        self.assertNotIn('file', self.cmds.counts())
+        self.assertEqual(cmds.listRelatives('L_arm_GRP', children=True), None)
+        # The stored rig is kept for scenes it fits in
+        self.cmds.backend = MemoryScene()
+        self.build()
+        self.assertEqual(self.cmds.counts()['file'], 1)
+
+
+class SymmetricIncrementalBuildTest(IncrementalBuildTest):
+    """
+    The same builds with the left side mirrored to the right, mirrors follow the
+    components they mirror
+    """
+    symmetric = True
+
+    def test_moved_child_dirties_itself(self):
+        self.move('L_finger02_01_LOC')
+        mirror = next(index for index, source in self.biped.mirror_sources.items()
+                      if source == 2)
+        self.assertEqual(self.biped.create_joints(), [2, mirror])
+
+    def test_cancelled_build_restores_fingerprints(self):
+        self.move('L_finger02_01_LOC')
+        mirror = next(index for index, source in self.biped.mirror_sources.items()
+                      if source == 2)
+        fingerprints = dict(self.biped.fingerprints)
+
+        steps = self.biped.joint_steps(rollback=True)
+        next(steps)
+        steps.close()
+        self.assertEqual(self.biped.fingerprints, fingerprints)
+        self.assertEqual(self.biped.create_joints(), [2, mirror])
+
+
+class SymmetricNameClashTest(unittest.TestCase):
+    """
+    Mirrors the arm template into a scene that already has a node named like a
+    mirrored joint
+    """
+    def setUp(self):
+        self.scene = MemoryScene()
+        self.previous_backend = set_backend(self.scene)
+        self.plan_dir = tempfile.TemporaryDirectory()
+        self.biped = Biped(3, TEMPLATE, plan_cache=PlanCache(self.plan_dir.name),
+                           symmetric=True)
+        self.biped.create_locators()
+
+    def tearDown(self):
+        set_backend(self.previous_backend)
+        self.plan_dir.cleanup()
+
+    def test_mirrored_joints_are_tracked(self):
+        # A node of the user's with the name of the right arm's first blend joint
+        cmds.group(empty=True, name='R_arm01_blend_JNT')
+        self.biped.create_joints()
+
+        user_node = self.scene.nodes['R_arm01_blend_JNT']
+        self.assertIsNone(user_node.parent)
+        self.assertEqual(user_node.children, [])
+        self.assertFalse([plug for plug in self.scene.connections.items()
+                          if any(part.startswith('R_arm01_blend_JNT.') for part in plug)])
+
+        arm = next(self.biped.components[index] for index in self.biped.mirror_sources
+                   if self.biped.components[index].label == 'R_arm')
+        for chain in arm.joint_chains:
+            for joint in getattr(arm, chain):
+                self.assertEqual(self.scene.nodes[joint].type, 'joint')
+        self.assertEqual(self.scene.nodes[arm.blend_jnts[0]].parent.name, 'R_arm_GRP')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of planning templates and the plan cache.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.modules.registry import register_component
+from maya_autorigger.benchmarks.synthetic import write_template
+from maya_autorigger.utils.build_plan import PlanCache, load_plan, mirror_plan
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates',
+                        'arm.xml')
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class PlanCacheTest(unittest.TestCase):
+    """
+    Plans the arm template, an arm with five fingers parented to its end
+    """
+    def setUp(self):
+        self.plan_dir = tempfile.TemporaryDirectory()
+        self.cache = PlanCache(self.plan_dir.name)
+
+    def tearDown(self):
+        register_component('Arm', 'maya_autorigger.modules.arm:Arm')
+        self.plan_dir.cleanup()
+
+    def test_cached_plan(self):
+        plan = load_plan(TEMPLATE, cache=self.cache)
+        self.assertEqual(len(os.listdir(self.plan_dir.name)), 1)
+        self.assertEqual(load_plan(TEMPLATE, cache=self.cache), plan)
+
+    def test_registering_again_plans_again(self):
+        load_plan(TEMPLATE, cache=self.cache)
+        register_component('Arm', 'maya_autorigger.modules.arm:Arm', default_length=50.0)
+        plan = load_plan(TEMPLATE, cache=self.cache)
+        with tempfile.TemporaryDirectory() as fresh_dir:
+            self.assertEqual(plan, load_plan(TEMPLATE, cache=PlanCache(fresh_dir)))
+        self.assertEqual(plan[0].length, 50.0)
+        # Fingers start past the end of the longer arm
+        self.assertEqual(plan[1].start_pos[0], 53.0)
+
+
+
+class MirrorPlanTest(unittest.TestCase):
+    """
+    Mirrors synthetic templates of one and of both sides
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = PlanCache(os.path.join(self.temp_dir.name, 'plans'))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def plan(self, **kwargs):
+        template = os.path.join(self.temp_dir.name, 'template.xml')
+        write_template(template, num_comps=2, **kwargs)
+        return load_plan(template, cache=self.cache)
+
+    def test_mirror(self):
+        plan, sources = mirror_plan(self.plan())
+        self.assertEqual(len(plan), 6)
+        self.assertEqual(sources, {3: 0, 4: 1, 5: 2})
+        self.assertEqual([record.parent for record in plan[3:]], [None, 3, 3])
+
+    def test_both_sides_refused(self):
+        with self.assertRaises(ValueError):
+            mirror_plan(self.plan(both_sides=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of compiled templates, reading back the blocks and plans of their xml and
+    reading the xml of a stale compile.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.build_plan import PlanCache, compile_blocks, load_plan
+from maya_autorigger.utils.compiled_template import (CompiledTemplate,
+                                                     compile_template_file,
+                                                     current_template)
+from maya_autorigger.utils.gen_utils import iter_template, read_xml
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
+
+# Blocks without info are numbered by the xml but never compiled
+NOTES_TEMPLATE = '''<?xml version="1.0" ?>
+<root>
+    <notes/>
+    <arm>
+        <info>
+            <module value="Arm"/>
+            <num_comps value="1"/>
+            <num_joints value="3"/>
+            <side value="L"/>
+            <axis value="X"/>
+        </info>
+        <children>
+            <comment/>
+            <fingers>
+                <info>
+                    <module value="Finger"/>
+                    <num_comps value="3"/>
+                    <num_joints value="3"/>
+                    <side value="L"/>
+                    <axis value="X"/>
+                </info>
+            </fingers>
+        </children>
+    </arm>
+</root>
+'''
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class CompiledTemplateTest(unittest.TestCase):
+    """
+    Compiles templates into a temporary folder
+    """
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_xml(self, contents, name='template.xml'):
+        xml_path = os.path.join(self.temp_dir.name, name)
+        with open(xml_path, 'w') as xml_fh:
+            xml_fh.write(contents)
+        return xml_path
+
+    def compile(self, xml_path):
+        compiled_path = compile_template_file(
+            xml_path, os.path.join(self.temp_dir.name, 'compiled.artc'))
+        with CompiledTemplate(compiled_path) as compiled:
+            self.assertEqual(list(compiled), list(iter_template(xml_path)))
+            self.assertEqual(compile_blocks(compiled),
+                             compile_blocks(iter_template(xml_path)))
+        return compiled_path
+
+    def test_round_trip(self):
+        xml_path = os.path.join(TEMPLATE_DIR, 'arm.xml')
+        with CompiledTemplate(self.compile(xml_path)) as compiled:
+            self.assertEqual(compiled.to_dict(), read_xml(xml_path))
+
+    def test_round_trip_blocks_without_info(self):
+        self.compile(self.write_xml(NOTES_TEMPLATE))
+
+    def test_shipped_template_is_current(self):
+        compiled_path = os.path.join(TEMPLATE_DIR, 'arm.artc')
+        self.assertEqual(current_template(compiled_path), compiled_path)
+
+    def test_stale_template_reads_xml(self):
+        xml_path = self.write_xml(NOTES_TEMPLATE)
+        compiled_path = compile_template_file(xml_path)
+        self.assertEqual(current_template(compiled_path), compiled_path)
+
+        self.write_xml(NOTES_TEMPLATE.replace('<num_comps value="3"/>',
+                                              '<num_comps value="5"/>'))
+        self.assertEqual(current_template(compiled_path), xml_path)
+        plan = load_plan(compiled_path, cache=PlanCache(self.temp_dir.name))
+        self.assertEqual(len(plan), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
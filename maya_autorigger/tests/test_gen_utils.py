@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of streaming templates, problems are raised without scene commands so
+    templates can be read off the main thread.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import tempfile
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.gen_utils import iter_template
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.recording_cmds import RecordingCmds
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class IterTemplateTest(unittest.TestCase):
+    """
+    Reads templates that are not there or hold nothing
+    """
+    def setUp(self):
+        self.cmds = RecordingCmds(MemoryScene())
+        self.previous_backend = set_backend(self.cmds)
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        set_backend(self.previous_backend)
+        self.temp_dir.cleanup()
+
+    def test_missing(self):
+        with self.assertRaises(ValueError):
+            list(iter_template(os.path.join(self.temp_dir.name, 'missing.xml')))
+        self.assertEqual(self.cmds.count(), 0)
+
+    def test_empty(self):
+        xml_path = os.path.join(self.temp_dir.name, 'empty.xml')
+        with open(xml_path, 'w') as xml_fh:
+            xml_fh.write('<root><notes/></root>')
+        with self.assertRaises(ValueError):
+            list(iter_template(xml_path))
+        self.assertEqual(self.cmds.count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of the name registry, partners and clearing the shared registry per build.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import os
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.biped import Biped
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.enums import CHAIN, SIDE, SUFFIX
+from maya_autorigger.utils.memory_scene import MemoryScene
+from maya_autorigger.utils.naming import NAMES, NameRegistry
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates',
+                        'arm.xml')
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class NameRegistryTest(unittest.TestCase):
+    """
+    Partners of a blend joint
+    """
+    def setUp(self):
+        self.registry = NameRegistry()
+        self.blend = self.registry.name(SIDE.L, 'arm', index=1, chain=CHAIN.BLEND)
+
+    def test_partner(self):
+        self.assertEqual(self.registry.partner(self.blend, chain=CHAIN.FK),
+                         'L_arm01_fk_JNT')
+        self.assertEqual(self.registry.partner(self.blend, suffix=SUFFIX.CONTROL),
+                         f'L_arm01_{CHAIN.BLEND}_CON')
+        # None is a field value, the chain is dropped
+        self.assertEqual(self.registry.partner(self.blend, chain=None), 'L_arm01_JNT')
+        self.assertEqual(self.registry.partner('R_hand_CON', side=SIDE.L), 'L_hand_CON')
+
+    def test_partners_of_names_made_elsewhere(self):
+        self.assertEqual(self.registry.partner('L_finger01_02_LOC', suffix=SUFFIX.JOINT),
+                         'L_finger01_02_JNT')
+        self.assertIn('L_finger01_02_JNT', self.registry)
+
+
+class SharedRegistryTest(unittest.TestCase):
+    """
+    Builds the arm template again and again
+    """
+    def setUp(self):
+        self.previous_backend = set_backend(MemoryScene())
+
+    def tearDown(self):
+        set_backend(self.previous_backend)
+
+    def test_builds_clear_registry(self):
+        biped = Biped(3, TEMPLATE, transaction=False)
+        sizes = []
+        for num in range(3):
+            # Names of an earlier build of another rig
+            NAMES.name(SIDE.L, f'other{num}')
+            set_backend(MemoryScene())
+            biped.create_locators()
+            biped.create_joints()
+            sizes.append(len(NAMES))
+            self.assertNotIn(f'L_other{num}_JNT', NAMES)
+        self.assertEqual(sizes, sizes[:1] * 3)
+
+    def test_arm_controls(self):
+        scene = MemoryScene()
+        set_backend(scene)
+        biped = Biped(3, TEMPLATE, transaction=False)
+        biped.create_locators()
+        biped.create_joints()
+        # The ik control is named after the start of the ik chain
+        self.assertEqual(biped.components[0].controls,
+                         ['L_arm01_fk_CON', 'L_arm02_fk_CON', 'L_arm01_ik_CON',
+                          'L_hand_CON'])
+        self.assertEqual(scene.nodes['L_arm01_ik_CON'].type, 'transform')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of the columnar node table, setting runs again, compacting and snapshots.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.node_table import NodeTable
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class NodeTableTest(unittest.TestCase):
+    """
+    Two rows with joints and controls
+    """
+    def setUp(self):
+        self.table = NodeTable()
+        self.rows = [self.table.new_row(), self.table.new_row()]
+        for row in self.rows:
+            self.table.set_nodes(row, 'joints', [f'jnt{row}_{i}' for i in range(3)])
+            self.table.set_nodes(row, 'controls', [f'con{row}_{i}' for i in range(2)])
+
+    def test_reassigning_does_not_grow(self):
+        size = len(self.table)
+        for num in range(100):
+            for row in self.rows:
+                names = [f'jnt{row}_{i}_{num}' for i in range(3)]
+                self.table.set_nodes(row, 'joints', names)
+        self.assertEqual(len(self.table), size)
+        self.assertEqual(self.table.get_nodes(1, 'joints'), ['jnt1_0_99', 'jnt1_1_99',
+                                                             'jnt1_2_99'])
+
+    def test_growing_runs_are_compacted(self):
+        for num in range(1, 100):
+            for row in self.rows:
+                old = self.table.get_nodes(row, 'joints')
+                self.table.set_nodes(row, 'joints', old + [f'jnt{row}_{num + 2}'])
+        self.assertLessEqual(len(self.table), 2 * (2 * 102 + 2 * 2))
+        for row in self.rows:
+            self.assertEqual(self.table.get_nodes(row, 'joints'),
+                             [f'jnt{row}_{i}' for i in range(102)])
+            self.assertEqual(self.table.get_nodes(row, 'controls'),
+                             [f'con{row}_{i}' for i in range(2)])
+            self.assertEqual(self.table.get_node(row, 'joints', -1), f'jnt{row}_101')
+
+    def test_restore_undoes_sets(self):
+        snapshot = self.table.snapshot()
+        rows = {row: self.table.get_row(row) for row in self.rows}
+        self.table.set_nodes(0, 'joints', ['other'])
+        self.table.set_nodes(1, 'controls', ['con'] * 50)
+        self.table.new_row()
+        self.table.restore(snapshot)
+        self.assertEqual({row: self.table.get_row(row) for row in self.rows}, rows)
+
+    def test_clear(self):
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+        row = self.table.new_row()
+        self.assertEqual(row, 0)
+        self.assertEqual(self.table.get_nodes(row, 'joints'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    Tests of locator placement, blocks and chains land exactly where multipy_tup and
+    add_tup put them one at a time.
+
+    python -m pytest maya_autorigger/tests
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import unittest
+
+# Third party
+
+# Internal
+from maya_autorigger.utils import placement
+from maya_autorigger.utils.backend import set_backend
+from maya_autorigger.utils.enums import AXIS, SIDE
+from maya_autorigger.utils.maya_utils import (add_tup, chain_positions,
+                                              create_locator_chain, multipy_tup)
+from maya_autorigger.utils.memory_scene import MemoryScene
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class BlockPositionsTest(unittest.TestCase):
+    """
+    Spreads blocks below and above NUMPY_MIN_COMPS
+    """
+    def test_spread(self):
+        start_pos = (4.0, 0.0, 1.5)
+        for num_comps in (1, 5, placement.NUMPY_MIN_COMPS, 1000):
+            expected = [start_pos]
+            for i in range(2, num_comps + 1):
+                step = (-1) ** i * (((i - 2) // 2 + 1) * 2)
+                expected.append(tuple(add_tup(start_pos, multipy_tup(AXIS.Z, step))))
+            self.assertEqual(placement.block_positions(start_pos, AXIS.Z, num_comps),
+                             expected)
+
+
+class LocatorChainTest(unittest.TestCase):
+    """
+    Places a right side chain both ways
+    """
+    def setUp(self):
+        self.scene = MemoryScene()
+        self.previous_backend = set_backend(self.scene)
+
+    def tearDown(self):
+        set_backend(self.previous_backend)
+
+    def test_batched(self):
+        dir_vector = placement.direction_vector(AXIS.X, SIDE.R)
+        expected = chain_positions((-4.0, 0.0, 1.5), dir_vector, 4, 3.0)
+        for batched in (False, True):
+            locators = create_locator_chain(f'arm{batched:d}', SIDE.R, 4, 3.0, dir_vector,
+                                            start_pos=(-4.0, 0.0, 1.5), batched=batched)
+            positions = [tuple(self.scene.xform(loc, query=True, worldSpace=True,
+                                                translation=True)) for loc in locators]
+            self.assertEqual(positions, [tuple(pos) for pos in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module holds the scene backend every rigging module sends its commands to.
+    Modules import cmds from here instead of maya.cmds, so the build can run against
+    Maya or any stand-in with the same commands, such as utils.memory_scene.MemoryScene.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from contextlib import contextmanager
+
+# Third party
+
+# Internal
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def get_backend():
+    """
+    Gets the backend commands are sent to, maya.cmds unless another was set
+
+    :return: the backend
+    :type: module
+    """
+    global _BACKEND
+    if _BACKEND is None:
+        import maya.cmds
+        _BACKEND = maya.cmds
+
+    return _BACKEND
+
+
+def set_backend(backend):
+    """
+    Sets the backend commands are sent to
+
+    :param backend: anything with the maya.cmds commands the builders use, None to go
+                    back to maya.cmds
+    :type: object
+
+    :return: the previous backend
+    :type: object
+    """
+    global _BACKEND
+    previous = _BACKEND
+    _BACKEND = backend
+
+    return previous
+
+
+@contextmanager
+def use_backend(backend):
+    """
+    Sends commands to a backend for the duration of a with block
+
+    :param backend: the backend
+    :type: object
+    """
+    previous = set_backend(backend)
+    try:
+        yield backend
+    finally:
+        set_backend(previous)
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class _CmdsProxy:
+    """
+    Forwards every command to the current backend
+    """
+    def __getattr__(self, command):
+        return getattr(_BACKEND if _BACKEND is not None else get_backend(), command)
+
+
+_BACKEND = None
+
+cmds = _CmdsProxy()
@@ -0,0 +1,468 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module compiles rig templates into flat build plans and caches them on disk.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from collections import namedtuple
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+
+# Third party
+
+# Internal
+from maya_autorigger import __version__
+from maya_autorigger.modules.registry import component_info
+from maya_autorigger.utils.compiled_template import (CompiledTemplate, current_template,
+                                                     is_compiled)
+from maya_autorigger.utils.enums import AXIS, SIDE, TEMPLATE_KEY, DEFAULT_LENGTH
+from maya_autorigger.utils.gen_utils import iter_template, TemplateBlock
+from maya_autorigger.utils.maya_utils import multipy_tup, add_tup
+from maya_autorigger.utils.placement import block_positions, mirror_position
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def plan_component(attributes, distance, parent=None):
+    """
+    Computes the names and positions of the components described by a template info block
+
+    :param attributes: the info block of the template
+    :type: dict
+
+    :param distance: length of the parent component
+    :type: float
+
+    :param parent: index of the parent component in the plan
+    :type: int
+
+    :return: one record per component
+    :type: list
+    """
+    # Get variables for making component
+    module = attributes[TEMPLATE_KEY.MODULE]
+    info = component_info(module)
+    missing = [key for key in info.required_keys if key not in attributes]
+    if missing:
+        raise ValueError(f'The info of {module} is missing {", ".join(missing)}')
+    num_comps = int(attributes[TEMPLATE_KEY.NUM_COMPS])
+    side = attributes[TEMPLATE_KEY.SIDE]
+    num_joints = int(attributes[TEMPLATE_KEY.NUM_JOINTS])
+    axis = getattr(AXIS, attributes[TEMPLATE_KEY.AXIS])
+    length = info.default_length
+
+    # Set the start position based on previous lengths
+    start_pos = (0, 0, 0)
+    if distance != 0:
+        if side == SIDE.R:
+            add = multipy_tup(axis, distance * -1)
+        else:
+            add = multipy_tup(axis, distance)
+        start_pos = add_tup(start_pos, add_tup(add, multipy_tup(axis, DEFAULT_LENGTH.Spacer)))
+
+    # Determine spread axis
+    if axis == AXIS.X:
+        spread_axis = AXIS.Z
+    else:
+        spread_axis = AXIS.X
+
+    # Alternate either side after first component
+    positions = block_positions(start_pos, spread_axis, num_comps)
+
+    records = []
+    # Plan given number of components
+    for i, position in enumerate(positions, start=1):
+        if num_comps == 1:  # Only one component made
+            name = f'{module.lower()}'
+        else:
+            name = f'{module.lower()}{i:02d}_'
+
+        records.append(ComponentPlan(module=module,
+                                     side=side,
+                                     name=name,
+                                     start_pos=position,
+                                     num_joints=num_joints,
+                                     length=length,
+                                     axis=axis,
+                                     parent=parent))
+
+    return records
+
+
+def _plan_block(job):
+    """
+    Plans one block for compile_blocks, a top level function so process pools can run it
+    """
+    return plan_component(*job)
+
+
+def compile_blocks(blocks, workers=None, use_processes=False):
+    """
+    Builds a plan from template blocks. Components of a child block are parented to the
+    first component of the block that holds them.
+
+    Planning every block only needs its info and the module of its parent, so with
+    workers the blocks are planned across a pool. Records are put back in block order,
+    giving the same plan as planning serially.
+
+    :param blocks: the blocks, each after the block holding it
+    :type: iterable of utils.gen_utils.TemplateBlock
+
+    :param workers: number of workers to plan with, plans serially if not given
+    :type: int
+
+    :param use_processes: plan in a process pool instead of a thread pool
+    :type: bool
+
+    :return: one record per component in build order
+    :type: tuple
+    """
+    # Find the distance of every block from its parent's module
+    blocks = list(blocks)
+    modules = {}
+    jobs = []
+    for block in blocks:
+        distance = 0
+        if block.parent is not None:
+            try:
+                distance = component_info(modules[block.parent]).default_length
+            except KeyError:
+                raise ValueError(f'The info of the block holding {block.name} must come '
+                                 f'before its children')
+        modules[block.index] = block.info[TEMPLATE_KEY.MODULE]
+        jobs.append((block.info, distance))
+
+    if workers and workers > 1 and len(jobs) > 1:
+        # Imported here, the pools are slow to import and most builds never use them
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        pool_type = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with pool_type(max_workers=workers) as pool:
+            planned = list(pool.map(_plan_block, jobs, chunksize=chunksize))
+    else:
+        planned = [_plan_block(job) for job in jobs]
+
+    # Link every block to the first component of its parent block
+    plan = []
+    first_index = {}
+    for block, records in zip(blocks, planned):
+        first_index[block.index] = len(plan)
+        if block.parent is None:
+            plan.extend(records)
+        else:
+            parent = first_index[block.parent]
+            plan.extend(record._replace(parent=parent) for record in records)
+
+    return tuple(plan)
+
+
+def compile_template(template_dict):
+    """
+    Flattens a template read with gen_utils.read_xml into a build plan
+
+    :param template_dict: the template
+    :type: dict
+
+    :return: one record per component in build order
+    :type: tuple
+    """
+    return compile_blocks(_iter_dict_blocks(template_dict, None, itertools.count()))
+
+
+def _iter_dict_blocks(levels, parent, counter):
+    """
+    Yields the blocks of a template dictionary in document order
+
+    :param levels: block name to block
+    :type: dict
+
+    :param parent: index of the block holding these blocks
+    :type: int
+
+    :param counter: gives out block indices
+    :type: itertools.count
+    """
+    for name, level in levels.items():
+        index = next(counter)
+        for key, value in level.items():
+            if key == TEMPLATE_KEY.INFO:
+                yield TemplateBlock(index=index, name=name, parent=parent,
+                                    info=dict(value))
+            elif key == TEMPLATE_KEY.CHILDREN:
+                yield from _iter_dict_blocks(value, index, counter)
+
+
+def template_blocks(template_path):
+    """
+    Streams the blocks of an xml or compiled template
+
+    :param template_path: path to the template file
+    :type: str
+
+    :return: generator of utils.gen_utils.TemplateBlock
+    """
+    if is_compiled(template_path):
+        with CompiledTemplate(template_path) as compiled:
+            yield from compiled
+    else:
+        yield from iter_template(template_path)
+
+
+def template_key(template_path):
+    """
+    Gets the cache key of a template, from its contents and the package version. A
+    compiled template is keyed by the source hash in its header and is not read. The
+    registrations of the modules it uses are checked by the cache, see components_key.
+
+    :param template_path: path to the template file
+    :type: str
+
+    :return: the key
+    :type: str
+    """
+    sha = hashlib.sha1(__version__.encode('utf-8'))
+    if is_compiled(template_path):
+        with CompiledTemplate(template_path) as compiled:
+            sha.update(b'compiled')
+            sha.update(compiled.source_hash)
+    else:
+        with open(template_path, 'rb') as template_fh:
+            sha.update(template_fh.read())
+
+    return sha.hexdigest()
+
+
+def components_key(modules):
+    """
+    Gets the key of the registrations of the modules a plan uses, their class path,
+    default length and required keys, so plans are planned again when a module is
+    registered differently
+
+    :param modules: module names used in the plan
+    :type: iterable
+
+    :return: the key
+    :type: str
+    """
+    infos = [list(component_info(module)) for module in sorted(set(modules))]
+    return hashlib.sha1(json.dumps(infos).encode('utf-8')).hexdigest()
+
+
+def load_plan(template_path, cache=None, workers=None):
+    """
+    Gets the build plan of a template, compiling it only if it is not cached
+
+    :param template_path: path to the xml or compiled template file
+    :type: str
+
+    :param cache: the cache to use, the default cache if not given
+    :type: PlanCache
+
+    :param workers: number of threads to plan with when the plan is not cached
+    :type: int
+
+    :return: one record per component in build order
+    :type: tuple
+    """
+    if not os.path.isfile(template_path):
+        # Let the reader raise the problem
+        return compile_blocks(iter_template(template_path))
+
+    # A stale compiled template is read from its xml instead
+    template_path = current_template(template_path)
+    cache = cache or get_default_cache()
+    key = template_key(template_path)
+    plan = cache.get(key)
+    if plan is None:
+        plan = compile_blocks(template_blocks(template_path), workers=workers)
+        if plan:
+            cache.put(key, plan)
+
+    return plan
+
+
+def mirror_plan(plan, source_side=SIDE.L, target_side=SIDE.R):
+    """
+    Adds a mirrored record for every record on one side of a plan, placed across the YZ
+    plane and parented to the mirror of its parent. Records on other sides are kept as
+    they are, so a symmetric template only describes the source side. A plan that
+    already has records on the target side is refused, their mirrors would clash.
+
+    :param plan: the plan
+    :type: tuple
+
+    :param source_side: side of the records to mirror
+    :type: utils.enums.SIDE
+
+    :param target_side: side of the mirrored records
+    :type: utils.enums.SIDE
+
+    :return: the plan with the mirrored records after it, and the index of the record
+             every mirrored record was made from
+    :type: tuple
+    """
+    if any(record.side == target_side for record in plan):
+        raise ValueError(f'The template already has {target_side} components, only '
+                         f'templates of the {source_side} side can be mirrored')
+    records = list(plan)
+    sources = {}
+    mirrors = {}
+    for index, record in enumerate(plan):
+        if record.side != source_side:
+            continue
+        mirrors[index] = len(records)
+        sources[len(records)] = index
+        # Parents come before their children so their mirror already exists
+        records.append(record._replace(side=target_side,
+                                       start_pos=mirror_position(record.start_pos),
+                                       parent=mirrors.get(record.parent, record.parent)))
+
+    return tuple(records), sources
+
+
+def get_default_cache():
+    """
+    Gets the cache shared by all builds
+
+    :return: the cache
+    :type: PlanCache
+    """
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = PlanCache()
+
+    return _DEFAULT_CACHE
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class ComponentPlan(namedtuple('ComponentPlan', ['module', 'side', 'name', 'start_pos',
+                                                 'num_joints', 'length', 'axis',
+                                                 'parent'])):
+    """
+    Everything needed to build one component, parent is an index into the plan
+    """
+    __slots__ = ()
+
+
+class PlanCache:
+    """
+    Stores compiled build plans on disk, evicting the least recently used plans
+    """
+    def __init__(self, directory=None, max_entries=64):
+        """
+        :param directory: Folder to store plans in
+        :type: str
+
+        :param max_entries: Number of plans to keep
+        :type: int
+        """
+        self.directory = directory or os.environ.get(
+            'MAYA_AUTORIGGER_PLAN_CACHE',
+            os.path.join(tempfile.gettempdir(), 'maya_autorigger', 'plans'))
+        self.max_entries = max_entries
+
+    def _path(self, key):
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key):
+        """
+        Gets a cached plan
+
+        :param key: the template key
+        :type: str
+
+        :return: the plan or None when it is not cached or its modules have been
+                 registered differently since
+        :type: tuple
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r') as plan_fh:
+                data = json.load(plan_fh)
+            records = data['plan']
+            components = data['components']
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        try:
+            if components != components_key(rec[0] for rec in records):
+                return None
+        except ValueError:
+            # A module that is no longer registered
+            return None
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return tuple(ComponentPlan(module=rec[0], side=rec[1], name=rec[2],
+                                   start_pos=tuple(rec[3]), num_joints=rec[4],
+                                   length=rec[5], axis=tuple(rec[6]), parent=rec[7])
+                     for rec in records)
+
+    def put(self, key, plan):
+        """
+        Stores a plan and evicts old ones if the cache is full
+
+        :param key: the template key
+        :type: str
+
+        :param plan: the plan
+        :type: tuple
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write then rename so concurrent builds never read a partial plan
+            tmp_path = f'{self._path(key)}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as plan_fh:
+                json.dump({'components': components_key(rec.module for rec in plan),
+                           'plan': [list(rec) for rec in plan]}, plan_fh)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Deletes the least recently used plans beyond max_entries
+        """
+        try:
+            paths = [os.path.join(self.directory, name)
+                     for name in os.listdir(self.directory)
+                     if name.endswith('.json')]
+            paths.sort(key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for path in paths[self.max_entries:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """
+        Deletes every cached plan
+        """
+        max_entries = self.max_entries
+        self.max_entries = 0
+        self.evict()
+        self.max_entries = max_entries
+
+
+_DEFAULT_CACHE = None
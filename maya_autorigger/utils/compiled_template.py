@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module compiles xml templates into a packed binary format and reads it back
+    through a memory map. Opening a compiled template only reads its header, blocks are
+    unpacked when they are asked for and strings are decoded once.
+
+    All values are little endian.
+
+    header    magic 'ARTC', version u16, flags u16, blocks u32, info pairs u32,
+              strings u32, sha1 of the source xml 20 bytes
+    blocks    index u32, parent i32 (-1 for none), name u32, first info pair u32,
+              info pairs u32
+    info      key u32, value u32, both string ids
+    strings   offsets u32 * (strings + 1) into the utf-8 blob that follows
+
+    Blocks keep their index and parent as the xml numbers them, counting blocks without
+    info, so they match utils.gen_utils.iter_template. A compiled template next to its
+    xml is only read while the xml still has the hash in its header, see
+    current_template.
+
+    python -m maya_autorigger.utils.compiled_template templates/arm.xml
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.enums import TEMPLATE_KEY
+from maya_autorigger.utils.gen_utils import iter_template, TemplateBlock
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def is_compiled(template_path):
+    """
+    Gets whether a template path is a compiled template
+
+    :param template_path: path to the template
+    :type: str
+
+    :return: whether it is compiled
+    :type: bool
+    """
+    return template_path.lower().endswith(COMPILED_EXT)
+
+
+def source_hash(xml_path):
+    """
+    Gets the sha1 of a template's xml, as stored in the header of its compiled template
+
+    :param xml_path: path to the xml template
+    :type: str
+
+    :return: the digest
+    :type: bytes
+    """
+    with open(xml_path, 'rb') as xml_fh:
+        return hashlib.sha1(xml_fh.read()).digest()
+
+
+def current_template(template_path):
+    """
+    Gets the template to read for a path. A compiled template is swapped for the xml
+    next to it when it was compiled from other contents or by another version, so an
+    edited xml is never built from a stale compile.
+
+    :param template_path: path to the xml or compiled template
+    :type: str
+
+    :return: the path to read
+    :type: str
+    """
+    if not is_compiled(template_path):
+        return template_path
+    xml_path = os.path.splitext(template_path)[0] + SOURCE_EXT
+    if not os.path.isfile(xml_path):
+        return template_path
+    try:
+        with CompiledTemplate(template_path) as compiled:
+            compiled_hash = compiled.source_hash
+    except (OSError, ValueError):
+        return xml_path
+    if compiled_hash != source_hash(xml_path):
+        return xml_path
+
+    return template_path
+
+
+def compile_template_file(xml_path, output_path=None):
+    """
+    Compiles an xml template
+
+    :param xml_path: path to the xml template
+    :type: str
+
+    :param output_path: file to write, next to the xml if not given
+    :type: str
+
+    :return: the compiled template's path
+    :type: str
+    """
+    output_path = output_path or os.path.splitext(xml_path)[0] + COMPILED_EXT
+
+    strings = {}
+
+    def string_id(value):
+        return strings.setdefault(value, len(strings))
+
+    blocks = []
+    pairs = []
+    for block in iter_template(xml_path):
+        parent = -1 if block.parent is None else block.parent
+        blocks.append((block.index, parent, string_id(block.name), len(pairs),
+                       len(block.info)))
+        pairs.extend((string_id(key), string_id(value))
+                     for key, value in block.info.items())
+
+    encoded = [value.encode('utf-8') for value in strings]
+    offsets = [0]
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+
+    data = [_HEADER.pack(MAGIC, VERSION, 0, len(blocks), len(pairs), len(strings),
+                         source_hash(xml_path))]
+    data.extend(_BLOCK.pack(*block) for block in blocks)
+    data.extend(_PAIR.pack(*pair) for pair in pairs)
+    data.append(struct.pack(f'<{len(offsets)}I', *offsets))
+    data.extend(encoded)
+
+    # Write then rename so a build never opens a partial template
+    tmp_path = f'{output_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as compiled_fh:
+        compiled_fh.write(b''.join(data))
+    os.replace(tmp_path, output_path)
+
+    return output_path
+
+
+def main(argv=None):
+    """
+    Command line entry point, compiles every xml template given
+    """
+    parser = argparse.ArgumentParser(description='Compiles xml templates.')
+    parser.add_argument('templates', nargs='+', help='xml templates to compile')
+    args = parser.parse_args(argv)
+
+    for xml_path in args.templates:
+        print(compile_template_file(xml_path))
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class CompiledTemplate:
+    """
+    Memory mapped reader of a compiled template, iterating it gives the same blocks as
+    utils.gen_utils.iter_template gives for the source xml
+    """
+    def __init__(self, path):
+        """
+        :param path: Path to the compiled template
+        :type: str
+        """
+        self.path = path
+        with open(path, 'rb') as compiled_fh:
+            try:
+                self._buffer = mmap.mmap(compiled_fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f'{path} is not a compiled template')
+        if len(self._buffer) < _HEADER.size:
+            self.close()
+            raise ValueError(f'{path} is not a compiled template')
+
+        (magic, version, _, self._num_blocks, num_pairs, self._num_strings,
+         self.source_hash) = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f'{path} is not a version {VERSION} compiled template')
+
+        self._pairs_start = _HEADER.size + self._num_blocks * _BLOCK.size
+        self._offsets_start = self._pairs_start + num_pairs * _PAIR.size
+        self._blob_start = self._offsets_start + (self._num_strings + 1) * 4
+        self._strings = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._num_blocks
+
+    def __iter__(self):
+        for index in range(self._num_blocks):
+            yield self.block(index)
+
+    def _string(self, string_id):
+        value = self._strings.get(string_id)
+        if value is None:
+            start, end = _OFFSETS.unpack_from(self._buffer,
+                                              self._offsets_start + string_id * 4)
+            value = self._buffer[self._blob_start + start:
+                                 self._blob_start + end].decode('utf-8')
+            self._strings[string_id] = value
+        return value
+
+    def block(self, index):
+        """
+        Gets one block
+
+        :param index: position of the block in the compiled template, which only holds
+                      blocks with info
+        :type: int
+
+        :return: the block
+        :type: utils.gen_utils.TemplateBlock
+        """
+        if not 0 <= index < self._num_blocks:
+            raise IndexError(f'{self.path} has no block {index}')
+        record_start = _HEADER.size + index * _BLOCK.size
+        source_index, parent, name_id, first, count = _BLOCK.unpack_from(self._buffer,
+                                                                         record_start)
+        info = {}
+        for offset in range(self._pairs_start + first * _PAIR.size,
+                            self._pairs_start + (first + count) * _PAIR.size, _PAIR.size):
+            key_id, value_id = _PAIR.unpack_from(self._buffer, offset)
+            info[self._string(key_id)] = self._string(value_id)
+
+        return TemplateBlock(index=source_index, name=self._string(name_id),
+                             parent=None if parent < 0 else parent, info=info)
+
+    def to_dict(self):
+        """
+        Gets the template as the nested dictionary utils.gen_utils.read_xml gives
+
+        :return: the template
+        :type: dict
+        """
+        levels = {}
+        template = {}
+        for block in self:
+            level = {TEMPLATE_KEY.INFO: block.info}
+            levels[block.index] = level
+            if block.parent is None:
+                template[block.name] = level
+            else:
+                parent = levels[block.parent]
+                parent.setdefault(TEMPLATE_KEY.CHILDREN, {})[block.name] = level
+
+        return template
+
+    def close(self):
+        """
+        Releases the memory map
+        """
+        self._buffer.close()
+
+
+COMPILED_EXT = '.artc'
+SOURCE_EXT = '.xml'
+MAGIC = b'ARTC'
+VERSION = 2
+_HEADER = struct.Struct('<4sHHIII20s')
+_BLOCK = struct.Struct('<IiIII')
+_PAIR = struct.Struct('<II')
+_OFFSETS = struct.Struct('<II')
+
+
+if __name__ == '__main__':
+    main()
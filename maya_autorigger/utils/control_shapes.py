@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module contains the library of control shapes. Every shape is stored as
+    points already centered on the origin, so a control is made with a single curve
+    command and needs no pivot, freeze or history clean up.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import cmds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def _periodic_knots(num_points, degree):
+    return list(range(-(degree - 1), num_points + degree))
+
+
+def shape_points(shape, scale=1.0):
+    """
+    Gets the points of a shape
+
+    :param shape: name of the shape
+    :type: str
+
+    :param scale: uniform scale of the shape
+    :type: float
+
+    :return: the points
+    :type: list
+    """
+    points = SHAPES[shape]['point']
+    if scale == 1.0:
+        return list(points)
+    return [(x * scale, y * scale, z * scale) for x, y, z in points]
+
+
+def create_control(name, shape='cube', scale=1.0):
+    """
+    Creates a control curve with a single command
+
+    :param name: name of the control
+    :type: str
+
+    :param shape: name of the shape
+    :type: str
+
+    :param scale: uniform scale of the shape
+    :type: float
+
+    :return: the control
+    :type: str
+    """
+    kwargs = dict(SHAPES[shape])
+    kwargs['point'] = shape_points(shape, scale)
+    return cmds.curve(name=name, **kwargs)
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+# Pre-centered points and curve flags of every shape
+SHAPES = {
+    'cube': {'degree': 1,
+             'point': [(-.5, -.5, -.5), (.5, -.5, -.5), (.5, -.5, .5), (-.5, -.5, .5),
+                       (-.5, -.5, -.5), (-.5, .5, -.5), (.5, .5, -.5), (.5, -.5, -.5),
+                       (.5, .5, -.5), (.5, .5, .5), (.5, -.5, .5), (.5, .5, .5),
+                       (-.5, .5, .5), (-.5, -.5, .5), (-.5, .5, .5), (-.5, .5, -.5)]},
+    'diamond': {'degree': 1,
+                'point': [(0, 0, -1), (0, 1, 0), (0, 0, 1), (0, -1, 0), (0, 0, -1)]},
+    # Same cvs as an 8 section circle facing x with radius 1
+    'circle': {'degree': 3,
+               'periodic': True,
+               'point': [(0, 0.783612, -0.783612), (0, 0, -1.108194),
+                         (0, -0.783612, -0.783612), (0, -1.108194, 0),
+                         (0, -0.783612, 0.783612), (0, 0, 1.108194),
+                         (0, 0.783612, 0.783612), (0, 1.108194, 0),
+                         (0, 0.783612, -0.783612), (0, 0, -1.108194),
+                         (0, -0.783612, -0.783612)],
+               'knot': _periodic_knots(8, 3)},
+}
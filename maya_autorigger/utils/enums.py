@@ -28,6 +28,10 @@ SUFFIX = enum(LOCATOR='LOC',
               CONTROL='CON',
               GROUP='GRP')
 
+CHAIN = enum(FK='fk',
+             IK='ik',
+             BLEND='blend')
+
 SIDE = enum(R='R',
             L='L',
             C='C')
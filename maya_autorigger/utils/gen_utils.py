@@ -17,13 +17,15 @@
 #----------------------------------------------------------------------------- IMPORTS --#
 
 # Built-in
+from collections import namedtuple
 import xml.etree.ElementTree as ElementTree
 import os
 
 # Third party
-import maya.cmds as cmds
 
 # Internal
+from maya_autorigger.utils.backend import cmds
+from maya_autorigger.utils.enums import TEMPLATE_KEY
 
 #----------------------------------------------------------------------------------------#
 #--------------------------------------------------------------------------- FUNCTIONS --#
@@ -75,9 +77,69 @@ def read_xml(xml_path):
 
     return xml_dict
 
+def iter_template(xml_path):
+    """
+    Streams the blocks of a template, yielding each one as soon as its info closes.
+    Elements are freed as they are read so memory stays flat with template size.
+    A block's info must come before its children. Problems are raised rather than
+    warned about, so templates can be read off the main thread.
+
+    :param xml_path: path to the template
+    :type: str
+
+    :return: generator of TemplateBlock
+    """
+    # Does the path exist.
+    if not os.path.isfile(xml_path):
+        raise ValueError(f'{xml_path} is not a valid file')
+
+    # Open elements, whether each is a block and the indices of the open blocks
+    stack = []
+    is_block = []
+    open_blocks = []
+    num_blocks = 0
+    found = False
+
+    for event, elem in ElementTree.iterparse(xml_path, events=('start', 'end')):
+        if event == 'start':
+            # Blocks sit directly under the root or under a children element
+            block = len(stack) == 1 or (len(stack) > 1 and
+                                        stack[-1].tag == TEMPLATE_KEY.CHILDREN)
+            stack.append(elem)
+            is_block.append(block)
+            if block:
+                open_blocks.append(num_blocks)
+                num_blocks += 1
+            continue
+
+        stack.pop()
+        if is_block.pop():
+            open_blocks.pop()
+        elif elem.tag == TEMPLATE_KEY.INFO and stack and is_block[-1]:
+            found = True
+            yield TemplateBlock(index=open_blocks[-1],
+                                name=stack[-1].tag,
+                                parent=open_blocks[-2] if len(open_blocks) > 1 else None,
+                                info={child.tag: child.attrib['value'] for child in elem})
+        # Free the element now that it has been read, info keeps its values until it
+        # closes
+        if stack and stack[-1].tag != TEMPLATE_KEY.INFO:
+            stack[-1].remove(elem)
+            elem.clear()
+
+    if not found:
+        raise ValueError(f'No data found in {xml_path}')
+
 #----------------------------------------------------------------------------------------#
 #----------------------------------------------------------------------------- CLASSES --#
 
+class TemplateBlock(namedtuple('TemplateBlock', ['index', 'name', 'parent', 'info'])):
+    """
+    The info of one template block, parent is the index of the enclosing block
+    """
+    __slots__ = ()
+
+
 class Autovivification(dict):
     """
     This is a Python implementation of Perl's Autovivification feature.
@@ -16,18 +16,57 @@
 #----------------------------------------------------------------------------- IMPORTS --#
 
 # Built-in
-import re
+from contextlib import contextmanager
 
 # Third party
-import maya.cmds as cmds
 
 # Internal
-from maya_autorigger.utils.enums import SUFFIX, JNT_NAME
+from maya_autorigger.utils.backend import cmds
+from maya_autorigger.utils.control_shapes import create_control
+from maya_autorigger.utils.enums import SUFFIX
+from maya_autorigger.utils.naming import NAMES
+from maya_autorigger.utils.profiler import profiled
+from maya_autorigger.utils.scene_cache import active_cache
 
 
 #----------------------------------------------------------------------------------------#
 #--------------------------------------------------------------------------- FUNCTIONS --#
 
+@contextmanager
+def build_transaction(name='autoRiggerBuild', rollback=False):
+    """
+    Runs a build as one undo step with viewport refresh suspended. The user's selection
+    is saved and restored once, and refresh and the undo chunk are restored even when
+    the build fails.
+
+    :param name: name of the undo chunk
+    :type: str
+
+    :param rollback: undo everything the build did when it fails
+    :type: bool
+    """
+    selection = cmds.ls(selection=True) or []
+    cmds.undoInfo(openChunk=True, chunkName=name)
+    cmds.refresh(suspend=True)
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+        if failed and rollback:
+            cmds.undo()
+        selection = [node for node in selection if cmds.objExists(node)]
+        if selection:
+            cmds.select(selection, replace=True)
+        else:
+            cmds.select(clear=True)
+        cmds.refresh()
+
+
 def multipy_tup(tup, scalar):
     return [scalar * t for t in tup]
 
@@ -36,8 +75,39 @@ def add_tup(tup_a, tup_b):
     return [tup_a[i] + tup_b[i] for i in range(3)]
 
 
+def chain_positions(start_pos, dir_vector, num_joints, length):
+    """
+    Computes the world position of every joint in a chain
+
+    :param start_pos: position of first joint
+    :type: tuple
+
+    :param dir_vector: direction to make chain
+    :type: tuple
+
+    :param num_joints: number of joints in chain
+    :type: int
+
+    :param length: length of the chain
+    :type: float
+
+    :return: list of positions in hierarchical order
+    :type: list
+    """
+    if num_joints < 2:
+        return [start_pos] * num_joints
+
+    vector_incr = multipy_tup(dir_vector, length / (num_joints - 1))
+    positions = [start_pos]
+    for _ in range(num_joints - 1):
+        positions.append(add_tup(positions[-1], vector_incr))
+
+    return positions
+
+
+@profiled()
 def create_locator_chain(name, side, num_joints, length, dir_vector=None,
-                         start_pos=(0, 0, 0)):
+                         start_pos=(0, 0, 0), batched=True):
     """
     Creates a chain of locators
 
@@ -59,173 +129,322 @@ def create_locator_chain(name, side, num_joints, length, dir_vector=None,
     :param start_pos: position of first joint
     :type: tuple
 
+    :param batched: create the chain with as few scene commands as possible, otherwise
+                    place and parent every locator one by one
+    :type: bool
+
     :return: list of locators in hierarchical order
     :type: list
     """
-    locators = []
-    # Starting values
-    next_pos = start_pos
-    gap = length / (num_joints - 1)
-    vector_incr = multipy_tup(dir_vector, gap)
-
-    # For each joint that we want, create a locator and increment distance
-    for loc_num in range(1, num_joints + 1):
-        loc_name = f'{side}_{name}{loc_num:02d}_{SUFFIX.LOCATOR}'
-        loc = cmds.spaceLocator(name=loc_name)[0]
-        cmds.xform(loc, worldSpace=True, translation=next_pos)
-        locators.append(loc)
-        if num_joints > 1:
-            next_pos = add_tup(next_pos, vector_incr)
-    # Parent locators down the list
+    loc_names = [NAMES.name(side, name, index=loc_num, suffix=SUFFIX.LOCATOR)
+                 for loc_num in range(1, num_joints + 1)]
+
+    if not batched:
+        positions = chain_positions(start_pos, dir_vector, num_joints, length)
+        locators = []
+        for loc_name, pos in zip(loc_names, positions):
+            loc = cmds.spaceLocator(name=loc_name)[0]
+            cmds.xform(loc, worldSpace=True, translation=pos)
+            locators.append(loc)
+        # Parent locators down the list
+        for loc_num in range(1, len(locators)):
+            cmds.parent(locators[loc_num], locators[loc_num - 1])
+        # Clear selection
+        cmds.select(clear=True)
+        return locators
+
+    locators = [cmds.spaceLocator(name=loc_name)[0] for loc_name in loc_names]
+    # Only the root needs a world position, every child sits at the same offset
+    # from its parent so all of them are moved with one command
+    cmds.xform(locators[0], worldSpace=True, translation=start_pos)
     for loc_num in range(1, len(locators)):
-        cmds.parent(locators[loc_num], locators[loc_num - 1])
+        cmds.parent(locators[loc_num], locators[loc_num - 1], relative=True)
+    if len(locators) > 1:
+        cmds.xform(locators[1:], translation=multipy_tup(dir_vector,
+                                                          length / (num_joints - 1)))
     # Clear selection
     cmds.select(clear=True)
 
     return locators
 
-def create_joints_from_locators(locators, name_modifier=None):
+
+def query_world_positions(nodes):
     """
+    Gets the world position of every node with a single query
+
+    :param nodes: nodes to query
+    :type: list
 
-    :param locators:
+    :return: list of positions in the order of the nodes
+    :type: list
+    """
+    cache = active_cache()
+    if cache is not None:
+        return cache.world_positions(nodes)
+    values = cmds.xform(nodes, query=True, worldSpace=True, translation=True)
+    return [values[i:i + 3] for i in range(0, len(values), 3)]
+
+
+def query_world_rotations(nodes):
+    """
+    Gets the world rotation of every node with a single query
+
+    :param nodes: nodes to query
+    :type: list
+
+    :return: list of rotations in the order of the nodes
+    :type: list
+    """
+    cache = active_cache()
+    if cache is not None:
+        return cache.world_rotations(nodes)
+    values = cmds.xform(nodes, query=True, worldSpace=True, rotation=True)
+    return [values[i:i + 3] for i in range(0, len(values), 3)]
+
+
+def create_joint_chain(names, positions):
+    """
+    Creates a chain of joints placed directly at the given world positions
+
+    :param names: name of each joint
+    :type: list
+
+    :param positions: world position of each joint
     :type: list
 
     :return: list of joints in hierarchical order
+    :type: list
     """
-    joints = []
+    # With the previous joint selected each new joint is created as its child
+    cmds.select(clear=True)
+    joints = [cmds.joint(name=jnt_name, position=pos)
+              for jnt_name, pos in zip(names, positions)]
     cmds.select(clear=True)
-    for i, loc in enumerate(locators):
-        # Get position and name
-        jnt_name = loc.replace(SUFFIX.LOCATOR, SUFFIX.JOINT)
-        if name_modifier:
-            split_name = jnt_name.split('_')
-            start = '_'.join(split_name[:-1])
-            jnt_name = f'{start}_{name_modifier}_{split_name[-1]}'
-        # Create joint at origin and with no parent
-        jnt = cmds.joint(name=jnt_name)
-        if cmds.listRelatives(jnt, parent=True):
-            cmds.parent(jnt, world=True)
-        # Parent to locator, zero out translation and joint orient, unparent
-        cmds.parent(jnt, loc)
-        cmds.xform(jnt, translation=(0, 0, 0))
-        cmds.joint(name=jnt, edit=True, orientation=[0, 0, 0])
-        cmds.parent(jnt, world=True)
-
-        # Add joint to list
-        joints.append(jnt)
-        # Parent this joint to the previous one
-        if i > 0:
-            cmds.parent(joints[i], joints[i - 1])
+
+    cache = active_cache()
+    if cache is not None:
+        # New joints are not oriented, each is a child of the one before
+        for i, (jnt, pos) in enumerate(zip(joints, positions)):
+            cache.add(jnt, parent=joints[i - 1] if i else None, position=pos,
+                      rotation=(0.0, 0.0, 0.0))
 
     return joints
 
-def create_cube_con(name):
+
+@profiled()
+def create_joints_from_locators(locators, name_modifier=None, positions=None):
     """
-    Creates a box curve
+    Creates a chain of joints at the locators
 
-    :param name: The name of the curve
-    :type: str
+    :param locators: locators in hierarchical order
+    :type: list
+
+    :param name_modifier: chain the joints belong to, inserted before the suffix
+    :type: utils.enums.CHAIN
+
+    :param positions: world positions of the locators if they were already queried
+    :type: list
+
+    :return: list of joints in hierarchical order
+    """
+    if positions is None:
+        positions = query_world_positions(locators)
 
-    :return: The curve
+    names = [NAMES.partner(loc, chain=name_modifier, suffix=SUFFIX.JOINT)
+             for loc in locators]
+
+    return create_joint_chain(names, positions)
+
+
+@profiled()
+def mirror_joint_chains(roots, search, replace):
     """
-    box_con = cmds.curve(degree=1, point=[(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1), (0, 0, 0),
-                                     (0, 1, 0), (1, 1, 0), (1, 0, 0), (1, 1, 0),
-                                     (1, 1, 1), (1, 0, 1), (1, 1, 1),
-                                     (0, 1, 1), (0, 0, 1), (0, 1, 1), (0, 1, 0)])
+    Mirrors joint chains across the YZ plane, each with one command that copies every
+    joint under its root
+
+    :param roots: roots of the chains
+    :type: list
+
+    :param search: text to replace in the names of the copies, usually the side prefix
+    :type: str
+
+    :param replace: text to replace it with
+    :type: str
 
-    cmds.CenterPivot()
-    cmds.xform(box_con, translation=(-.5, -.5, -.5))
-    cmds.select(box_con)
-    cmds.FreezeTransformations()
-    cmds.rename(name)
-    cmds.delete(constructionHistory=1)
+    :return: the joints of every copy in hierarchical order, as named by the scene, a
+             copy whose name is taken is renamed
+    :type: list
+    """
+    mirrored = [cmds.mirrorJoint(root, mirrorYZ=True, mirrorBehavior=True,
+                                 searchReplace=(search, replace)) for root in roots]
     cmds.select(clear=True)
 
-    return box_con
-
-def create_con_on_jnt(joint, control):
-    """
-
-    :param control:
-    :param joint: joint to create control for
-    :return:
-    """
-    cmds.parent(control, joint)
-    cmds.xform(control, translation=(0, 0, 0))
-    child = cmds.pickWalk(joint, direction='down')
-    cmds.parent(child, control)
-
-
-def create_arm_blend_chain(blend_jnts, fk_jnts, ik_jnts):
-    """
-
-    :param blend_jnts:
-    :param fk_jnts:
-    :param ik_jnts:
-    :return:
-    """
-    # Create fk controls
-    for jnt in fk_jnts:
-        if jnt != fk_jnts[-1]:
-            con_name = jnt.replace(SUFFIX.JOINT, SUFFIX.CONTROL)
-            control = cmds.circle(nr=(1, 0, 0), c=(0, 0, 0), r=1.5, n=con_name)
-            create_con_on_jnt(jnt, control)
-
-    # Create ik controls
-    ik_root = ik_jnts[0]
-    ik_end = ik_jnts[-1]
-    blend_end = blend_jnts[-1]
-    ik_con_name = ik_root.replace(SUFFIX.JOINT, SUFFIX.CONTROL)
-    ik_handle = cmds.ikHandle(solver='ikRPsolver', startJoint=ik_root, endEffector=ik_end)
-    ik_con = cmds.curve(point=[(0, 0, -1), (0, 1, 0), (0, 0, 1), (0, -1, 0), (0, 0, -1)],
-                        degree=1, name=ik_con_name)
-    print(ik_handle)
-    print(ik_con)
-    cmds.parent(ik_con, ik_handle[0])
-    cmds.xform(ik_con, translation=(0, 0, 0))
-    cmds.parent(ik_con, world=True)
-    cmds.parent(ik_handle[0], ik_con)
-
-    # Create hand control
-    blend_end = blend_jnts[-1]
-    side = blend_end.split('_')[0]
-    hand_con = f'{side}_{JNT_NAME.HAND}_{SUFFIX.CONTROL}'
-    create_cube_con(hand_con)
-    cmds.parent(hand_con, blend_end)
-    cmds.xform(hand_con, translation=(0, 0, 0))
-
-    # Blend them
-    cmds.addAttr(hand_con, longName='ikFkSwitch', attributeType='float',
-                 minValue=0, maxValue=1)
-    fk_ik_attr = hand_con + '.ikFkSwitch'
-    cmds.setAttr(fk_ik_attr, edit=True, keyable=True)
-
-    for blend in blend_jnts[:-1]:
-        # Create blend colors node
-        blend_colors = cmds.createNode('blendColors', name=blend + '_BC')
-        # Connect rotate values from ik and fk joints to blend colors
-        print(blend)
-        fk = blend.replace('blend', 'fk')
-        ik = blend.replace('blend', 'ik')
-        cmds.connectAttr((ik + '.rotate'), (blend_colors + '.color1'), force=True)
-        cmds.connectAttr((fk + '.rotate'), (blend_colors + '.color2'), force=True)
-
-        # Connect blend colors output to the blend joint's rotate
-        cmds.connectAttr((blend_colors + '.output'), (blend + '.rotate'), force=True)
-        # Connect the fk ik switch attribute to the blender
-        cmds.connectAttr(fk_ik_attr, (blend_colors + '.blender'), force=True)
-
-        # Set the visibility
-        reverse = cmds.createNode('reverse', name=hand_con + '_REV')
-        cmds.connectAttr(fk_ik_attr, (reverse + '.inputX'), force=True)
-        cmds.connectAttr((reverse + '.outputX'), (fk + '.visibility'), force=True)
-        cmds.connectAttr(fk_ik_attr, (ik + '.visibility'), force=True)
-
-    arm_grp_name = f'{side}_{JNT_NAME.ARM}_{SUFFIX.GROUP}'
-    cmds.group(blend_jnts[0], ik_jnts[0], fk_jnts[0], n=arm_grp_name)
+    return mirrored
+
+
+@profiled('controls')
+def create_controls(joints, shapes='circle', scale=1.0, constraint='parent', chain=True,
+                    parent=None, names=None):
+    """
+    Creates a control in an offset group for every joint. The joints are queried once,
+    then each control is made with one curve command and its group is placed and
+    oriented with one xform.
+
+    :param joints: joints in hierarchical order
+    :type: list
+
+    :param shapes: shape of every control, or one shape for all of them
+    :type: str or list
+
+    :param scale: uniform scale of the shapes
+    :type: float
+
+    :param constraint: parent, orient or point to constrain each joint to its control,
+                       None to leave the joints free
+    :type: str
+
+    :param chain: parent every offset group under the previous control
+    :type: bool
+
+    :param parent: node to parent the top offset groups under, world if not given
+    :type: str
+
+    :param names: name of every control, named after the joints if not given
+    :type: list
+
+    :return: the controls and the top offset groups, deleting the groups removes the
+             controls
+    :type: tuple
+    """
+    if not joints:
+        return [], []
+    if names is None:
+        names = [NAMES.partner(jnt, suffix=SUFFIX.CONTROL) for jnt in joints]
+    if isinstance(shapes, str):
+        shapes = [shapes] * len(joints)
+    positions = query_world_positions(joints)
+    rotations = query_world_rotations(joints)
+
+    controls = []
+    groups = []
+    for i, (con_name, shape) in enumerate(zip(names, shapes)):
+        control = create_control(con_name, shape=shape, scale=scale)
+        # Grouped at the origin, so moving the group leaves the control zeroed
+        group = cmds.group(control, name=NAMES.partner(con_name, suffix=SUFFIX.GROUP))
+        cmds.xform(group, worldSpace=True, translation=positions[i],
+                   rotation=rotations[i])
+        controls.append(control)
+        groups.append(group)
+
+    if chain:
+        for i in range(1, len(groups)):
+            cmds.parent(groups[i], controls[i - 1])
+    top_groups = groups[:1] if chain else groups
+    if parent and top_groups:
+        cmds.parent(top_groups, parent)
+
+    if constraint:
+        constrain = getattr(cmds, f'{constraint}Constraint')
+        for control, jnt in zip(controls, joints):
+            constrain(control, jnt)
 
     cmds.select(clear=True)
 
+    return controls, top_groups
+
+
+def connect_attrs(connections):
+    """
+    Connects every pair of plugs in one pass, replacing existing connections
+
+    :param connections: source and destination plugs
+    :type: list
+    """
+    for src, dst in connections:
+        cmds.connectAttr(src, dst, force=True)
+
+
+@profiled('blend')
+def create_blend_network(fk_ik_attr, blend_jnts, fk_jnts, ik_jnts, fk_roots=(),
+                         ik_roots=()):
+    """
+    Blends the rotation of every blend joint between its fk and ik joints. The switch
+    drives one blendColors node per joint and one reverse node shared by the whole
+    network, every connection is made in a single pass at the end.
+
+    :param fk_ik_attr: switch plug, 0 follows fk and 1 follows ik
+    :type: str
+
+    :param blend_jnts: joints to drive
+    :type: list
+
+    :param fk_jnts: fk joint of every blend joint
+    :type: list
+
+    :param ik_jnts: ik joint of every blend joint
+    :type: list
+
+    :param fk_roots: nodes shown only while on fk, their children follow
+    :type: list
+
+    :param ik_roots: nodes shown only while on ik, their children follow
+    :type: list
+
+    :return: the nodes created, deleting them removes the network
+    :type: list
+    """
+    switch_node = fk_ik_attr.split('.', 1)[0]
+    reverse = cmds.createNode('reverse', name=switch_node + '_REV', skipSelect=True)
+    connections = [(fk_ik_attr, reverse + '.inputX')]
+    created = [reverse]
+
+    for blend, fk, ik in zip(blend_jnts, fk_jnts, ik_jnts):
+        blend_colors = cmds.createNode('blendColors', name=blend + '_BC', skipSelect=True)
+        created.append(blend_colors)
+        connections += [(ik + '.rotate', blend_colors + '.color1'),
+                        (fk + '.rotate', blend_colors + '.color2'),
+                        (fk_ik_attr, blend_colors + '.blender'),
+                        (blend_colors + '.output', blend + '.rotate')]
+
+    # Visibility is inherited, only the roots need it
+    connections += [(reverse + '.outputX', node + '.visibility') for node in fk_roots]
+    connections += [(fk_ik_attr, node + '.visibility') for node in ik_roots]
+    connect_attrs(connections)
+
+    return created
+
+
+def create_arm_blend_chain(blend_jnts, fk_jnts, ik_jnts, fk_ik_attr, fk_roots=None,
+                           ik_roots=None):
+    """
+    Blends an arm's blend chain between its fk and ik chains, the end joint follows
+    its parent
+
+    :param blend_jnts: blend chain
+    :type: list
+
+    :param fk_jnts: fk chain
+    :type: list
+
+    :param ik_jnts: ik chain
+    :type: list
+
+    :param fk_ik_attr: switch plug, 0 follows fk and 1 follows ik
+    :type: str
+
+    :param fk_roots: nodes shown only while on fk, the fk chain's root if not given
+    :type: list
+
+    :param ik_roots: nodes shown only while on ik, the ik chain's root if not given
+    :type: list
+
+    :return: the nodes created, deleting them removes the blend
+    :type: list
+    """
+    return create_blend_network(fk_ik_attr, blend_jnts[:-1], fk_jnts[:-1], ik_jnts[:-1],
+                                fk_roots=fk_roots or fk_jnts[:1],
+                                ik_roots=ik_roots or ik_jnts[:1])
+
 
 #----------------------------------------------------------------------------------------#
 #----------------------------------------------------------------------------- CLASSES --#
\ No newline at end of file
@@ -0,0 +1,732 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module contains a pure python, in memory DAG that answers the maya.cmds
+    commands the builders use. Transforms only carry translation, which is all the
+    builders set, so world positions are the sum of the translations up the hierarchy.
+
+    from maya_autorigger.utils.backend import use_backend
+    with use_backend(MemoryScene()):
+        biped.create_locators()
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import copy
+import json
+import re
+import sys
+
+# Third party
+
+# Internal
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def _flatten(args):
+    """
+    Flattens node arguments given as strings or lists of strings
+    """
+    nodes = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            nodes.extend(_flatten(arg))
+        elif arg is not None:
+            nodes.append(arg)
+    return nodes
+
+
+def _flag(kwargs, long_name, short_name, default=None):
+    """
+    Gets a flag given by either its long or short name
+    """
+    if long_name in kwargs:
+        return kwargs[long_name]
+    return kwargs.get(short_name, default)
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class SceneNode:
+    """
+    A node in the scene
+    """
+    __slots__ = ('name', 'type', 'shape', 'parent', 'children', 'attrs', 'dag')
+
+    def __init__(self, name, node_type, shape=None, dag=True):
+        """
+        :param name: Name of the node
+        :type: str
+
+        :param node_type: Maya type of the node
+        :type: str
+
+        :param shape: Type of the shape under a transform
+        :type: str
+
+        :param dag: Whether the node lives in the hierarchy
+        :type: bool
+        """
+        self.name = name
+        self.type = node_type
+        self.shape = shape
+        self.parent = None
+        self.children = []
+        self.dag = dag
+        self.attrs = {}
+        if dag:
+            self.attrs.update(translate=[0.0, 0.0, 0.0],
+                              rotate=[0.0, 0.0, 0.0],
+                              scale=[1.0, 1.0, 1.0],
+                              visibility=True)
+
+
+class MemoryScene:
+    """
+    In memory stand-in for maya.cmds
+    """
+    VECTOR_ATTRS = ('translate', 'rotate', 'scale', 'jointOrient', 'color1', 'color2',
+                    'output')
+    CONSTRAINED_ATTRS = {'parentConstraint': ('translate', 'rotate'),
+                         'orientConstraint': ('rotate',),
+                         'pointConstraint': ('translate',)}
+
+    def __init__(self):
+        self.nodes = {}
+        self.connections = {}
+        self.selection = []
+        self.scene_path = None
+        self._undo_chunks = 0
+        self._undo_stack = []
+        self._undo_enabled = True
+
+    #region helpers
+
+    def _node(self, name):
+        try:
+            return self.nodes[name]
+        except KeyError:
+            raise ValueError(f'No object matches name: {name}')
+
+    def _unique_name(self, name):
+        """
+        Gets a free name, numbering it the way Maya does when the name is taken
+        """
+        if name not in self.nodes:
+            return name
+        base = re.sub(r'\d+$', '', name)
+        num = 1
+        while f'{base}{num}' in self.nodes:
+            num += 1
+        return f'{base}{num}'
+
+    def _default_name(self, base):
+        num = 1
+        while f'{base}{num}' in self.nodes:
+            num += 1
+        return f'{base}{num}'
+
+    def _add(self, name, node_type, shape=None, dag=True, parent=None, select=True,
+             base=None):
+        name = self._unique_name(name) if name else self._default_name(base or node_type)
+        node = SceneNode(name, node_type, shape=shape, dag=dag)
+        self.nodes[name] = node
+        if parent:
+            self._reparent(node, self._node(parent))
+        if dag and select:
+            self.selection = [name]
+        return node
+
+    def _reparent(self, node, parent):
+        if node.parent is not None:
+            node.parent.children.remove(node)
+        node.parent = parent
+        if parent is not None:
+            parent.children.append(node)
+
+    def _world(self, node):
+        pos = [0.0, 0.0, 0.0]
+        while node is not None:
+            pos = [pos[i] + node.attrs['translate'][i] for i in range(3)]
+            node = node.parent
+        return pos
+
+    def _set_world(self, node, pos):
+        parent_pos = self._world(node.parent) if node.parent else [0.0, 0.0, 0.0]
+        node.attrs['translate'] = [pos[i] - parent_pos[i] for i in range(3)]
+
+    def _split_plug(self, plug):
+        node_name, attr = plug.split('.', 1)
+        return self._node(node_name), attr
+
+    def _depth(self, node):
+        depth = 0
+        while node.parent is not None:
+            depth += 1
+            node = node.parent
+        return depth
+
+    def _long_name(self, node):
+        if not node.dag:
+            return node.name
+        path = ''
+        while node is not None:
+            path = f'|{node.name}{path}'
+            node = node.parent
+        return path
+
+    def _copy_tree(self, source, name, parent):
+        node = self._add(name or source.name, source.type, shape=source.shape,
+                         dag=source.dag, parent=parent, select=False)
+        node.attrs = copy.deepcopy(source.attrs)
+        for child in list(source.children):
+            self._copy_tree(child, None, node.name)
+        return node
+
+    def _mirror_tree(self, source, parent, axis, search, replace, copies):
+        name = source.name.replace(search, replace) if search else source.name
+        node = self._add(name, 'joint', parent=parent, select=False)
+        node.attrs = {attr: list(value) if isinstance(value, list) else value
+                      for attr, value in source.attrs.items()}
+        if copies:
+            # Under a mirrored parent the local offset mirrors too
+            node.attrs['translate'][axis] *= -1
+        else:
+            pos = self._world(source)
+            pos[axis] *= -1
+            self._set_world(node, pos)
+        copies.append(node.name)
+        # Only joints are mirrored, anything else under them is left behind
+        for child in list(source.children):
+            if child.type == 'joint':
+                self._mirror_tree(child, node.name, axis, search, replace, copies)
+
+    def _constraint(self, node_type, args, kwargs):
+        nodes = _flatten(args) or self.selection
+        targets, driven = nodes[:-1], self._node(nodes[-1])
+        name = _flag(kwargs, 'name', 'n') or f'{driven.name}_{node_type}1'
+        # Constraints live under the node they drive
+        constraint = self._add(name, node_type, parent=driven.name, select=False)
+        for index, target in enumerate(targets):
+            self.connections[f'{constraint.name}.target{index}'] = f'{target}.worldMatrix'
+        for attr in self.CONSTRAINED_ATTRS[node_type]:
+            self.connections[f'{driven.name}.{attr}'] = f'{constraint.name}.{attr}'
+        return [constraint.name]
+
+    #endregion helpers
+
+    #region creation
+
+    def spaceLocator(self, name=None, n=None, position=None, p=None):
+        node = self._add(name or n, 'transform', shape='locator', base='locator')
+        return [node.name]
+
+    def joint(self, *args, **kwargs):
+        name = _flag(kwargs, 'name', 'n')
+        if _flag(kwargs, 'edit', 'e'):
+            node = self._node(name or args[0])
+            orientation = _flag(kwargs, 'orientation', 'o')
+            if orientation is not None:
+                node.attrs['jointOrient'] = list(orientation)
+            position = _flag(kwargs, 'position', 'p')
+            if position is not None:
+                self._set_world(node, position)
+            return None
+        if _flag(kwargs, 'query', 'q'):
+            node = self._node(name or args[0])
+            return self._world(node)
+
+        parent = None
+        if self.selection and self.nodes[self.selection[-1]].type == 'joint':
+            parent = self.selection[-1]
+        node = self._add(name, 'joint', parent=parent)
+        node.attrs['jointOrient'] = [0.0, 0.0, 0.0]
+        position = _flag(kwargs, 'position', 'p')
+        if position is not None:
+            self._set_world(node, position)
+        return node.name
+
+    def curve(self, *args, **kwargs):
+        name = _flag(kwargs, 'name', 'n')
+        node = self._add(name, 'transform', shape='nurbsCurve', base='curve')
+        node.attrs['points'] = [list(pnt) for pnt in _flag(kwargs, 'point', 'p', [])]
+        node.attrs['degree'] = _flag(kwargs, 'degree', 'd', 3)
+        return node.name
+
+    def circle(self, *args, **kwargs):
+        name = _flag(kwargs, 'name', 'n')
+        node = self._add(name, 'transform', shape='nurbsCurve', base='nurbsCircle')
+        node.attrs['radius'] = _flag(kwargs, 'radius', 'r', 1.0)
+        make = self._add(None, 'makeNurbCircle', dag=False)
+        self.connections[f'{node.name}.create'] = f'{make.name}.outputCurve'
+        self.selection = [node.name]
+        return [node.name, make.name]
+
+    def createNode(self, node_type, name=None, n=None, parent=None, p=None,
+                   skipSelect=False, ss=False):
+        dag = node_type in ('transform', 'joint', 'locator', 'nurbsCurve')
+        node = self._add(name or n, node_type, dag=dag, parent=parent or p,
+                         select=not (skipSelect or ss))
+        return node.name
+
+    def group(self, *args, **kwargs):
+        name = _flag(kwargs, 'name', 'n')
+        children = _flatten(args)
+        parent = _flag(kwargs, 'parent', 'p')
+        if not parent and children and not _flag(kwargs, 'world', 'w'):
+            # The group goes where the first child was
+            first_parent = self._node(children[0]).parent
+            parent = first_parent.name if first_parent else None
+        grp = self._add(name, 'transform', parent=parent, base='group')
+        for child in children:
+            self._reparent(self._node(child), grp)
+        self.selection = [grp.name]
+        return grp.name
+
+    def duplicate(self, *args, **kwargs):
+        name = _flag(kwargs, 'name', 'n')
+        copies = []
+        for source_name in _flatten(args) or self.selection:
+            source = self._node(source_name)
+            parent = source.parent.name if source.parent else None
+            copies.append(self._copy_tree(source, name, parent).name)
+            name = None
+        self.selection = copies
+        return copies
+
+    def mirrorJoint(self, *args, **kwargs):
+        source = self._node((_flatten(args) or self.selection)[0])
+        if _flag(kwargs, 'mirrorXY', 'mxy'):
+            axis = 2
+        elif _flag(kwargs, 'mirrorXZ', 'mxz'):
+            axis = 1
+        else:
+            axis = 0
+        search, replace = _flag(kwargs, 'searchReplace', 'sr', ('', ''))
+        parent = source.parent.name if source.parent else None
+        copies = []
+        self._mirror_tree(source, parent, axis, search, replace, copies)
+        self.selection = copies[:1]
+        return copies
+
+    def ikHandle(self, *args, **kwargs):
+        start = self._node(_flag(kwargs, 'startJoint', 'sj'))
+        end = self._node(_flag(kwargs, 'endEffector', 'ee'))
+        effector = self._add(None, 'ikEffector', parent=end.parent.name, select=False,
+                             base='effector')
+        effector.attrs['translate'] = list(end.attrs['translate'])
+        handle = self._add(_flag(kwargs, 'name', 'n'), 'ikHandle')
+        handle.attrs['solver'] = _flag(kwargs, 'solver', 'sol')
+        handle.attrs['startJoint'] = start.name
+        self._set_world(handle, self._world(end))
+        return [handle.name, effector.name]
+
+    def parentConstraint(self, *args, **kwargs):
+        return self._constraint('parentConstraint', args, kwargs)
+
+    def orientConstraint(self, *args, **kwargs):
+        return self._constraint('orientConstraint', args, kwargs)
+
+    def pointConstraint(self, *args, **kwargs):
+        return self._constraint('pointConstraint', args, kwargs)
+
+    #endregion creation
+
+    #region hierarchy
+
+    def parent(self, *args, **kwargs):
+        nodes = _flatten(args)
+        if _flag(kwargs, 'world', 'w'):
+            children, parent = nodes, None
+        else:
+            children, parent = nodes[:-1], self._node(nodes[-1])
+        relative = _flag(kwargs, 'relative', 'r', False)
+
+        for child_name in children:
+            child = self._node(child_name)
+            world = self._world(child)
+            self._reparent(child, parent)
+            if not relative:
+                self._set_world(child, world)
+        self.selection = list(children)
+        return list(children)
+
+    def listRelatives(self, *args, **kwargs):
+        nodes = _flatten(args) or self.selection
+        node_type = _flag(kwargs, 'type', 'typ')
+        relatives = []
+        for name in nodes:
+            node = self._node(name)
+            if _flag(kwargs, 'parent', 'p'):
+                if node.parent is not None:
+                    relatives.append(node.parent)
+            elif _flag(kwargs, 'allDescendents', 'ad'):
+                stack = list(node.children)
+                while stack:
+                    child = stack.pop()
+                    relatives.append(child)
+                    stack.extend(child.children)
+            else:
+                relatives.extend(node.children)
+        names = [rel.name for rel in relatives if not node_type or rel.type == node_type]
+        # Maya returns None instead of an empty list
+        return names or None
+
+    def pickWalk(self, *args, **kwargs):
+        direction = _flag(kwargs, 'direction', 'd', 'down')
+        walked = []
+        for name in _flatten(args) or self.selection:
+            node = self._node(name)
+            if direction == 'down':
+                walked.append(node.children[0].name if node.children else name)
+            elif direction == 'up':
+                walked.append(node.parent.name if node.parent else name)
+        self.selection = walked
+        return walked
+
+    def select(self, *args, **kwargs):
+        if _flag(kwargs, 'clear', 'cl'):
+            self.selection = []
+            return None
+        nodes = _flatten(args)
+        for name in nodes:
+            self._node(name)
+        if _flag(kwargs, 'add', 'add'):
+            self.selection.extend(nodes)
+        else:
+            self.selection = nodes
+        return None
+
+    def rename(self, *args):
+        if len(args) == 1:
+            old, new = self.selection[0], args[0]
+        else:
+            old, new = args
+        node = self.nodes.pop(old)
+        node.name = self._unique_name(new)
+        self.nodes[node.name] = node
+        # Move connections over to the new name
+        for dst, src in list(self.connections.items()):
+            dst_node, dst_attr = dst.split('.', 1)
+            src_node, src_attr = src.split('.', 1)
+            if old in (dst_node, src_node):
+                del self.connections[dst]
+                dst_node = node.name if dst_node == old else dst_node
+                src_node = node.name if src_node == old else src_node
+                self.connections[f'{dst_node}.{dst_attr}'] = f'{src_node}.{src_attr}'
+        self.selection = [node.name if sel == old else sel for sel in self.selection]
+        return node.name
+
+    def delete(self, *args, **kwargs):
+        if _flag(kwargs, 'constructionHistory', 'ch'):
+            return None
+        doomed = set()
+        for name in _flatten(args) or self.selection:
+            if name not in self.nodes:
+                continue
+            stack = [self.nodes[name]]
+            while stack:
+                node = stack.pop()
+                doomed.add(node.name)
+                stack.extend(node.children)
+        for name in doomed:
+            node = self.nodes.pop(name)
+            if node.parent is not None and node.parent.name not in doomed:
+                node.parent.children.remove(node)
+        # History feeding only deleted nodes goes with them, as it does in Maya
+        history = set()
+        for dst, src in list(self.connections.items()):
+            dst_node, src_node = dst.split('.', 1)[0], src.split('.', 1)[0]
+            if dst_node in doomed or src_node in doomed:
+                del self.connections[dst]
+                if dst_node in doomed and src_node not in doomed:
+                    history.add(src_node)
+        for name in history:
+            if not self.nodes[name].dag and not any(
+                    name in (dst.split('.', 1)[0], src.split('.', 1)[0])
+                    for dst, src in self.connections.items()):
+                del self.nodes[name]
+        self.selection = [sel for sel in self.selection if sel not in doomed]
+        return None
+
+    #endregion hierarchy
+
+    #region transforms
+
+    def xform(self, *args, **kwargs):
+        nodes = [self._node(name) for name in (_flatten(args) or self.selection)]
+        world = _flag(kwargs, 'worldSpace', 'ws', False)
+        if _flag(kwargs, 'query', 'q'):
+            values = []
+            for node in nodes:
+                if _flag(kwargs, 'rotation', 'ro'):
+                    values.extend(node.attrs['rotate'])
+                elif world:
+                    values.extend(self._world(node))
+                else:
+                    values.extend(node.attrs['translate'])
+            return values
+
+        # Relative moves add to the current values, nothing here is rotated or scaled so
+        # that is the same in world and object space
+        relative = _flag(kwargs, 'relative', 'r', False)
+        translation = _flag(kwargs, 'translation', 't')
+        if translation is not None:
+            for node in nodes:
+                if relative:
+                    node.attrs['translate'] = [node.attrs['translate'][i] + float(val)
+                                               for i, val in enumerate(translation)]
+                elif world:
+                    self._set_world(node, translation)
+                else:
+                    node.attrs['translate'] = [float(val) for val in translation]
+        rotation = _flag(kwargs, 'rotation', 'ro')
+        if rotation is not None:
+            for node in nodes:
+                if relative:
+                    node.attrs['rotate'] = [node.attrs['rotate'][i] + float(val)
+                                            for i, val in enumerate(rotation)]
+                else:
+                    node.attrs['rotate'] = [float(val) for val in rotation]
+        return None
+
+    def CenterPivot(self, *args):
+        return None
+
+    def FreezeTransformations(self, *args):
+        for name in self.selection:
+            node = self._node(name)
+            offset = node.attrs['translate']
+            if 'points' in node.attrs:
+                node.attrs['points'] = [[pnt[i] + offset[i] for i in range(3)]
+                                        for pnt in node.attrs['points']]
+            node.attrs['translate'] = [0.0, 0.0, 0.0]
+        return None
+
+    #endregion transforms
+
+    #region attributes
+
+    def addAttr(self, *args, **kwargs):
+        node = self._node(_flatten(args)[0] if args else self.selection[0])
+        long_name = _flag(kwargs, 'longName', 'ln')
+        node.attrs[long_name] = _flag(kwargs, 'defaultValue', 'dv',
+                                      _flag(kwargs, 'minValue', 'min', 0))
+        return None
+
+    def setAttr(self, plug, *values, **kwargs):
+        node, attr = self._split_plug(plug)
+        if not values:
+            return None
+        if attr[:-1] in self.VECTOR_ATTRS and attr[-1] in 'XYZ':
+            vector = list(node.attrs.get(attr[:-1], [0.0, 0.0, 0.0]))
+            vector['XYZ'.index(attr[-1])] = values[0]
+            node.attrs[attr[:-1]] = vector
+        elif len(values) > 1:
+            node.attrs[attr] = list(values)
+        else:
+            node.attrs[attr] = values[0]
+        return None
+
+    def getAttr(self, plug, **kwargs):
+        node, attr = self._split_plug(plug)
+        if attr[:-1] in self.VECTOR_ATTRS and attr[-1] in 'XYZ':
+            return node.attrs.get(attr[:-1], [0.0, 0.0, 0.0])['XYZ'.index(attr[-1])]
+        value = node.attrs.get(attr, 0)
+        if isinstance(value, list):
+            return [tuple(value)]
+        return value
+
+    def attributeQuery(self, attr, node=None, n=None, exists=False, ex=False):
+        return attr in self._node(node or n).attrs
+
+    def connectAttr(self, src, dst, force=False, f=False):
+        self._split_plug(src)
+        self._split_plug(dst)
+        if dst in self.connections and not (force or f):
+            raise RuntimeError(f'{dst} is already connected')
+        self.connections[dst] = src
+        return None
+
+    def disconnectAttr(self, src, dst):
+        if self.connections.get(dst) == src:
+            del self.connections[dst]
+        return None
+
+    def listConnections(self, *args, **kwargs):
+        source = _flag(kwargs, 'source', 's', True)
+        destination = _flag(kwargs, 'destination', 'd', True)
+        plugs = _flag(kwargs, 'plugs', 'p', False)
+        found = []
+        for name in _flatten(args):
+            node_name = name.split('.', 1)[0]
+            attr = name.split('.', 1)[1] if '.' in name else None
+            for dst, src in self.connections.items():
+                dst_node, dst_attr = dst.split('.', 1)
+                src_node, src_attr = src.split('.', 1)
+                if source and dst_node == node_name and attr in (None, dst_attr):
+                    found.append(src if plugs else src_node)
+                if destination and src_node == node_name and attr in (None, src_attr):
+                    found.append(dst if plugs else dst_node)
+        return found or None
+
+    #endregion attributes
+
+    #region queries
+
+    def ls(self, *args, **kwargs):
+        if _flag(kwargs, 'selection', 'sl'):
+            return list(self.selection)
+        node_type = _flag(kwargs, 'type', 'typ')
+        names = _flatten(args) or list(self.nodes)
+        names = [name for name in names if name in self.nodes
+                 and (not node_type or self.nodes[name].type == node_type)]
+        if _flag(kwargs, 'long', 'l'):
+            names = [self._long_name(self.nodes[name]) for name in names]
+        if _flag(kwargs, 'showType', 'st'):
+            names = [item for name in names
+                     for item in (name, self.nodes[name.rsplit('|', 1)[-1]].type)]
+        return names
+
+    def objExists(self, name):
+        return name in self.nodes
+
+    def nodeType(self, name):
+        return self._node(name).type
+
+    #endregion queries
+
+    #region session
+
+    def warning(self, msg):
+        sys.stderr.write(f'Warning: {msg}\n')
+
+    def undoInfo(self, *args, **kwargs):
+        # Only whole chunks can be undone, the scene is copied when the outermost opens
+        if 'state' in kwargs or 'st' in kwargs:
+            if _flag(kwargs, 'query', 'q'):
+                return self._undo_enabled
+            self._undo_enabled = bool(_flag(kwargs, 'state', 'st'))
+            self._undo_stack = []
+        elif _flag(kwargs, 'openChunk', 'ock'):
+            if not self._undo_chunks and self._undo_enabled:
+                self._undo_stack.append(copy.deepcopy((self.nodes, self.connections,
+                                                       self.selection)))
+            self._undo_chunks += 1
+        elif _flag(kwargs, 'closeChunk', 'cck'):
+            self._undo_chunks -= 1
+        return None
+
+    def undo(self):
+        if self._undo_stack:
+            self.nodes, self.connections, self.selection = self._undo_stack.pop()
+        return None
+
+    def refresh(self, *args, **kwargs):
+        return None
+
+    def _export_selected(self, path):
+        # Depth first so parents come before their children, in their order
+        nodes = []
+        exported = set()
+        stack = [self._node(name) for name in reversed(self.selection)]
+        while stack:
+            node = stack.pop()
+            if node.name not in exported:
+                exported.add(node.name)
+                nodes.append(node)
+                stack.extend(reversed(node.children))
+        # History feeding the exported nodes goes with them, as it does in Maya
+        found = True
+        while found:
+            found = False
+            for dst, src in self.connections.items():
+                dst_node, src_node = dst.split('.', 1)[0], src.split('.', 1)[0]
+                if (dst_node in exported and src_node not in exported
+                        and not self.nodes[src_node].dag):
+                    exported.add(src_node)
+                    nodes.append(self.nodes[src_node])
+                    found = True
+
+        entries = []
+        for node in nodes:
+            attrs = copy.deepcopy(node.attrs)
+            parent = node.parent.name if node.parent else None
+            if parent not in exported:
+                # Nodes whose parent is not exported keep their world position
+                parent = None
+                if node.dag:
+                    attrs['translate'] = self._world(node)
+            entries.append({'name': node.name, 'type': node.type, 'shape': node.shape,
+                            'dag': node.dag, 'parent': parent, 'attrs': attrs})
+        connections = {dst: src for dst, src in self.connections.items()
+                       if dst.split('.', 1)[0] in exported
+                       and src.split('.', 1)[0] in exported}
+        with open(path, 'w') as scene_fh:
+            json.dump({'nodes': entries, 'connections': connections}, scene_fh)
+        return path
+
+    def _import(self, path):
+        with open(path) as scene_fh:
+            data = json.load(scene_fh)
+        # Imported names that clash are numbered, connections follow the new names
+        names = {}
+        for entry in data['nodes']:
+            node = self._add(entry['name'], entry['type'], shape=entry['shape'],
+                             dag=entry['dag'], parent=names.get(entry['parent']),
+                             select=False)
+            node.attrs = entry['attrs']
+            names[entry['name']] = node.name
+
+        def rename(plug):
+            node_name, attr = plug.split('.', 1)
+            return f'{names[node_name]}.{attr}'
+
+        for dst, src in data['connections'].items():
+            self.connections[rename(dst)] = rename(src)
+        return list(names.values())
+
+    def file(self, *args, **kwargs):
+        if _flag(kwargs, 'new', 'new'):
+            self.__init__()
+            return None
+        elif _flag(kwargs, 'exportSelected', 'es'):
+            return self._export_selected(args[0])
+        elif _flag(kwargs, 'i', 'i'):
+            new_nodes = self._import(args[0])
+            return new_nodes if _flag(kwargs, 'returnNewNodes', 'rnn') else args[0]
+        elif _flag(kwargs, 'rename', 'rn'):
+            self.scene_path = _flag(kwargs, 'rename', 'rn')
+        elif _flag(kwargs, 'save', 's'):
+            with open(self.scene_path, 'w') as scene_fh:
+                json.dump(self.to_dict(), scene_fh, indent=1)
+        return self.scene_path
+
+    def to_dict(self):
+        """
+        Gets the whole scene as plain data, parents listed before their children
+
+        :return: nodes and connections
+        :type: dict
+        """
+        nodes = sorted(self.nodes.values(),
+                       key=lambda node: self._depth(node) if node.dag else 0)
+        return {'nodes': [{'name': node.name,
+                           'type': node.type,
+                           'shape': node.shape,
+                           'parent': node.parent.name if node.parent else None,
+                           'attrs': node.attrs} for node in nodes],
+                'connections': dict(self.connections)}
+
+    #endregion session
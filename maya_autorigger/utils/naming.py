@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module builds node names from structured fields instead of string surgery.
+    Every name is made from a NameRole, interned, and indexed both ways, so the role of
+    a name and the name of a role are single dictionary lookups.
+
+    side _ component index _ chain _ suffix, empty fields are left out
+    L_arm01_fk_JNT, L_finger01_02_CON, L_hand_CON, L_arm_GRP
+
+    blend = NAMES.name(SIDE.L, 'arm', index=1, chain=CHAIN.BLEND)
+    fk = NAMES.partner(blend, chain=CHAIN.FK)
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from collections import namedtuple
+import re
+import sys
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.enums import CHAIN, SUFFIX
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def format_name(role):
+    """
+    Gets the name of a role
+
+    :param role: the role
+    :type: NameRole
+
+    :return: the name
+    :type: str
+    """
+    name = f'{role.side}_{role.component}'
+    if role.index is not None:
+        name += f'{role.index:02d}'
+    if role.chain:
+        name += f'_{role.chain}'
+    return f'{name}_{role.suffix}'
+
+
+def parse_name(name):
+    """
+    Gets the role of a name that was not made by a registry. Fields are read from both
+    ends so a component name holding a suffix or chain token is left whole.
+
+    :param name: the name
+    :type: str
+
+    :return: the role
+    :type: NameRole
+    """
+    side, rest = name.split('_', 1)
+    rest, suffix = rest.rsplit('_', 1)
+    chain = None
+    if '_' in rest:
+        start, last = rest.rsplit('_', 1)
+        if last in _CHAINS:
+            rest, chain = start, last
+    match = _INDEX_RE.match(rest)
+    if match:
+        return NameRole(side, match.group(1), int(match.group(2)), chain, suffix)
+    return NameRole(side, rest, None, chain, suffix)
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class NameRole(namedtuple('NameRole', ['side', 'component', 'index', 'chain', 'suffix'])):
+    """
+    What a node is, index counts from 1 and chain is one of utils.enums.CHAIN
+    """
+    __slots__ = ()
+
+
+class NameRegistry:
+    """
+    Bidirectional index between names and roles
+    """
+    __slots__ = ('_names', '_roles', '_partners')
+    # Default of the fields a partner keeps, None being a field value
+    _KEEP = object()
+
+    def __init__(self):
+        # Role to name and name to role
+        self._names = {}
+        self._roles = {}
+        # Name to the changed fields to partner name
+        self._partners = {}
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._roles
+
+    def name(self, side, component, index=None, chain=None, suffix=SUFFIX.JOINT):
+        """
+        Gets the name of a node from its fields
+
+        :param side: side the node is on
+        :type: utils.enums.SIDE
+
+        :param component: name of the component or part
+        :type: str
+
+        :param index: position of the node in its chain, counting from 1
+        :type: int
+
+        :param chain: chain the node belongs to
+        :type: utils.enums.CHAIN
+
+        :param suffix: type of the node
+        :type: utils.enums.SUFFIX
+
+        :return: the name
+        :type: str
+        """
+        return self.name_of(NameRole(side, component, index, chain, suffix))
+
+    def name_of(self, role):
+        """
+        Gets the name of a role, indexing it the first time
+
+        :param role: the role
+        :type: NameRole
+
+        :return: the name
+        :type: str
+        """
+        name = self._names.get(role)
+        if name is None:
+            name = sys.intern(format_name(role))
+            self._names[role] = name
+            self._roles[name] = role
+        return name
+
+    def role(self, name):
+        """
+        Gets the role of a name, names made elsewhere are parsed once and indexed
+
+        :param name: the name
+        :type: str
+
+        :return: the role
+        :type: NameRole
+        """
+        role = self._roles.get(name)
+        if role is None:
+            role = parse_name(name)
+            name = sys.intern(name)
+            self._roles[name] = role
+            self._names.setdefault(role, name)
+        return role
+
+    def partner(self, name, side=_KEEP, component=_KEEP, index=_KEEP, chain=_KEEP,
+                suffix=_KEEP):
+        """
+        Gets the name of the node sharing a name's role but for the fields given, such
+        as the fk joint of a blend joint or the control of a joint. Fields left out are
+        kept, see name for the fields.
+
+        :param name: the name
+        :type: str
+
+        :return: the partner's name
+        :type: str
+        """
+        # Partners are keyed on the name, then on the fields as given, so a lookup
+        # builds no more than a tuple of the arguments
+        partners = self._partners.get(name)
+        if partners is None:
+            partners = self._partners[name] = {}
+        key = (side, component, index, chain, suffix)
+        partner = partners.get(key)
+        if partner is None:
+            fields = {field: value for field, value in zip(NameRole._fields, key)
+                      if value is not self._KEEP}
+            partner = self.name_of(self.role(name)._replace(**fields))
+            partners[key] = partner
+        return partner
+
+    def clear(self):
+        """
+        Forgets every name
+        """
+        self._names = {}
+        self._roles = {}
+        self._partners = {}
+
+
+_CHAINS = frozenset((CHAIN.FK, CHAIN.IK, CHAIN.BLEND))
+_INDEX_RE = re.compile(r'(.*\D)(\d+)$')
+
+# Registry the builders share, cleared by every build of a biped so it only holds the
+# names of the last one
+NAMES = NameRegistry()
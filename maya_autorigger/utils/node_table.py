@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module stores the nodes of every component of a build in one columnar table.
+    Names sit in one flat list and a handle is a position in it. Every component is a
+    row, and every list of nodes (locators, joints, ...) is a column holding where the
+    row's run of handles starts and stops, in C arrays.
+
+    Setting a run again reuses its place in the list when the names fit or the run is
+    last, otherwise the names are added at the end and the old run is left behind. The
+    list is compacted once more than half of it is left behind, which moves handles.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from array import array
+
+# Third party
+
+# Internal
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class NodeTable:
+    """
+    Columnar table of component nodes, owned by the build its components belong to
+    """
+    __slots__ = ('_names', '_num_rows', '_columns', '_unused')
+
+    def __init__(self):
+        self._names = []
+        self._num_rows = 0
+        # Column name to arrays of run starts and stops
+        self._columns = {}
+        # Number of names no run holds any more
+        self._unused = 0
+
+    def __len__(self):
+        return len(self._names)
+
+    def new_row(self):
+        """
+        Adds a row with every column empty
+
+        :return: the row
+        :type: int
+        """
+        row = self._num_rows
+        self._num_rows += 1
+        for starts, stops in self._columns.values():
+            starts.append(0)
+            stops.append(0)
+        return row
+
+    def _column(self, column):
+        try:
+            return self._columns[column]
+        except KeyError:
+            runs = (array('l', [0]) * self._num_rows, array('l', [0]) * self._num_rows)
+            self._columns[column] = runs
+            return runs
+
+    def set_nodes(self, row, column, names):
+        """
+        Stores the nodes of a row in a column
+
+        :param row: the row
+        :type: int
+
+        :param column: the column, such as locators
+        :type: str
+
+        :param names: the node names
+        :type: list
+        """
+        names = list(names or ())
+        starts, stops = self._column(column)
+        start, stop = starts[row], stops[row]
+        if len(names) <= stop - start:
+            # Fits in the row's run, what is left of it is unused
+            self._names[start:start + len(names)] = names
+            self._unused += stop - start - len(names)
+            stops[row] = start + len(names)
+        elif stop == len(self._names):
+            # Last run, grows in place
+            self._names[start:] = names
+            stops[row] = len(self._names)
+        else:
+            self._unused += stop - start
+            starts[row] = len(self._names)
+            self._names.extend(names)
+            stops[row] = len(self._names)
+            if self._unused * 2 > len(self._names):
+                self.compact()
+
+    def compact(self):
+        """
+        Drops the names no run holds, every run is moved so handles change
+        """
+        names = []
+        for starts, stops in self._columns.values():
+            for row in range(self._num_rows):
+                start = len(names)
+                names.extend(self._names[starts[row]:stops[row]])
+                starts[row] = start
+                stops[row] = len(names)
+        self._names = names
+        self._unused = 0
+
+    def clear(self):
+        """
+        Drops every row and name
+        """
+        self._names = []
+        self._num_rows = 0
+        self._columns = {}
+        self._unused = 0
+
+    def get_nodes(self, row, column):
+        """
+        Gets the nodes of a row in a column
+
+        :param row: the row
+        :type: int
+
+        :param column: the column, such as locators
+        :type: str
+
+        :return: the node names
+        :type: list
+        """
+        starts, stops = self._column(column)
+        return self._names[starts[row]:stops[row]]
+
+    def get_row(self, row):
+        """
+        Gets the nodes of a row in every column that has any
+
+        :param row: the row
+        :type: int
+
+        :return: column to node names
+        :type: dict
+        """
+        return {column: self._names[starts[row]:stops[row]]
+                for column, (starts, stops) in self._columns.items()
+                if stops[row] > starts[row]}
+
+    def get_node(self, row, column, position):
+        """
+        Gets one node of a row in a column without building the list
+
+        :param row: the row
+        :type: int
+
+        :param column: the column, such as locators
+        :type: str
+
+        :param position: position in the list, negative counts from the end
+        :type: int
+
+        :return: the node name
+        :type: str
+        """
+        starts, stops = self._column(column)
+        handle = (stops[row] if position < 0 else starts[row]) + position
+        if not starts[row] <= handle < stops[row]:
+            raise IndexError(f'{column} has no node {position}')
+        return self._names[handle]
+
+    def snapshot(self):
+        """
+        Gets the nodes of every row, restoring it undoes everything set since
+
+        :return: the snapshot
+        :type: tuple
+        """
+        return (self._num_rows, list(self._names), self._unused,
+                {column: (array('l', starts), array('l', stops))
+                 for column, (starts, stops) in self._columns.items()})
+
+    def restore(self, snapshot):
+        """
+        Puts every row back to a snapshot, rows added since are dropped
+
+        :param snapshot: the snapshot
+        :type: tuple
+        """
+        self._num_rows, names, self._unused, columns = snapshot
+        self._names = list(names)
+        self._columns = {column: (array('l', starts), array('l', stops))
+                         for column, (starts, stops) in columns.items()}
+
+    def name(self, handle):
+        """
+        Gets the name of a handle
+
+        :param handle: the handle
+        :type: int
+
+        :return: the node name
+        :type: str
+        """
+        return self._names[handle]
+
+
+class NodeList:
+    """
+    Attribute holding a list of node names in a column of the owner's node table. The
+    owner needs node_table and _row attributes.
+    """
+    __slots__ = ('column',)
+
+    def __init__(self, column):
+        """
+        :param column: Name of the column holding the nodes
+        :type: str
+        """
+        self.column = column
+
+    def __get__(self, owner, owner_type=None):
+        if owner is None:
+            return self
+        return owner.node_table.get_nodes(owner._row, self.column)
+
+    def __set__(self, owner, names):
+        owner.node_table.set_nodes(owner._row, self.column, names)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module computes locator placement for whole blocks of components at once.
+    NumPy is used for large blocks when it is available, and only imported the first
+    time one is placed, plain python is used otherwise. Both give exactly the values
+    multipy_tup and add_tup give, the same operations run in the same order.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.enums import SIDE
+from maya_autorigger.utils.maya_utils import add_tup, multipy_tup
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def get_numpy():
+    """
+    Gets numpy, importing it the first time it is asked for
+
+    :return: the module, None when it is not installed
+    :type: module
+    """
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _NUMPY = numpy
+
+    return _NUMPY or None
+
+
+def direction_vector(axis, side):
+    """
+    Gets the direction a chain is built in, mirrored for the right side
+
+    :param axis: axis to build the chain along
+    :type: utils.enums.AXIS
+
+    :param side: side the chain is on
+    :type: utils.enums.SIDE
+
+    :return: the direction
+    :type: tuple
+    """
+    if side == SIDE.R:
+        return tuple(multipy_tup(axis, -1))
+    return axis
+
+
+def mirror_position(pos):
+    """
+    Mirrors a position across the YZ plane, from one side of the rig to the other
+
+    :param pos: the position
+    :type: tuple
+
+    :return: the mirrored position
+    :type: tuple
+    """
+    return (-pos[0], pos[1], pos[2])
+
+
+def spread_steps(num_comps):
+    """
+    Gets how far each component of a block is spread from the first, alternating sides
+    0, 2, -2, 4, -4, ...
+
+    :param num_comps: number of components in the block
+    :type: int
+
+    :return: one signed step per component
+    :type: list
+    """
+    if num_comps < 2:
+        return [0] * num_comps
+    numpy = get_numpy() if num_comps >= NUMPY_MIN_COMPS else None
+    if numpy is not None:
+        i = numpy.arange(2, num_comps + 1)
+        steps = numpy.where(i % 2 == 0, 1, -1) * (((i - 2) // 2 + 1) * 2)
+        return [0] + steps.tolist()
+    return [0] + [(-1) ** i * (((i - 2) // 2 + 1) * 2) for i in range(2, num_comps + 1)]
+
+
+def block_positions(start_pos, spread_axis, num_comps):
+    """
+    Gets the start position of every component of a block
+
+    :param start_pos: position of the first component
+    :type: tuple
+
+    :param spread_axis: axis the components are spread along
+    :type: utils.enums.AXIS
+
+    :param num_comps: number of components in the block
+    :type: int
+
+    :return: one position per component
+    :type: list
+    """
+    steps = spread_steps(num_comps)
+    numpy = get_numpy() if num_comps >= NUMPY_MIN_COMPS else None
+    if numpy is not None:
+        offsets = numpy.outer(steps[1:], spread_axis)
+        spread = (numpy.asarray(start_pos) + offsets).tolist()
+    else:
+        spread = [add_tup(start_pos, multipy_tup(spread_axis, step)) for step in steps[1:]]
+
+    return [tuple(start_pos)] + [tuple(pos) for pos in spread]
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+# Blocks smaller than this are placed with plain python, numpy's overhead per call is
+# more than it saves on them and small templates never import it
+NUMPY_MIN_COMPS = 64
+
+_NUMPY = None
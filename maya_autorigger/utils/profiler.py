@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module contains an opt in profiler for rig builds. While a build runs inside
+    profile_build every scene command goes through the profiler, which records call
+    counts and wall time per command and per build stage. When no profiler is active
+    commands go straight to the backend and stages cost a single global lookup.
+
+    with profile_build() as profiler:
+        biped.create_locators()
+        biped.create_joints()
+    profiler.write_json('build.json')
+    profiler.write_folded('build.folded')
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from contextlib import contextmanager, nullcontext
+import functools
+import json
+import time
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import get_backend, set_backend
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def stage(name):
+    """
+    Marks a build stage for the duration of a with block
+
+    :param name: name of the stage
+    :type: str
+
+    :return: a context manager
+    """
+    if _ACTIVE is None:
+        return _NULL_STAGE
+    return _ACTIVE.stage(name)
+
+
+def profiled(name=None):
+    """
+    Decorator recording every call of a function as a stage
+
+    :param name: name of the stage, the function name if not given
+    :type: str
+    """
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE is None:
+                return func(*args, **kwargs)
+            with _ACTIVE.stage(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profile_build(profiler=None):
+    """
+    Profiles every scene command sent during a with block
+
+    :param profiler: profiler to record into, a new one if not given
+    :type: BuildProfiler
+
+    :return: the profiler
+    :type: BuildProfiler
+    """
+    global _ACTIVE
+    profiler = profiler or BuildProfiler()
+    profiler.backend = get_backend()
+    previous_backend = set_backend(profiler)
+    previous_profiler = _ACTIVE
+    _ACTIVE = profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE = previous_profiler
+        set_backend(previous_backend)
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class BuildProfiler:
+    """
+    Backend that times every command it forwards
+    """
+    def __init__(self, backend=None):
+        """
+        :param backend: Backend to forward commands to, set by profile_build
+        :type: object
+        """
+        self.backend = backend
+        # Command name to [count, seconds]
+        self.commands = {}
+        # Stack of stage names and commands to [count, seconds]
+        self.frames = {}
+        self._stages = set()
+        self._stack = ()
+
+    def __getattr__(self, command):
+        if command.startswith('__'):
+            raise AttributeError(command)
+        func = getattr(self.backend, command)
+        frames = self.frames
+        totals = self.commands.setdefault(command, [0, 0.0])
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                totals[0] += 1
+                totals[1] += elapsed
+                frame = frames.setdefault(self._stack + (command,), [0, 0.0])
+                frame[0] += 1
+                frame[1] += elapsed
+
+        # Later lookups of this command skip __getattr__
+        setattr(self, command, timed)
+        return timed
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Records the time spent in a stage, stages nest
+
+        :param name: name of the stage
+        :type: str
+        """
+        previous = self._stack
+        self._stack = previous + (name,)
+        self._stages.add(self._stack)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            frame = self.frames.setdefault(self._stack, [0, 0.0])
+            frame[0] += 1
+            frame[1] += time.perf_counter() - start
+            self._stack = previous
+
+    def stage_totals(self):
+        """
+        Gets the totals of every stage, commands counted include nested stages
+
+        :return: stage path joined with ; to count, seconds and commands issued
+        :type: dict
+        """
+        totals = {}
+        for path in sorted(self._stages):
+            count, seconds = self.frames.get(path, [0, 0.0])
+            num_commands = sum(frame[0] for key, frame in self.frames.items()
+                               if key[:len(path)] == path and key not in self._stages)
+            totals[';'.join(path)] = {'count': count,
+                                      'seconds': seconds,
+                                      'commands': num_commands}
+        return totals
+
+    def to_dict(self):
+        """
+        Gets the results as plain data
+
+        :return: totals per command and per stage
+        :type: dict
+        """
+        commands = {command: {'count': count, 'seconds': seconds}
+                    for command, (count, seconds) in sorted(self.commands.items())
+                    if count}
+        return {'commands': commands,
+                'total_commands': sum(entry['count'] for entry in commands.values()),
+                'stages': self.stage_totals()}
+
+    def folded_stacks(self):
+        """
+        Gets the results in the folded stack format flame graph tools read, one line
+        per stack with its own time in microseconds
+
+        :return: the lines
+        :type: list
+        """
+        own = {path: frame[1] for path, frame in self.frames.items()}
+        for path, frame in self.frames.items():
+            if len(path) > 1 and path[:-1] in own:
+                own[path[:-1]] -= frame[1]
+        return [f'{";".join(path)} {max(int(round(seconds * 1e6)), 0)}'
+                for path, seconds in sorted(own.items())]
+
+    def write_json(self, path):
+        """
+        Writes the results as json
+
+        :param path: file to write
+        :type: str
+        """
+        with open(path, 'w') as profile_fh:
+            json.dump(self.to_dict(), profile_fh, indent=2)
+
+    def write_folded(self, path):
+        """
+        Writes the results as folded stacks
+
+        :param path: file to write
+        :type: str
+        """
+        with open(path, 'w') as profile_fh:
+            profile_fh.write('\n'.join(self.folded_stacks()) + '\n')
+
+
+_ACTIVE = None
+_NULL_STAGE = nullcontext()
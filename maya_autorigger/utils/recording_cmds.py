@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module contains a recording stand-in for maya.cmds, used to count the scene
+    commands the builders issue. It wraps another backend, such as
+    utils.memory_scene.MemoryScene, and forwards the commands it records.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from collections import Counter
+import sys
+import types
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.memory_scene import MemoryScene
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def install(stub=None):
+    """
+    Installs a stand-in as maya.cmds so that modules importing maya.cmds get the stub.
+    Must be called before any rigging module is imported.
+
+    :param stub: The stand-in to install, a new RecordingCmds over an empty
+                 MemoryScene if not given
+    :type: RecordingCmds
+
+    :return: The installed stand-in
+    :type: RecordingCmds
+    """
+    stub = stub or RecordingCmds(MemoryScene())
+    maya_module = sys.modules.get('maya')
+    if maya_module is None:
+        maya_module = types.ModuleType('maya')
+        sys.modules['maya'] = maya_module
+    maya_module.cmds = stub
+    sys.modules['maya.cmds'] = stub
+
+    return stub
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class RecordingCmds:
+    """
+    Records every command issued against it and forwards it to a backend
+    """
+    def __init__(self, backend):
+        """
+        :param backend: Backend to forward commands to
+        :type: object
+        """
+        self.backend = backend
+        self.calls = []
+
+    def reset(self):
+        """
+        Forgets all recorded commands
+        """
+        self.calls = []
+
+    def count(self, command=None):
+        """
+        Gets the number of commands issued
+
+        :param command: Only count commands with this name
+        :type: str
+
+        :return: The number of commands
+        :type: int
+        """
+        if command is None:
+            return len(self.calls)
+        return sum(1 for call in self.calls if call[0] == command)
+
+    def counts(self):
+        """
+        Gets the number of commands issued per command name
+
+        :return: Command name to count
+        :type: collections.Counter
+        """
+        return Counter(call[0] for call in self.calls)
+
+    def __getattr__(self, command):
+        if command.startswith('__'):
+            raise AttributeError(command)
+
+        forward = getattr(self.backend, command)
+
+        def _record(*args, **kwargs):
+            self.calls.append((command, args, kwargs))
+            return forward(*args, **kwargs)
+
+        return _record
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module estimates how expensive a built rig is to evaluate. Every component is
+    measured from the nodes its build made, node counts by type, incoming connections
+    and DAG depth, and given a cost in relative units from per type weights. Reports can
+    be checked against a budget to fail builds that are too heavy.
+
+    report = rig_report(biped)
+    enforce_budget(report, EvalBudget(cost=500, depth=12))
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from collections import Counter, namedtuple
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import cmds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def component_nodes(components):
+    """
+    Gets the nodes owned by every component, everything under its build nodes except
+    what other components built under them
+
+    :param components: built components
+    :type: list of modules.base_comp.Component
+
+    :return: one set of node names per component
+    :type: list
+    """
+    roots = [set(comp.build_nodes) for comp in components]
+    trees = []
+    for comp_roots in roots:
+        existing = [node for node in comp_roots if cmds.objExists(node)]
+        descendants = cmds.listRelatives(existing, allDescendents=True) if existing else None
+        trees.append(set(existing) | set(descendants or []))
+
+    owned = []
+    for index, tree in enumerate(trees):
+        nodes = set(tree)
+        for other, other_roots in enumerate(roots):
+            if other != index and other_roots & tree:
+                nodes -= trees[other]
+        owned.append(nodes)
+
+    return owned
+
+
+def measure_nodes(nodes):
+    """
+    Measures a set of nodes with three queries
+
+    :param nodes: the nodes
+    :type: set
+
+    :return: node count, counts by type, incoming connections, DAG depth and cost
+    :type: dict
+    """
+    nodes = sorted(nodes)
+    if not nodes:
+        return {'nodes': 0, 'types': {}, 'connections': 0, 'depth': 0, 'cost': 0.0}
+
+    typed = cmds.ls(nodes, showType=True)
+    types = Counter(typed[1::2])
+    connections = len(cmds.listConnections(nodes, source=True, destination=False) or [])
+    # Long names hold one | per level, nodes outside the DAG have none
+    depths = [name.count('|') for name in cmds.ls(nodes, long=True)]
+
+    cost = (sum(NODE_COSTS.get(node_type, DEFAULT_NODE_COST) * count
+                for node_type, count in types.items())
+            + CONNECTION_COST * connections
+            + DEPTH_COST * sum(depths))
+
+    return {'nodes': len(nodes),
+            'types': dict(sorted(types.items())),
+            'connections': connections,
+            'depth': max(depths),
+            'cost': round(cost, 3)}
+
+
+def rig_report(biped):
+    """
+    Gets the evaluation cost report of a built rig
+
+    :param biped: the rig
+    :type: biped.Biped
+
+    :return: the measurements of every component and of the whole rig
+    :type: dict
+    """
+    components = {}
+    for comp, nodes in zip(biped.components, component_nodes(biped.components)):
+        components[comp.label] = measure_nodes(nodes)
+
+    types = Counter()
+    for measured in components.values():
+        types.update(measured['types'])
+    total = {'nodes': sum(measured['nodes'] for measured in components.values()),
+             'types': dict(sorted(types.items())),
+             'connections': sum(measured['connections'] for measured in components.values()),
+             'depth': max([measured['depth'] for measured in components.values()] or [0]),
+             'cost': round(sum(measured['cost'] for measured in components.values()), 3)}
+
+    return {'components': components, 'total': total}
+
+
+def check_budget(report, budget):
+    """
+    Gets every way a report goes over a budget
+
+    :param report: report from rig_report
+    :type: dict
+
+    :param budget: the budget
+    :type: EvalBudget
+
+    :return: one message per limit exceeded, empty when the rig is within budget
+    :type: list
+    """
+    over = []
+    for field in ('nodes', 'connections', 'depth', 'cost'):
+        limit = getattr(budget, field)
+        if limit is not None and report['total'][field] > limit:
+            over.append(f'rig {field} {report["total"][field]} exceeds {limit}')
+    if budget.component_cost is not None:
+        for label, measured in report['components'].items():
+            if measured['cost'] > budget.component_cost:
+                over.append(f'{label} cost {measured["cost"]} exceeds '
+                            f'{budget.component_cost}')
+
+    return over
+
+
+def enforce_budget(report, budget):
+    """
+    Fails when a report goes over a budget
+
+    :param report: report from rig_report
+    :type: dict
+
+    :param budget: the budget
+    :type: EvalBudget
+    """
+    over = check_budget(report, budget)
+    if over:
+        raise ValueError('Rig is over its evaluation budget: ' + '; '.join(over))
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class EvalBudget(namedtuple('EvalBudget', ['nodes', 'connections', 'depth', 'cost',
+                                           'component_cost'],
+                            defaults=(None, None, None, None, None))):
+    """
+    Limits on a rig's totals and on the cost of each component, None for no limit
+    """
+    __slots__ = ()
+
+
+# Relative evaluation cost of a node of each type
+NODE_COSTS = {'joint': 1.0,
+              'transform': 0.5,
+              'ikHandle': 8.0,
+              'ikEffector': 1.0,
+              'parentConstraint': 3.0,
+              'orientConstraint': 2.0,
+              'pointConstraint': 1.5,
+              'blendColors': 1.0,
+              'reverse': 0.5,
+              'makeNurbCircle': 0.5}
+DEFAULT_NODE_COST = 1.0
+# Cost of propagating one connection and of one level of parent matrix per node
+CONNECTION_COST = 0.1
+DEPTH_COST = 0.05
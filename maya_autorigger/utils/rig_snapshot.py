@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module stores finished rigs on disk so a build of the same template with the
+    same locator positions is restored instead of rebuilt. A snapshot is the rig's nodes
+    exported as one scene file, their hierarchy, transforms and connections with them,
+    and a json file of the nodes every component keeps track of. Restoring imports the
+    scene file with one command. A rig is not restored over nodes with the names it
+    keeps track of, as importing would rename its own nodes away from them.
+
+    Snapshots are keyed by the fingerprints of the components, see Biped.snapshot_key,
+    and the least recently used are evicted.
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+import json
+import os
+import tempfile
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import cmds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class SnapshotStore:
+    """
+    Stores rig snapshots on disk, evicting the least recently used snapshots
+    """
+    def __init__(self, directory=None, max_entries=16, file_type='mayaBinary'):
+        """
+        :param directory: Folder to store snapshots in
+        :type: str
+
+        :param max_entries: Number of snapshots to keep
+        :type: int
+
+        :param file_type: Maya file type the rig's nodes are exported as
+        :type: str
+        """
+        self.directory = directory or os.environ.get(
+            'MAYA_AUTORIGGER_SNAPSHOTS',
+            os.path.join(tempfile.gettempdir(), 'maya_autorigger', 'snapshots'))
+        self.max_entries = max_entries
+        self.file_type = file_type
+
+    def _paths(self, key):
+        ext = '.ma' if self.file_type == 'mayaAscii' else '.mb'
+        return (os.path.join(self.directory, f'{key}{ext}'),
+                os.path.join(self.directory, f'{key}.json'))
+
+    def get(self, key):
+        """
+        Gets a stored snapshot
+
+        :param key: the snapshot key
+        :type: str
+
+        :return: the nodes of every component, None when there is no snapshot
+        :type: list
+        """
+        scene_path, info_path = self._paths(key)
+        try:
+            with open(info_path, 'r') as info_fh:
+                components = json.load(info_fh)
+        except (OSError, ValueError):
+            return None
+        if not os.path.isfile(scene_path):
+            return None
+        # Mark as recently used
+        try:
+            os.utime(info_path)
+        except OSError:
+            pass
+
+        return components
+
+    def restore(self, key, components):
+        """
+        Imports the nodes of a stored snapshot into the scene, unless a node the
+        components keep track of would clash with a node already in it
+
+        :param key: the snapshot key
+        :type: str
+
+        :param components: the nodes of every component, as given by get
+        :type: list
+
+        :return: whether the snapshot was imported
+        :type: bool
+        """
+        names = [name for node_lists in components for nodes in node_lists.values()
+                 for name in nodes]
+        if names and cmds.ls(names):
+            return False
+        cmds.file(self._paths(key)[0], i=True, type=self.file_type, defaultNamespace=True)
+        return True
+
+    def put(self, key, nodes, components):
+        """
+        Exports a rig and evicts old snapshots if the store is full
+
+        :param key: the snapshot key
+        :type: str
+
+        :param nodes: top nodes of the rig, everything under them and their history
+                      is exported
+        :type: list
+
+        :param components: the nodes of every component, column to node names
+        :type: list
+        """
+        scene_path, info_path = self._paths(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            cmds.select(nodes, replace=True)
+            cmds.file(scene_path, exportSelected=True, type=self.file_type, force=True)
+            cmds.select(clear=True)
+            # The info is written last so a partial snapshot is never read
+            tmp_path = f'{info_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as info_fh:
+                json.dump(components, info_fh)
+            os.replace(tmp_path, info_path)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Deletes the least recently used snapshots beyond max_entries
+        """
+        try:
+            info_paths = [os.path.join(self.directory, name)
+                          for name in os.listdir(self.directory)
+                          if name.endswith('.json')]
+            info_paths.sort(key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for info_path in info_paths[self.max_entries:]:
+            key = os.path.splitext(os.path.basename(info_path))[0]
+            for path in (info_path,) + self._paths(key)[:1]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def clear(self):
+        """
+        Deletes every snapshot
+        """
+        max_entries = self.max_entries
+        self.max_entries = 0
+        self.evict()
+        self.max_entries = max_entries
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+#SETMODE 777
+
+#----------------------------------------------------------------------------------------#
+#------------------------------------------------------------------------------ HEADER --#
+
+"""
+:author:
+    Kellyn Mendez
+
+:synopsis:
+    This module contains a write-through cache of the hierarchy and world transforms of
+    the nodes a build makes. The builder writes what it already knows when it creates,
+    moves and parents nodes, and queries only go to the scene for nodes the cache does
+    not know, all of them in one command.
+
+    Only the builder's own edits are seen, anything else that edits the scene during a
+    build must invalidate the nodes it touched.
+
+    with use_scene_cache(cache):
+        biped.create_joints()
+    cache.stats()
+"""
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- IMPORTS --#
+
+# Built-in
+from collections import Counter
+from contextlib import contextmanager
+
+# Third party
+
+# Internal
+from maya_autorigger.utils.backend import cmds
+
+#----------------------------------------------------------------------------------------#
+#--------------------------------------------------------------------------- FUNCTIONS --#
+
+def active_cache():
+    """
+    Gets the active scene cache
+
+    :return: the cache or None when queries go straight to the scene
+    :type: SceneCache
+    """
+    return _ACTIVE
+
+
+@contextmanager
+def use_scene_cache(cache):
+    """
+    Answers scene queries from a cache during a with block
+
+    :param cache: the cache, None to go straight to the scene
+    :type: SceneCache
+    """
+    global _ACTIVE
+    previous = _ACTIVE
+    _ACTIVE = cache
+    try:
+        yield cache
+    finally:
+        _ACTIVE = previous
+
+#----------------------------------------------------------------------------------------#
+#----------------------------------------------------------------------------- CLASSES --#
+
+class SceneCache:
+    """
+    World translations, world rotations and parents of nodes, with hit and miss counts
+    per kind of query
+    """
+    __slots__ = ('_positions', '_rotations', '_parents', '_children', 'hits', 'misses')
+
+    def __init__(self):
+        self._positions = {}
+        self._rotations = {}
+        # Parent of every node whose parent is known, None for the world
+        self._parents = {}
+        self._children = {}
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def __contains__(self, node):
+        return node in self._parents
+
+    #region writes
+
+    def add(self, node, parent=None, position=None, rotation=None):
+        """
+        Records a node the builder made
+
+        :param node: the node
+        :type: str
+
+        :param parent: its parent, None for the world
+        :type: str
+
+        :param position: its world translation if known
+        :type: list
+
+        :param rotation: its world rotation if known
+        :type: list
+        """
+        self.set_parent([node], parent)
+        if position is not None:
+            self._positions[node] = list(position)
+        if rotation is not None:
+            self._rotations[node] = list(rotation)
+
+    def set_parent(self, nodes, parent):
+        """
+        Records nodes being parented, world transforms are kept as cmds.parent keeps them
+
+        :param nodes: the nodes
+        :type: list
+
+        :param parent: the new parent, None for the world
+        :type: str
+        """
+        for node in nodes:
+            previous = self._parents.get(node)
+            if node in self._children.get(previous, ()):
+                self._children[previous].remove(node)
+            self._parents[node] = parent
+            if parent is not None:
+                self._children.setdefault(parent, []).append(node)
+
+    def remove(self, nodes):
+        """
+        Records nodes being deleted along with everything under them. When a node's
+        hierarchy is unknown everything is forgotten, as anything could have been under it.
+
+        :param nodes: the nodes
+        :type: list
+        """
+        if any(node not in self._parents for node in nodes):
+            self.invalidate()
+            return
+        for node in nodes:
+            if node in self._parents:
+                self._forget([node] + self._descendants(node))
+
+    def invalidate(self, nodes=None):
+        """
+        Forgets nodes so they are queried again, for edits the builder did not make
+
+        :param nodes: the nodes, everything if not given
+        :type: list
+        """
+        if nodes is None:
+            self._positions.clear()
+            self._rotations.clear()
+            self._parents.clear()
+            self._children.clear()
+            return
+        for node in nodes:
+            # What is under a node moves with it
+            self._forget([node] + self._descendants(node))
+
+    def _descendants(self, node):
+        descendants = []
+        stack = list(self._children.get(node, ()))
+        while stack:
+            child = stack.pop()
+            descendants.append(child)
+            stack.extend(self._children.get(child, ()))
+        return descendants
+
+    def _forget(self, nodes):
+        for node in nodes:
+            self._positions.pop(node, None)
+            self._rotations.pop(node, None)
+            parent = self._parents.pop(node, None)
+            if parent is not None and node in self._children.get(parent, ()):
+                self._children[parent].remove(node)
+            self._children.pop(node, None)
+
+    #endregion writes
+
+    #region reads
+
+    def _world_values(self, kind, values, nodes, flag):
+        # Every unknown node is queried in the one command
+        missed = [node for node in nodes if node not in values]
+        self.hits[kind] += len(nodes) - len(missed)
+        self.misses[kind] += len(missed)
+        missing = list(dict.fromkeys(missed))
+        if missing:
+            queried = cmds.xform(missing, query=True, worldSpace=True, **{flag: True})
+            for i, node in enumerate(missing):
+                values[node] = list(queried[i * 3:i * 3 + 3])
+        return [list(values[node]) for node in nodes]
+
+    def world_positions(self, nodes):
+        """
+        Gets the world translation of every node, querying the unknown ones at once
+
+        :param nodes: the nodes
+        :type: list
+
+        :return: one position per node
+        :type: list
+        """
+        return self._world_values('positions', self._positions, nodes, 'translation')
+
+    def world_rotations(self, nodes):
+        """
+        Gets the world rotation of every node, querying the unknown ones at once
+
+        :param nodes: the nodes
+        :type: list
+
+        :return: one rotation per node
+        :type: list
+        """
+        return self._world_values('rotations', self._rotations, nodes, 'rotation')
+
+    def stats(self):
+        """
+        Gets the hits and misses of every kind of query
+
+        :return: kind of query to hits and misses
+        :type: dict
+        """
+        return {kind: {'hits': self.hits[kind], 'misses': self.misses[kind]}
+                for kind in sorted(set(self.hits) | set(self.misses))}
+
+    #endregion reads
+
+
+_ACTIVE = None